@@ -0,0 +1,52 @@
+"""Citation metrics: the vectorized analytics stage against networkx's own PageRank and HITS
+
+    python -m benchmarks.bench_analytics [-i cites.json] [-n nodes] [-e edges]
+
+With -i the graph is built from a citation output file; otherwise a random citation graph
+where cases cite earlier ones.
+"""
+import argparse, random, time
+import networkx as nx
+from lib import corpus, grapher, analytics
+
+def sampleGraph(path, nodes, edges):
+    gb = grapher.GraphBuilder([], "", 0, "")
+    G = nx.Graph()
+    if path:
+        for case in corpus.readCases(path):
+            gb.addCase(G, case)
+        return G
+    random.seed(1)
+    per = edges // nodes
+    for i in xrange(nodes):
+        cites = [[1 + j // 100, j % 100] for j in random.sample(xrange(i), min(i, per))]
+        gb.addCase(G, {'number': [1 + i // 100, i % 100], 'name': "CASE %d" % i, 'url': "", 'vol': 1 + i // 100,
+                       'date': "May 1, %d" % (1790 + i // 100), 'citations': cites})
+    return G
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", help="Citation output to build the graph from", default=None)
+    parser.add_argument("-n", "--nodes", help="Synthetic graph nodes without -i", type=int, default=30000)
+    parser.add_argument("-e", "--edges", help="Synthetic graph edges without -i", type=int, default=500000)
+    parser.add_argument("--skipNetworkx", help="Only time the analytics stage", action="store_true")
+    args = parser.parse_args()
+    G = sampleGraph(args.input, args.nodes, args.edges)
+    print "%d nodes, %d edges" % (G.number_of_nodes(), G.number_of_edges())
+    if not args.skipNetworkx:
+        nodes, A = analytics.adjacency(G)
+        D = nx.DiGraph()
+        D.add_nodes_from(nodes)
+        D.add_edges_from((nodes[i], nodes[j]) for i, j in zip(*A.nonzero()))
+        start = time.time()
+        nx.pagerank(D)
+        nx.hits(D)
+        D.in_degree()
+        D.out_degree()
+        print "%-22s %7.2fs" % ("networkx", time.time() - start)
+    start = time.time()
+    analytics.analyze(G)
+    print "%-22s %7.2fs" % ("analytics.analyze", time.time() - start)
+
+if __name__ == "__main__":
+    main()
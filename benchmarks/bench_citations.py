@@ -0,0 +1,56 @@
+"""Throughput of citations.extractCitations against the original findall implementation
+
+    python -m benchmarks.bench_citations [-i cases.jsonl] [-m MB]
+"""
+import argparse, time, regex
+from lib import corpus
+from lib.citation_builders import citations, SCANNER
+from tests import test_cases
+
+def legacyExtract(case):
+    """The extractCitations implementation before the CitationScanner"""
+    x = regex.findall('(?<!Page|P.) \d{1,3} U. S. \d{1,4}', case)
+    v = []
+    for c in xrange(len(x)):
+        d = regex.findall('^\d{1,3}', x[c][1:])
+        s = regex.findall('(?<= )\d{1,4}$', x[c][1:])
+        v.append([int(d[0]), int(s[0])])
+    return v
+
+def sampleTexts(path, mb):
+    """Opinion texts from a cases file, or the test fixtures padded with citations, up to mb megabytes"""
+    if path:
+        texts = [c['txt'] for c in corpus.readCases(path)]
+    else:
+        #roughly one citation per kilobyte of opinion text
+        texts = []
+        for n, c in enumerate(test_cases.nameList):
+            cited = " See Smith v. Jones, %d U. S. %d, %d S. Ct. %d (1950); id., at %d." % (n % 500 + 1, n * 7 % 900 + 1, n % 90 + 1, n, n)
+            texts.append(c['txt'] + cited)
+    out, size = [], 0
+    while size < mb * 1e6:
+        for t in texts:
+            out.append(t)
+            size += len(t)
+    return out, size
+
+def timeIt(func, texts):
+    start = time.time()
+    n = 0
+    for t in texts:
+        n += len(func(t))
+    return time.time() - start, n
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", help="Cases file to take the opinion texts from", default=None)
+    parser.add_argument("-m", "--mb", help="Megabytes of text to scan", type=float, default=20)
+    args = parser.parse_args()
+    texts, size = sampleTexts(args.input, args.mb)
+    mb = size / 1e6
+    for name, func in [("legacy findall", legacyExtract), ("extractCitations", citations.extractCitations), ("CitationScanner.scan", SCANNER.scan)]:
+        secs, n = timeIt(func, texts)
+        print "%-22s %8.1f MB/s %10d citations" % (name, mb / secs, n)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Case-name validation: one NameIndex per opinion against the old per-citation lower().find loop
+
+    python -m benchmarks.bench_names [-i cites.json] [-n opinions]
+
+With -i the cited case names of every case in a citation output file (with text) are checked
+against its opinion; otherwise synthetic opinions that mention some of 100 cited cases are used.
+"""
+import argparse, random, time
+from lib import corpus
+from lib.citation_builders import NameIndex
+
+def legacyValidate(name, caseToCheck):
+    """validateName before the NameIndex"""
+    return caseToCheck.lower().find(name.lower()) != -1
+
+def sampleOpinions(path, n):
+    """(text, [cited names]) pairs"""
+    if path:
+        cases = list(corpus.readCases(path))
+        names = dict((tuple(c['number']), c['name']) for c in cases)
+        return [(c['txt'], [names[tuple(x)] for x in c['citations'] if tuple(x) in names]) for c in cases if c.get('txt')]
+    random.seed(1)
+    parties = ["SMITH", "JONES", "BROWN", "UNITED STATES", "BOARD OF EDUCATION", "MILLER", "OHIO", "CALIFORNIA", "GARCIA", "WILSON"]
+    names = ["%s v. %s" % (random.choice(parties), random.choice(parties) + " " + str(i)) for i in xrange(100)]
+    filler = "The court below erred in its reading of the statute and the judgment is reversed. " * 6
+    out = []
+    for i in xrange(n):
+        cited = random.sample(names, 60)
+        body = []
+        for name in cited:
+            first, second = name.split(" v. ")
+            #opinions mostly write names in title case and often shorten the second party
+            body.append(filler + " See %s v. %s, 1 U. S. 1." % (first.title(), second.split()[0].title()))
+        out.append(("".join(body), cited))
+    return out
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", help="Citation output (saved with text) to benchmark with", default=None)
+    parser.add_argument("-n", "--opinions", help="Synthetic opinions to use without -i", type=int, default=300)
+    args = parser.parse_args()
+    sample = sampleOpinions(args.input, args.opinions)
+    mb = sum(len(t) for t, n in sample) / 1e6
+    start = time.time()
+    old = sum(1 for t, names in sample for n in names if legacyValidate(n, t))
+    oldSecs = time.time() - start
+    start = time.time()
+    new = 0
+    for t, names in sample:
+        idx = NameIndex(t)
+        new += sum(1 for n in names if idx.mentions(n))
+    newSecs = time.time() - start
+    total = sum(len(n) for t, n in sample)
+    print "%d opinions, %.1f MB, %d cited names" % (len(sample), mb, total)
+    print "%-22s %7.2fs %6.1f%% validated" % ("per citation find", oldSecs, 100.0 * old / total)
+    print "%-22s %7.2fs %6.1f%% validated" % ("NameIndex", newSecs, 100.0 * new / total)
+
+if __name__ == "__main__":
+    main()
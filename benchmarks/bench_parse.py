@@ -0,0 +1,62 @@
+"""Parse CPU per case: the streaming opinionText extraction against the old tree based caseParse
+
+    python -m benchmarks.bench_parse [--cache pages] [-n cases]
+
+With --cache the case pages saved in a page cache directory are used; otherwise synthetic
+cases rendered by the Justia stand-in, wrapped in Justia sized navigation and footer markup.
+"""
+import argparse, time
+import unidecode
+from lxml import html
+from lib import cache, scrapers
+from tests import justia_stub
+from benchmarks import synthetic
+
+HEADER = '<div id="header">' + "".join('<ul class="menu"><li><a href="/topic/%d">Topic %d</a></li><li><a href="/area/%d">Practice area %d</a></li></ul>' % (i, i, i, i) for i in xrange(150)) + '</div>'
+FOOTER = '<div id="footer">' + "".join('<p><a href="/lawyers/%d">Find a lawyer %d</a> near you.</p>' % (i, i) for i in xrange(200)) + '<script>var track = {"page": "case"};</script></div>'
+
+def legacyParse(page):
+    """caseParse and deleteDisclamer before opinionText"""
+    cTree = html.fromstring(page)
+    opinion = cTree.cssselect('div#opinion')
+    op = ""
+    for o in opinion:
+        op = op + o.text_content()
+    return unidecode.unidecode(op).replace(scrapers.DISCLAIMER, "")
+
+def samplePages(path, n):
+    if path:
+        pc = cache.PageCache(path)
+        pages = [pc.get(u) for u in pc.urls() if u.endswith(".html")]
+        pc.close()
+        return pages
+    stub = justia_stub.JustiaStub(justia_stub.fromCases(synthetic.generateCases(n, vStart=530)))
+    pages = []
+    for url, case in sorted(stub.cases.items()):
+        for suffix in case['pages']:
+            page = stub.page(url + suffix + ".html")
+            pages.append(page.replace('<body>', '<body>' + HEADER).replace('</body>', FOOTER + '</body>'))
+    stub.server_close()
+    return pages
+
+def cpu(func, pages):
+    start = time.clock()
+    out = [func(p) for p in pages]
+    return time.clock() - start, out
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cache", help="Page cache directory to take the case pages from", default=None)
+    parser.add_argument("-n", "--cases", help="Synthetic cases to use without --cache", type=int, default=1000)
+    args = parser.parse_args()
+    pages = samplePages(args.cache, args.cases)
+    print "%d pages, %.1f MB" % (len(pages), sum(len(p) for p in pages) / 1e6)
+    old, oldText = cpu(legacyParse, pages)
+    new, newText = cpu(scrapers.opinionText, pages)
+    same = sum(1 for a, b in zip(oldText, newText) if a.split() == b.split())
+    print "%-14s %8.3f ms CPU per page" % ("caseParse", 1000 * old / len(pages))
+    print "%-14s %8.3f ms CPU per page" % ("opinionText", 1000 * new / len(pages))
+    print "%.1fx faster, %d of %d pages give the same words" % (old / new, same, len(pages))
+
+if __name__ == "__main__":
+    main()
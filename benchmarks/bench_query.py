@@ -0,0 +1,51 @@
+"""Query index: cold start and per query latency of the citation query index
+
+    python -m benchmarks.bench_query [-g vis/graph] [-n nodes] [-e edges]
+
+With -g the index is built from that graph output; otherwise from the random citation graph
+of bench_analytics. The cold start is measured in a fresh process.
+"""
+import argparse, os, random, shutil, subprocess, sys, tempfile, time
+from lib import query, exporters
+from benchmarks.bench_analytics import sampleGraph
+
+COLD = "import time; s = time.time(); from lib import query; idx = query.CitationIndex(%r); idx.citedBy(idx.find(1, 1)); print time.time() - s"
+
+def timeQuery(name, func, args):
+    start = time.time()
+    for a in args:
+        func(*a)
+    print "%-10s %8.2f ms" % (name, 1000 * (time.time() - start) / len(args))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-g", "--graph", help="Graph output prefix to index, e.g. vis/graph", default=None)
+    parser.add_argument("-n", "--nodes", help="Synthetic graph nodes without -g", type=int, default=30000)
+    parser.add_argument("-e", "--edges", help="Synthetic graph edges without -g", type=int, default=500000)
+    args = parser.parse_args()
+    tmp = tempfile.mkdtemp()
+    try:
+        graph = args.graph
+        if graph is None:
+            graph = os.path.join(tmp, "graph")
+            exporters.writeBinary(sampleGraph(None, args.nodes, args.edges), graph + "_csr")
+        path = os.path.join(tmp, "index")
+        start = time.time()
+        n = query.buildIndex(graph, path)
+        print "%d cases indexed in %.2fs" % (n, time.time() - start)
+        cold = subprocess.check_output([sys.executable, "-c", COLD % path]).strip()
+        print "%-10s %8.2f ms" % ("cold start", 1000 * float(cold))
+        idx = query.CitationIndex(path)
+        random.seed(1)
+        cases = [random.randrange(n) for i in xrange(200)]
+        timeQuery("cites", idx.cites, [(i,) for i in cases])
+        timeQuery("citedby", idx.citedBy, [(i,) for i in cases])
+        timeQuery("hops k=2", idx.hops, [(i, 2, "out") for i in cases[:50]])
+        timeQuery("path", idx.path, [(a, b, "both") for a, b in zip(cases[:50], cases[50:100])])
+        timeQuery("top", idx.top, [(10, 1850, 1900)] * 50)
+        idx.close()
+    finally:
+        shutil.rmtree(tmp)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Load time and peak RSS of the cases.json array, JSON lines and CorpusStore formats
+
+    python -m benchmarks.bench_store [-i cases.json] [-n copies]
+
+Each format is loaded in a fresh process that reads the metadata GraphBuilder needs
+(name, number, vol, date, citations) for every case.
+"""
+import argparse, json, os, shutil, subprocess, sys, tempfile
+from lib import corpus, store
+from tests import test_cases
+
+LOADERS = {
+    'json array': "import json; cases = json.load(open(PATH))",
+    'json lines': "from lib import corpus; cases = list(corpus.readCases(PATH))",
+    'corpus store': "from lib import store; cases = list(store.CorpusStore(PATH))",
+}
+PROBE = """
+import resource, time, sys
+start = time.time()
+%s
+meta = [(c['name'], c['number'], c['vol'], c['date'], c['citations']) for c in cases]
+print time.time() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+"""
+
+def sampleCases(path, copies):
+    """The cases from a file, or the test fixtures renumbered `copies` times"""
+    if path:
+        for case in corpus.readCases(path):
+            yield case
+        return
+    for i in xrange(copies):
+        for case in test_cases.nameList:
+            case = dict(case)
+            case['number'] = [i + 1, case['number'][1]]
+            yield case
+
+def measure(code, path):
+    out = subprocess.check_output([sys.executable, "-c", PROBE % code.replace("PATH", repr(path))])
+    secs, rss = out.split()
+    return float(secs), int(rss)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", help="Cases file to benchmark with", default=None)
+    parser.add_argument("-n", "--copies", help="Copies of the fixtures to use without -i", type=int, default=5000)
+    args = parser.parse_args()
+    tmp = tempfile.mkdtemp()
+    try:
+        paths = {'json array': os.path.join(tmp, "cases.json"), 'json lines': os.path.join(tmp, "cases.jsonl"), 'corpus store': os.path.join(tmp, "cases.corpus")}
+        with corpus.JsonArrayWriter(paths['json array']) as arr, corpus.CaseWriter(paths['json lines']) as lines:
+            for case in sampleCases(args.input, args.copies):
+                arr.write(case)
+                lines.write(case)
+        store.convert(corpus.readCases(paths['json lines']), paths['corpus store'])
+        for name in ['json array', 'json lines', 'corpus store']:
+            p = paths[name]
+            size = os.path.getsize(p) if os.path.isfile(p) else sum(os.path.getsize(os.path.join(p, f)) for f in os.listdir(p))
+            secs, rss = measure(LOADERS[name], p)
+            print "%-13s %8.1f MB on disk %7.2fs load %8.1f MB peak RSS" % (name, size / 1e6, secs, rss / 1024.0)
+    finally:
+        shutil.rmtree(tmp)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Offline benchmark suite with a baseline to catch performance regressions
+
+    python -m benchmarks.suite              run and compare against benchmarks/baseline.json
+    python -m benchmarks.suite --save       run and write the results as the new baseline
+
+Everything runs on a synthetic corpus (benchmarks.synthetic) served by the local Justia
+stand-in (tests/justia_stub.py), so no network is needed:
+    scrape      cases per second through VolScraper.streamVolumes and CaseScraper
+    extract     MB/s of opinion text through citations.extractCitations
+    citations   cases per second through citations.processText on 1, 2 and 4 processes
+    graph       seconds for GraphBuilder.drawGraph writing every format
+Each benchmark keeps the best of --repeat runs. A result more than --tolerance worse than
+the baseline is a regression and the suite exits with status 1. The baseline is machine
+specific, save it again after moving to other hardware.
+"""
+import argparse, json, os, shutil, sys, tempfile, time
+from lib import scrapers, fetcher, grapher, corpus
+from lib.citation_builders import citations
+from tests import justia_stub
+from benchmarks import synthetic
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+WORKERS = (1, 2, 4)
+
+def best(func, repeat):
+    """The shortest time of repeat calls"""
+    times = []
+    for i in xrange(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+def benchScrape(cases, tmp, threads, repeat):
+    server = justia_stub.JustiaStub(justia_stub.fromCases(cases)).start()
+    vStart, vStop = cases[0]['vol'], cases[-1]['vol']
+    out = os.path.join(tmp, "scraped")
+    def run():
+        if os.path.exists(out + ".jsonl"):
+            os.remove(out + ".jsonl")
+        links = scrapers.VolScraper(vStart, vStop, server.url).streamVolumes(threads)
+        cs = scrapers.CaseScraper(False, links, out, False, server.url, threads, fetcher.Fetcher())
+        cs.getCases(False)
+    try:
+        secs = best(run, repeat)
+    finally:
+        server.stop()
+    scraped = list(corpus.readCases(out + ".jsonl"))
+    if [c['txt'].split() for c in scraped] != [c['txt'].split() for c in cases]:
+        raise AssertionError("The scraped cases don't match the synthetic corpus")
+    return len(cases) / secs
+
+def benchExtract(cases, repeat):
+    texts = [c['txt'] for c in cases]
+    mb = sum(len(t) for t in texts) / 1e6
+    return mb / best(lambda: [citations.extractCitations(t) for t in texts], repeat)
+
+def benchCitations(path, tmp, workers, repeat):
+    cases = corpus.CaseFile(path)
+    out = os.path.join(tmp, "cites")
+    n = sum(1 for c in cases)
+    return n / best(lambda: citations(cases, out).processText(False, workers, False), repeat)
+
+def benchGraph(tmp, repeat):
+    cites = corpus.CaseFile(os.path.join(tmp, "cites.json"))
+    cwd = os.getcwd()
+    os.chdir(tmp)
+    try:
+        if not os.path.isdir("vis"):
+            os.mkdir("vis")
+        return best(lambda: grapher.GraphBuilder(cites, "graph", 4, "").drawGraph(), repeat)
+    finally:
+        os.chdir(cwd)
+
+def runSuite(n, density, vStart, threads, repeat, log=sys.stdout):
+    """Run every benchmark
+    Returns:
+        {name: {'value': ..., 'unit': ..., 'better': 'higher' | 'lower'}}
+    """
+    tmp = tempfile.mkdtemp()
+    results = {}
+    def note(name, value, unit, better):
+        results[name] = {'value': round(value, 3), 'unit': unit, 'better': better}
+        log.write("%-14s %10.2f %s\n" % (name, value, unit))
+    try:
+        cases = list(synthetic.generateCases(n, density, vStart=vStart))
+        path = os.path.join(tmp, "cases.jsonl")
+        with corpus.CaseWriter(path) as out:
+            for case in cases:
+                out.write(case)
+        note("scrape", benchScrape(cases, tmp, threads, repeat), "cases/s", "higher")
+        note("extract", benchExtract(cases, repeat), "MB/s", "higher")
+        for w in WORKERS:
+            note("citations_w%d" % w, benchCitations(path, tmp, w, repeat), "cases/s", "higher")
+        note("graph", benchGraph(tmp, repeat), "s", "lower")
+    finally:
+        shutil.rmtree(tmp)
+    return results
+
+def compare(results, baseline, tolerance):
+    """The benchmarks more than tolerance (a fraction) worse than the baseline
+    Returns:
+        A list of (name, baseline value, value)
+    """
+    worse = []
+    for name, base in sorted(baseline.iteritems()):
+        if name not in results:
+            continue
+        value = results[name]['value']
+        if base['better'] == "higher":
+            bad = value < base['value'] * (1 - tolerance)
+        else:
+            bad = value > base['value'] * (1 + tolerance)
+        if bad:
+            worse.append((name, base['value'], value))
+    return worse
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--cases", help="Synthetic cases. Default 2000.", type=int, default=2000)
+    parser.add_argument("-d", "--density", help="Mean citations per case. Default 10.", type=float, default=10)
+    parser.add_argument("-s", "--vStart", help="First volume; 530 spreads the corpus over all three Justia page layouts. Default 530.", type=int, default=530)
+    parser.add_argument("--threads", help="Scraper threads. Default 4.", type=int, default=4)
+    parser.add_argument("-r", "--repeat", help="Runs of each benchmark to take the best of. Default 3.", type=int, default=3)
+    parser.add_argument("-t", "--tolerance", help="Fraction worse than the baseline that counts as a regression. Default 0.25.", type=float, default=0.25)
+    parser.add_argument("-b", "--baseline", help="Baseline file. Default benchmarks/baseline.json.", default=BASELINE)
+    parser.add_argument("--save", help="Write the results as the new baseline", action="store_true")
+    args = parser.parse_args()
+    params = {'cases': args.cases, 'density': args.density, 'vStart': args.vStart, 'threads': args.threads}
+    results = runSuite(args.cases, args.density, args.vStart, args.threads, args.repeat)
+    if args.save:
+        with open(args.baseline, 'w') as fp:
+            json.dump({'params': params, 'results': results}, fp, indent=2, sort_keys=True)
+        print "Saved the baseline to " + args.baseline
+        return
+    if not os.path.exists(args.baseline):
+        sys.exit("No baseline at " + args.baseline + ", run with --save first")
+    with open(args.baseline) as fp:
+        baseline = json.load(fp)
+    if baseline['params'] != params:
+        sys.exit("The baseline was run with %s, run with the same parameters or --save a new one" % json.dumps(baseline['params'], sort_keys=True))
+    worse = compare(results, baseline['results'], args.tolerance)
+    for name, base, value in worse:
+        print "REGRESSION %-14s %.2f -> %.2f %s" % (name, base, value, results[name]['unit'])
+    if worse:
+        sys.exit(1)
+    print "No regressions against the baseline"
+
+if __name__ == "__main__":
+    main()
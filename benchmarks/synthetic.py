@@ -0,0 +1,79 @@
+"""Synthetic corpora in the cases.json schema, of any size and citation density
+
+    python -m benchmarks.synthetic -n 5000 -d 10 -o synthetic.jsonl
+
+Cases are numbered volume by volume from --vStart and cite earlier cases, most often recent
+ones, in the "347 U. S. 483" form (sometimes a pin cite into the case). Opinions are numbered
+paragraphs (one per line) of filler sentences with the citations spread through them and the
+cited case names mentioned.
+"""
+import argparse, random
+from lib import corpus
+from lib.citation_builders import citations
+
+PARTIES = ["SMITH", "JONES", "BROWN", "UNITED STATES", "BOARD OF EDUCATION", "MILLER", "OHIO", "CALIFORNIA",
+           "GARCIA", "WILSON", "NEW YORK", "TEXAS", "JOHNSON", "DAVIS", "COMMISSIONER"]
+MONTHS = ["January", "February", "March", "April", "May", "June", "October", "November", "December"]
+FILLER = ["The judgment of the court below is reversed and the cause remanded.",
+          "We granted certiorari to resolve a conflict among the courts of appeals.",
+          "The statute does not reach conduct of this kind.",
+          "Petitioner contends that the lower court misread the record.",
+          "That reading finds no support in the text or history of the provision.",
+          "The question presented is one of first impression in this Court.",
+          "Respondent's remaining arguments are without merit.",
+          "We have long held that the power of Congress in this field is plenary."]
+
+def year(vol):
+    """Roughly the year the volume was decided in"""
+    return 1790 + int(vol * 0.47)
+
+def generateCases(n, density=10, perVol=100, vStart=1, words=1500, seed=1, paragraph=4):
+    """Yield n cases in the scraper output schema.
+    Args:
+        density: Mean number of citations per case
+        perVol: Cases per volume, each on its own first page
+        words: Rough length of each opinion in words
+        paragraph: Sentences per paragraph
+    """
+    rng = random.Random(seed)
+    numbers, names = [], []
+    for i in xrange(n):
+        vol = vStart + i // perVol
+        page = 1 + (i % perVol) * 10
+        name = "%s v. %s" % (rng.choice(PARTIES), rng.choice(PARTIES))
+        cited = []
+        if numbers:
+            for j in xrange(max(0, int(rng.gauss(density, density / 3.0)))):
+                #recent cases are cited far more often than old ones
+                k = len(numbers) - 1 - min(int(rng.expovariate(1.0 / max(len(numbers) / 4.0, 1))), len(numbers) - 1)
+                cited.append(k)
+        sentences = [rng.choice(FILLER) for s in xrange(max(words // 10, len(cited) + 1))]
+        for j, k in enumerate(cited):
+            cv, cp = numbers[k]
+            pin = ", %d" % (cp + rng.randint(1, 9)) if rng.random() < 0.3 else ""
+            s = rng.randrange(len(sentences))
+            sentences[s] += " See %s, %d U. S. %d%s (%d)." % (" v. ".join(p.title() for p in names[k].split(" v. ")), cv, cp, pin, year(cv))
+        paras = ["%d. %s" % (k // paragraph + 1, " ".join(sentences[k:k + paragraph])) for k in xrange(0, len(sentences), paragraph)]
+        txt = "\n".join(["U.S. Supreme Court %s, %d U. S. %d (%d)" % (name, vol, page, year(vol))] + paras)
+        yield {'name': name, 'url': "/cases/federal/us/%d/%d/" % (vol, page), 'txt': txt, 'number': [vol, page],
+               'citations': citations.extractCitations(txt), 'vol': vol,
+               'date': "%s %d, %d" % (rng.choice(MONTHS), rng.randint(1, 28), year(vol))}
+        numbers.append((vol, page))
+        names.append(name)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--cases", help="Number of cases. Default 5000.", type=int, default=5000)
+    parser.add_argument("-d", "--density", help="Mean citations per case. Default 10.", type=float, default=10)
+    parser.add_argument("--perVol", help="Cases per volume. Default 100.", type=int, default=100)
+    parser.add_argument("-s", "--vStart", help="First volume. Default 1.", type=int, default=1)
+    parser.add_argument("-w", "--words", help="Rough words per opinion. Default 1500.", type=int, default=1500)
+    parser.add_argument("-o", "--output", help="JSON lines file to write. Default synthetic.jsonl.", default="synthetic.jsonl")
+    args = parser.parse_args()
+    with corpus.CaseWriter(args.output) as out:
+        for case in generateCases(args.cases, args.density, args.perVol, args.vStart, args.words):
+            out.write(case)
+    print "Wrote " + str(args.cases) + " cases to " + args.output
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import json
+import numpy as np
+import scipy.sparse as sp
+from exporters import citationArrays
+
+def adjacency(G):
+    """The directed citation matrix of a graph: A[i, j] = 1 if node i cites node j
+    Returns:
+        The nodes in matrix order and A as a scipy.sparse csr_matrix
+    """
+    nodes, indptr, indices = citationArrays(G)
+    n = len(nodes)
+    A = sp.csr_matrix((np.ones(len(indices)), indices, indptr), shape=(n, n))
+    return nodes, A
+
+def pagerank(A, alpha=0.85, maxIter=100, tol=1.0e-8):
+    """PageRank by power iteration on the citation matrix, as nx.pagerank computes it with
+    a uniform teleport and the rank of cases citing nothing spread over every case
+    """
+    n = A.shape[0]
+    if n == 0:
+        return np.zeros(0)
+    out = np.asarray(A.sum(axis=1)).ravel()
+    dangling = out == 0
+    W = sp.diags(np.where(dangling, 0, 1.0 / np.maximum(out, 1))).dot(A).T.tocsr()
+    x = np.ones(n) / n
+    for i in xrange(maxIter):
+        last = x
+        x = alpha * (W.dot(last) + last[dangling].sum() / n) + (1 - alpha) / n
+        if np.abs(x - last).sum() < n * tol:
+            break
+    return x
+
+def hits(A, maxIter=100, tol=1.0e-8):
+    """HITS hub and authority scores, normalized to sum to 1 like nx.hits"""
+    n = A.shape[0]
+    if n == 0:
+        return np.zeros(0), np.zeros(0)
+    AT = A.T.tocsr()
+    h = np.ones(n) / n
+    a = h
+    for i in xrange(maxIter):
+        last = h
+        a = AT.dot(h)
+        h = A.dot(a)
+        if h.max() > 0:
+            h = h / h.max()
+        if a.max() > 0:
+            a = a / a.max()
+        if np.abs(h - last).sum() < tol:
+            break
+    return (h / h.sum() if h.sum() else h), (a / a.sum() if a.sum() else a)
+
+def citationAges(A, years):
+    """The age in years of every citation, from the citing to the cited case's year
+    Citations to or from cases without a year are left out.
+    Returns:
+        The citing node and the age of each citation
+    """
+    A = A.tocoo()
+    known = (years[A.row] > 0) & (years[A.col] > 0)
+    rows = A.row[known]
+    return rows, years[rows] - years[A.col[known]]
+
+def volumeStats(vols, inDeg, outDeg, rank, nodes):
+    """Aggregates of the cases in each volume: cases, citations made and received, mean and
+    top PageRank. Cited nodes that aren't cases in the corpus (vol 0) are left out.
+    """
+    inCorpus = vols > 0
+    if not inCorpus.any():
+        return []
+    size = vols.max() + 1
+    cases = np.bincount(vols[inCorpus], minlength=size)
+    made = np.bincount(vols[inCorpus], outDeg[inCorpus], size)
+    received = np.bincount(vols[inCorpus], inDeg[inCorpus], size)
+    rankSum = np.bincount(vols[inCorpus], rank[inCorpus], size)
+    #the last node of each volume when sorted by volume then rank is the volume's top case
+    order = np.lexsort((rank, vols))
+    last = np.ones(len(order), bool)
+    last[:-1] = vols[order][1:] != vols[order][:-1]
+    top = dict((int(vols[i]), nodes[i]) for i in order[last])
+    return [{'vol': int(v), 'cases': int(cases[v]), 'citationsMade': int(made[v]), 'citationsReceived': int(received[v]),
+             'meanPagerank': float(rankSum[v] / cases[v]), 'topCase': top[int(v)]} for v in np.nonzero(cases)[0]]
+
+def analyze(G, top=20):
+    """Compute the citation metrics of a graph and set them as node attributes:
+    inDegree, outDegree, pagerank, hub, authority and citeAge (mean age of the cases cited).
+    Returns:
+        A summary with the citation age histogram, per volume aggregates and the top cases
+    """
+    nodes, A = adjacency(G)
+    n = len(nodes)
+    years = np.array([G.node[v].get('year', 0) for v in nodes], dtype=np.int64)
+    vols = np.array([G.node[v].get('vol', 0) for v in nodes], dtype=np.int64)
+    inDeg = np.asarray(A.sum(axis=0)).ravel().astype(np.int64)
+    outDeg = np.asarray(A.sum(axis=1)).ravel().astype(np.int64)
+    rank = pagerank(A)
+    hub, authority = hits(A)
+    rows, ages = citationAges(A, years)
+    counted = np.bincount(rows, minlength=n)
+    citeAge = np.bincount(rows, ages, n) / np.maximum(counted, 1)
+
+    for i, v in enumerate(nodes):
+        attrs = G.node[v]
+        attrs['inDegree'], attrs['outDegree'] = int(inDeg[i]), int(outDeg[i])
+        attrs['pagerank'], attrs['hub'], attrs['authority'] = float(rank[i]), float(hub[i]), float(authority[i])
+        attrs['citeAge'] = float(citeAge[i])
+
+    later = ages < 0
+    return {
+        'nodes': n,
+        'citations': int(A.nnz),
+        #citations to a case decided later point at a resolver mistake
+        'laterCitations': int(later.sum()),
+        'ageHistogram': np.bincount(ages[~later]).tolist() if len(ages) else [],
+        'meanAge': float(ages[~later].mean()) if (~later).any() else 0.0,
+        'volumes': volumeStats(vols, inDeg, outDeg, rank, nodes),
+        'topPagerank': [nodes[i] for i in np.argsort(-rank, kind='mergesort')[:top]],
+        'topAuthority': [nodes[i] for i in np.argsort(-authority, kind='mergesort')[:top]],
+        'topCited': [nodes[i] for i in np.argsort(-inDeg, kind='mergesort')[:top]],
+    }
+
+def writeAnalytics(summary, path):
+    with open(path, 'w') as fp:
+        json.dump(summary, fp, indent=2)
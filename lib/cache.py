@@ -0,0 +1,119 @@
+import os, hashlib, sqlite3, threading, time, zlib
+
+class PageCache(object):
+    """On-disk, content-addressed cache of the raw Justia pages, keyed by URL.
+
+    Page bodies are stored once per distinct content under objects/ (named by their sha1,
+    optionally zlib compressed) and an sqlite index maps each URL to its body along with the
+    ETag/Last-Modified validators. When maxBytes is set the least recently used pages are
+    evicted to keep the stored bodies under the cap.
+    """
+    def __init__(self, root, maxBytes=0, compress=True):
+        self.root = root
+        self.maxBytes = maxBytes
+        self.compress = compress
+        self.lock = threading.RLock()
+        if not os.path.isdir(os.path.join(root, "objects")):
+            os.makedirs(os.path.join(root, "objects"))
+        self.db = sqlite3.connect(os.path.join(root, "index.sqlite"), check_same_thread=False)
+        self.db.execute("CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, digest TEXT, etag TEXT, lastmod TEXT, used REAL)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS objects (digest TEXT PRIMARY KEY, size INTEGER, compressed INTEGER)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS pages_used ON pages (used)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS pages_digest ON pages (digest)")
+        self.db.commit()
+        self.size = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+
+    def objectPath(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest[2:])
+
+    def lookup(self, url):
+        """The cache entry for a url as a dict with the etag and lastmod validators, or None"""
+        with self.lock:
+            row = self.db.execute("SELECT digest, etag, lastmod FROM pages WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        return {'digest': row[0], 'etag': row[1], 'lastmod': row[2]}
+
+    def get(self, url):
+        """Return the cached body for a url, or None if it isn't cached"""
+        with self.lock:
+            row = self.db.execute("SELECT p.digest, o.compressed FROM pages p JOIN objects o ON p.digest = o.digest WHERE p.url = ?", (url,)).fetchone()
+            if row is None:
+                return None
+            try:
+                with open(self.objectPath(row[0]), 'rb') as fp:
+                    data = fp.read()
+            except IOError:
+                #body went missing from disk, forget the page
+                self.db.execute("DELETE FROM pages WHERE url = ?", (url,))
+                self.db.commit()
+                return None
+            self.touch(url)
+        return zlib.decompress(data) if row[1] else data
+
+    def touch(self, url):
+        """Mark a page as recently used, e.g. after a 304 revalidation"""
+        with self.lock:
+            self.db.execute("UPDATE pages SET used = ? WHERE url = ?", (time.time(), url))
+            self.db.commit()
+
+    def put(self, url, body, etag=None, lastmod=None):
+        """Store a fetched page and its validators"""
+        digest = hashlib.sha1(body).hexdigest()
+        with self.lock:
+            if self.db.execute("SELECT 1 FROM objects WHERE digest = ?", (digest,)).fetchone() is None:
+                data = zlib.compress(body, 6) if self.compress else body
+                path = self.objectPath(digest)
+                if not os.path.isdir(os.path.dirname(path)):
+                    os.makedirs(os.path.dirname(path))
+                tmp = path + ".tmp"
+                with open(tmp, 'wb') as fp:
+                    fp.write(data)
+                os.rename(tmp, path)
+                self.db.execute("INSERT INTO objects VALUES (?, ?, ?)", (digest, len(data), int(self.compress)))
+                self.size += len(data)
+            old = self.lookup(url)
+            self.db.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)", (url, digest, etag, lastmod, time.time()))
+            if old and old['digest'] != digest:
+                self.dropObject(old['digest'])
+            self.db.commit()
+            if self.maxBytes and self.size > self.maxBytes:
+                self.evict()
+
+    def dropObject(self, digest):
+        """Delete a body once no url points at it any more"""
+        if self.db.execute("SELECT 1 FROM pages WHERE digest = ? LIMIT 1", (digest,)).fetchone() is not None:
+            return
+        row = self.db.execute("SELECT size FROM objects WHERE digest = ?", (digest,)).fetchone()
+        if row is None:
+            return
+        self.db.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+        self.size -= row[0]
+        try:
+            os.remove(self.objectPath(digest))
+        except OSError:
+            pass
+
+    def evict(self):
+        """Drop least recently used pages until the cache is back under maxBytes"""
+        with self.lock:
+            rows = self.db.execute("SELECT url, digest FROM pages ORDER BY used").fetchall()
+            for url, digest in rows:
+                if self.size <= self.maxBytes:
+                    break
+                self.db.execute("DELETE FROM pages WHERE url = ?", (url,))
+                self.dropObject(digest)
+            self.db.commit()
+
+    def urls(self):
+        """Every cached url"""
+        with self.lock:
+            return [r[0] for r in self.db.execute("SELECT url FROM pages ORDER BY url")]
+
+    def __len__(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.db.close()
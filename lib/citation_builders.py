@@ -1,116 +1,421 @@
-import regex, json, unidecode, time
+import re, time, bisect, itertools
+import multiprocessing
+from corpus import JsonArrayWriter, CaseFile
+from metrics import Metrics
+
+#Reporter table for the CitationScanner: the normalized reporter name and the pattern it is written as
+US = "U.S."
+REPORTERS = [
+	(US, r'U\.\s?S\.'),
+	("S.Ct.", r'S\.\s?Ct\.'),
+	("L.Ed.2d", r'L\.\s?Ed\.\s?2d'),
+	("L.Ed.", r'L\.\s?Ed\.'),
+]
+
+class CitationScanner(object):
+	"""Single pass citation extraction over the text of a case.
+
+	One precompiled regex captures the volume, reporter and page of every citation to a reporter
+	in the table, along with "id." and "Name, supra" short forms. Parallel citations to the same
+	case ("347 U. S. 483, 74 S. Ct. 686") are collapsed to the U.S. cite, "id." repeats the
+	previous citation and "supra" the last citation to a case with that party name.
+	"""
+	PARALLEL_GAP = re.compile(r',(?:\s*\d{1,4}(?:-\d{1,4})?,)*\s*$')
+	SUPRA = re.compile(r"([A-Z][A-Za-z'\-]+),$")
+
+	def __init__(self, reporters=REPORTERS):
+		#each row gets its own group, so aliases and rows sharing a name both work; the group
+		#number of a row is found after any groups of the rows before it
+		self.reporters, at = {}, 2
+		for r, pattern in reporters:
+			self.reporters[at] = r
+			at += 1 + re.compile(pattern).groups
+		self.page = at
+		alts = "|".join("(%s)" % pattern for r, pattern in reporters)
+		#every alternative starts with the space so the scan only stops on spaces
+		self.pattern = re.compile(r' (?:(?<!Page )(?<!P\. )(\d{1,3}) (?:' + alts + r') (\d{1,4})|(?:[Ii]d|Ibid)\.|supra\b)')
+
+	def reporter(self, m):
+		"""The normalized name of the table row a citation matched"""
+		for group, r in self.reporters.iteritems():
+			if m.group(group) is not None:
+				return r
+
+	@staticmethod
+	def parties(text, start):
+		"""The capitalized words of the first party of a case named right before a citation"""
+		v = text.rfind(" v. ", max(0, start - 160), start)
+		if v == -1 or text.find(";", v, start) != -1 or text.find(")", v, start) != -1:
+			return []
+		words = []
+		for w in reversed(text[max(0, v - 60):v].split()[-4:]):
+			if not w[:1].isupper():
+				break
+			words.append(w)
+		return words
+
+	def scan(self, text):
+		"""Extract the citations from a text
+		Returns:
+			A list of (volume, reporter, page) tuples in text order
+		"""
+		cites = []
+		chain, chainEnd = None, -1
+		byParty = {}
+		#party names are only needed to resolve "supra"
+		supra = " supra" in text
+		for m in self.pattern.finditer(text):
+			vol = m.group(1)
+			if vol is not None:
+				cite = (int(vol), self.reporter(m), int(m.group(self.page)))
+				if chain is not None and self.PARALLEL_GAP.match(text, chainEnd, m.start()):
+					#parallel citation to the case just cited, keep the U.S. one
+					if cite[1] == US and chain[1] != US:
+						cites[-1] = chain = cite
+					chainEnd = m.end()
+					continue
+				if supra:
+					for word in self.parties(text, m.start()):
+						byParty[word] = cite
+				cites.append(cite)
+				chain, chainEnd = cite, m.end()
+				continue
+			chain = None
+			if m.group(0)[-1] == 'a':
+				#"Name, supra"
+				name = self.SUPRA.search(text, max(0, m.start() - 40), m.start())
+				cite = byParty.get(name.group(1)) if name else None
+			else:
+				cite = cites[-1] if cites else None
+			if cite is not None:
+				cites.append(cite)
+		return cites
+
+#The default scanner used by the citations class
+SCANNER = CitationScanner()
+
+#First parties too common to identify a case on their own
+GENERIC_PARTIES = set(["united states", "state", "people", "commonwealth", "respublica", "the king", "territory"])
+STRIP = ",.;:()[]\"'"
+
+def normalizeName(text):
+	"""Lowercase, collapse whitespace and spell "vs." as "v." so names and text compare alike"""
+	return " ".join(text.lower().split()).replace(" vs. ", " v. ")
+
+def nameVariants(name, span=6):
+	"""The normalized forms a case name may be written as in an opinion:
+	the full name (cut to `span` words a side), "first v. second-party-first-word", and
+	"first v." unless the first party is a generic one like the United States
+	"""
+	full = normalizeName(name)
+	if " v. " not in full:
+		return [full], []
+	first, second = full.split(" v. ", 1)
+	first = [w.strip(STRIP) for w in first.split()][-span:]
+	second = [w.strip(STRIP) for w in second.split()][:span]
+	first = " ".join(w for w in first if w)
+	second = [w for w in second if w]
+	variants = [first + " v. " + " ".join(second)]
+	if second:
+		variants.append(first + " v. " + second[0])
+	if first not in GENERIC_PARTIES:
+		variants.append(first + " v.")
+	return [], variants
+
+#nameVariants of every name checked so far, split into first and second party
+_variants = {}
+
+class NameIndex(object):
+	"""The case names mentioned in one opinion, found in a single pass over its text.
+
+	The text is normalized once and every " v. " in it is indexed by the last 1 to `span`
+	words before it, each pointing at the words that follow. Checking any number of "X v. Y"
+	names is then a dict lookup per name instead of a lowercase and a find over the whole
+	opinion per citation.
+	"""
+	def __init__(self, text, span=6):
+		self.text = normalizeName(text)
+		self.span = span
+		parties = {}
+		i = self.text.find(" v. ")
+		while i != -1:
+			before = [w.strip(STRIP) for w in self.text[max(0, i - 40 * span):i].split()[-span:]]
+			after = " ".join(w.strip(STRIP) for w in self.text[i + 4:i + 4 + 40 * span].split()[:span])
+			for k in xrange(1, len(before) + 1):
+				parties.setdefault(" ".join(before[-k:]), []).append(after)
+			i = self.text.find(" v. ", i + 4)
+		self.parties = parties
+
+	def mentions(self, name):
+		"""Check if the opinion mentions a case name in any of its normalized forms"""
+		key = (name, self.span)
+		if key not in _variants:
+			plain, vForms = nameVariants(name, self.span)
+			_variants[key] = plain, [tuple(x.strip() for x in v.split(" v.", 1)) for v in vForms]
+		plain, vForms = _variants[key]
+		for first, second in vForms:
+			for after in self.parties.get(first, ()):
+				if not second or after == second or after.startswith(second + " "):
+					return True
+		for p in plain:
+			if p in self.text:
+				return True
+		return False
 
 class citations(object):
 	"""A separate class to just build and validate the case citations"""
-	def __init__(self, cases, outfile):
+	def __init__(self, cases, outfile, metrics=None, known=()):
+		#a list of cases or anything that can be iterated over repeatedly, like a corpus.CaseFile
 		self.cases = cases
+		#(number, name) of cases outside the input that citations may resolve to, e.g. the
+		#cases of the graph an update adds to
+		self.known = known
 		self.outfile = outfile+".json"
+		self.names = None
+		self.vols = None
+		self.count = 0
+		#resolve times and progress of the run
+		self.metrics = metrics or Metrics()
 
 	@staticmethod
 	def extractCitations(case):
-		""" Uses Regular expressions to extract the estimated citations from the case text
+		""" Extract the estimated U.S. Reports citations from the case text
 		Previously from the scrapers class as caseExtract
 		Args:
 			The text of a case
 		Returns:
-			A list of citations
+			A list of [volume, page] citations, parallel and short form citations normalized to the U.S. cite
 
 		"""
-		x = regex.findall('(?<!Page|P.) \d{1,3} U. S. \d{1,4}', case)
-		v = []
+		return [[c[0], c[2]] for c in SCANNER.scan(case) if c[1] == US]
 
-		### Get Volume
-		for c in xrange(len(x)):
-			d = regex.findall('^\d{1,3}', x[c][1:])
-			s = regex.findall('(?<= )\d{1,4}$', x[c][1:])
-			v.append([int(d[0]), int(s[0])])
-		return v
+	@staticmethod
+	def countCitations(text, runs):
+		"""The citations of each section, once each with the number of times they are made
+		Previously countCitations in the scrapers module
+		Args:
+			The text of a case and its [section, start, end] runs
+		Returns:
+			{section: [[volume, page, count], ...]} in order of first citation, and the distinct
+			citations of the whole case in order
+		"""
+		counts, order, allCites, cited = {}, {}, [], set()
+		for sec, start, end in runs:
+			c = counts.setdefault(sec, {})
+			for cite in citations.extractCitations(text[start:end]):
+				key = tuple(cite)
+				if key not in c:
+					c[key] = 0
+					order.setdefault(sec, []).append(key)
+					if key not in cited:
+						cited.add(key)
+						allCites.append(key)
+				c[key] += 1
+		return dict((sec, [[v, p, counts[sec][(v, p)]] for v, p in order[sec]]) for sec in order), [list(c) for c in allCites]
 
 	def cascadeCase(self, citation, caseDict, volumes):
 		""" Find the case from the page of the citation (first page of the case)
 		Previously "checkCase" in the Grapher Class
+		Args:
+			caseDict: The hash map of case numbers from buildVolCaseList
+			volumes: The sorted first pages of every volume from buildVolCaseList
 		"""
-		if citation in caseDict:
+		if tuple(citation) in caseDict:
 			return 1, citation
-		else:
-		#where volume == citation[0], case where floor of case
 		#limit search to this volume
-			v = citation[0] - 1
-			#assign to the lower case
-			for c in volumes[v]:
-				if citation[1] > c:
-					lowCite = [citation[0], c]
-					return 0, lowCite
+		pages = volumes.get(citation[0])
+		#a pin cite is inside the case with the nearest first page at or before the cited page
+		i = bisect.bisect_right(pages, citation[1]) if pages else 0
+		if i > 0:
+			return 0, [citation[0], pages[i - 1]]
 		return 0, None
 
-   	def citeToName(self, cite):
-   		"""Checks if a citation links to a casename"""
-   		for c in self.cases:
-   			#print nameList[c]['number']
-   			if cite == c['number']:
-   				return c['name']
-   		return None
+	def citeToName(self, cite, cases=None):
+		"""Checks if a citation links to a casename
+		Uses the case number index unless a list of cases to search is given
+		"""
+		if cases is not None:
+			for c in cases:
+				if cite == c['number']:
+					return c['name']
+			return None
+		if self.names is None:
+			self.buildVolCaseList()
+		return self.names.get(tuple(cite))
 
 	def validateName(self, name, caseToCheck):
-		if caseToCheck.lower().find(name.lower()) != -1:
-			return True
-		else:
-			return False
+		"""Checks if a case name (or its short "v." forms) is mentioned in a case text
+		To check many names against the same text build a NameIndex once instead
+		"""
+		return NameIndex(caseToCheck).mentions(name)
 
 	def buildVolCaseList(self):
-		"""Assign each case to a nested Volume List for faster hashing"""
-		vols, cL = [], []
-		for i in xrange(575):
-			vols.append([])
+		"""Build the resolver index over the cases in the corpus and the known cases
+		Returns:
+			A dict of the sorted first pages of each volume in the corpus and
+			a dict from case number to case name
+		"""
+		vols, names = {}, {}
+		count = 0
 		for c in self.cases:
-			v = c['number'][0] - 1
-			vols[v].append(c['number'][1])
-			cL.append(c['number'])
-		for i in xrange(575):
-			vols[i].sort()
-		return vols, cL
+			count += 1
+			num = tuple(c['number'])
+			vols.setdefault(num[0], []).append(num[1])
+			#keep the first case with a number like the old linear scan did
+			if num not in names:
+				names[num] = c['name']
+		for num, name in self.known:
+			num = tuple(num)
+			if num not in names:
+				vols.setdefault(num[0], []).append(num[1])
+				names[num] = name
+		for v in vols:
+			vols[v].sort()
+		self.names, self.vols, self.count = names, vols, count
+		return vols, names
 
 	def matchMetrics(self, totalCitations, modified, validated, errs):
-		"""Evaluate the performance of the mathcing algorthims"""
+		"""Evaluate the performance of the mathcing algorthims, all ratios are 0 without citations"""
 		tc = float(totalCitations)
+		if tc == 0:
+			return [0.0, 0.0, 0.0, 0.0]
 		return [tc, float(modified)/tc, float(validated)/tc, float(errs)/tc]
 
-	def processText(self, save_text):
-		"""Scaffold for the class"""
-		vols, caseList = self.buildVolCaseList()
-		case_citations = []
-		for case in self.cases:
-			cites = self.extractCitations(case['txt'])
-			cleaned = []
-			### Metrics for how many citations were modified tc= Total Citations/ MC modified/ vC Validated
-			tC, mC, vC, eC = 0, 0, 0, 0
-			for c in xrange(len(cites)):
-				tC = tC + 1
-				x, chckd = self.cascadeCase(cites[c], caseList, vols)
-				mC = mC + x
-				if (chckd == None):
-					eC = eC + 1
-				else:
-					if chckd[0] != case['vol'] and chckd[1] != case['number']:
-						n = self.citeToName(chckd)
-						if n != None:
-							valC = self.validateName(n, case['txt'])
-							if valC:
-								vC = vC + 1
-							if chckd not in cleaned:
-								cleaned.append(chckd)
-						else:
-							eC = eC + 1
-			# if len(cleaned) > 0:
-			# 	print cleaned
-			if save_text:
-				case_citations.append({'name': case['name'], 'url': case['url'], 'txt': case['txt'], 'number': case['number'], 'citations': cleaned, 'vol': case['vol'], 'date': case['date']})
+	def countedCitations(self, case):
+		"""The citations of a case as (section, [volume, page], times cited)
+		Scraped records are scanned again one [section, start, end] run of their de-duplicated
+		text at a time, so changes to the citation code apply without scraping again; older
+		records without sections are scanned whole. Counts stored at scrape time are not used.
+		"""
+		runs = case.get('sections')
+		if not runs:
+			return [(None, c, 1) for c in self.extractCitations(case['txt'])]
+		counted, cites = self.countCitations(case['txt'], runs)
+		order = []
+		for sec, start, end in runs:
+			if sec in counted and sec not in order:
+				order.append(sec)
+		return [(sec, [v, p], n) for sec in order for v, p, n in counted[sec]]
+
+	def resolveCase(self, case, save_text):
+		"""Resolve the citations of a single case against the index
+		Returns:
+			The case's citation record and its [tC, mC, vC, eC] counters
+		"""
+		vols, caseList = self.vols, self.names
+		cleaned, seen = [], set()
+		### Metrics for how many citations were modified tc= Total Citations/ MC modified/ vC Validated
+		tC, mC, vC, eC = 0, 0, 0, 0
+		names = []
+		#the counts per section of the cases the citations resolve to
+		resolved, order = {}, []
+		for sec, cite, times in self.countedCitations(case):
+			tC = tC + times
+			x, chckd = self.cascadeCase(cite, caseList, vols)
+			mC = mC + x * times
+			if (chckd == None):
+				eC = eC + times
 			else:
-				case_citations.append({'name': case['name'], 'url': case['url'], 'number': case['number'], 'citations': cleaned, 'vol': case['vol'], 'date': case['date']})
-		with open(self.outfile, 'w') as fp:
-			json.dump(case_citations, fp, indent=2)
-		metrics = self.matchMetrics(tC, mC, vC, eC)
+				if chckd[0] != case['vol'] and chckd[1] != case['number']:
+					n = self.citeToName(chckd)
+					if n != None:
+						names.append((n, times))
+						if tuple(chckd) not in seen:
+							seen.add(tuple(chckd))
+							cleaned.append(chckd)
+						counts = resolved.setdefault(sec, {})
+						if tuple(chckd) not in counts:
+							counts[tuple(chckd)] = 0
+							order.append((sec, tuple(chckd)))
+						counts[tuple(chckd)] += times
+					else:
+						eC = eC + times
+		#validate all the cited names in one pass over the opinion
+		if names:
+			mentioned = NameIndex(case['txt'])
+			for n, times in names:
+				if mentioned.mentions(n):
+					vC = vC + times
+		if save_text:
+			record = {'name': case['name'], 'url': case['url'], 'txt': case['txt'], 'number': case['number'], 'citations': cleaned, 'vol': case['vol'], 'date': case['date']}
+		else:
+			record = {'name': case['name'], 'url': case['url'], 'number': case['number'], 'citations': cleaned, 'vol': case['vol'], 'date': case['date']}
+		if 'sections' in case:
+			record['sections'] = case['sections']
+			record['citationCounts'] = {}
+			for sec, key in order:
+				record['citationCounts'].setdefault(sec, []).append([key[0], key[1], resolved[sec][key]])
+		return record, [tC, mC, vC, eC]
+
+	def resolveCases(self, save_text, workers=1, chunkSize=64):
+		"""Resolve every case, in corpus order, on a pool of `workers` processes
+		The index is handed to each worker once when the pool starts (with fork it is shared
+		copy-on-write) and the cases are sent over in chunks.
+		Yields:
+			The record, counters and seconds taken of every case
+		"""
+		if workers <= 1:
+			for case in self.cases:
+				yield _timed(self, case, save_text)
+			return
+		pool = multiprocessing.Pool(workers, _initWorker, (self.vols, self.names, save_text))
+		try:
+			for results in pool.imap(_resolveChunk, _chunks(self.cases, chunkSize)):
+				for r in results:
+					yield r
+			pool.close()
+		finally:
+			pool.terminate()
+			pool.join()
+
+	def processText(self, save_text, workers=1, retain=True):
+		"""Scaffold for the class
+		The cases are read twice: once to build the index and once to resolve them, and each
+		record is written to the outfile as soon as it is resolved.
+		Args:
+			save_text: Keep the case text in the citation output
+			workers: Number of processes to resolve the cases on
+			retain: Return the records as a list; otherwise a CaseFile streaming them from the outfile
+		"""
+		self.buildVolCaseList()
+		self.metrics.setTotal(self.count)
+		case_citations = []
+		totals = [0, 0, 0, 0]
+		with JsonArrayWriter(self.outfile) as out:
+			for record, counts, secs in self.resolveCases(save_text, workers):
+				self.metrics.observe('resolve_seconds', secs)
+				self.metrics.caseDone()
+				out.write(record)
+				if retain:
+					case_citations.append(record)
+				#summed in corpus order, the same whatever the number of workers
+				totals = [t + c for t, c in zip(totals, counts)]
+		metrics = self.matchMetrics(*totals)
+		if not retain:
+			case_citations = CaseFile(self.outfile)
 		return case_citations, metrics
 
+#Per process state for citations.resolveCases
+_worker = {}
+
+def _initWorker(vols, names, save_text):
+	cb = citations([], "")
+	cb.vols, cb.names = vols, names
+	_worker['cb'], _worker['save_text'] = cb, save_text
+
+def _resolveChunk(chunk):
+	cb = _worker['cb']
+	return [_timed(cb, case, _worker['save_text']) for case in chunk]
 
+def _timed(cb, case, save_text):
+	start = time.time()
+	record, counts = cb.resolveCase(case, save_text)
+	return record, counts, time.time() - start
 
+def _chunks(cases, size):
+	it = iter(cases)
+	while True:
+		chunk = list(itertools.islice(it, size))
+		if not chunk:
+			return
+		yield chunk
@@ -0,0 +1,5 @@
+server = ''
+frm_addr = ''
+to_addr = ['']
+user = ''
+passw = ''
\ No newline at end of file
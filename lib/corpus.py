@@ -0,0 +1,154 @@
+import json, os
+from store import CorpusStore, isStore
+
+class CaseWriter(object):
+    """Append-only JSON-lines writer for the scraped cases.
+    Every case is written once, on its own line, as soon as it has been scraped.
+    Args:
+        path: The output file
+        resume: Keep the cases already in the file and append after them
+    """
+    def __init__(self, path, resume=False):
+        self.path = path
+        if resume and os.path.exists(path):
+            repair(path)
+            self.fp = open(path, 'ab')
+        else:
+            self.fp = open(path, 'wb')
+
+    def write(self, case):
+        """Append one case and flush it so a killed run loses at most the case in flight"""
+        self.fp.write(json.dumps(case) + "\n")
+        self.fp.flush()
+
+    def close(self):
+        self.fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def repair(path):
+    """Cut off a partially written last line left behind by a crashed run"""
+    with open(path, 'r+b') as fp:
+        fp.seek(0, os.SEEK_END)
+        size = fp.tell()
+        pos = size
+        while pos > 0:
+            step = min(4096, pos)
+            fp.seek(pos - step)
+            chunk = fp.read(step)
+            nl = chunk.rfind("\n")
+            if nl != -1:
+                pos = pos - step + nl + 1
+                break
+            pos = pos - step
+        if pos != size:
+            fp.truncate(pos)
+
+
+class JsonArrayWriter(object):
+    """Writes a JSON array one element at a time, so the whole list never has to be in memory"""
+    def __init__(self, path):
+        self.fp = open(path, 'wb')
+        self.fp.write("[")
+        self.count = 0
+
+    def write(self, item):
+        self.fp.write(",\n" if self.count else "\n")
+        self.fp.write(json.dumps(item, indent=2))
+        self.count += 1
+
+    def close(self):
+        self.fp.write("\n]")
+        self.fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CaseFile(object):
+    """A cases (or citations) file that can be iterated over any number of times.
+    Every iteration streams the cases from disk with readCases, so it stands in for the
+    in-memory case list without holding it.
+    """
+    def __init__(self, path):
+        self.path = path
+
+    def __iter__(self):
+        return readCases(self.path)
+
+
+def iterJsonArray(fp, bufSize=1 << 16):
+    """Incrementally parse a JSON array from a file, yielding one element at a time"""
+    decoder = json.JSONDecoder()
+    buf = fp.read(bufSize).lstrip()
+    if not buf.startswith("["):
+        raise ValueError("Not a JSON array")
+    buf = buf[1:]
+    while True:
+        buf = buf.lstrip()
+        if buf.startswith(","):
+            buf = buf[1:].lstrip()
+        if buf.startswith("]"):
+            return
+        try:
+            if not buf:
+                raise ValueError("Need more data")
+            item, end = decoder.raw_decode(buf)
+        except ValueError:
+            #read at least as much again as is buffered so a big element isn't reparsed too often
+            more = fp.read(max(bufSize, len(buf)))
+            if not more:
+                raise
+            buf = buf + more
+            continue
+        yield item
+        buf = buf[end:]
+
+
+def readCases(path):
+    """Iterate over the cases in a cases file.
+    Reads the JSON-lines output of the scraper, the older single JSON array files and
+    CorpusStore directories, one case at a time. A truncated last line from an interrupted
+    run is skipped.
+    """
+    if isStore(path):
+        for case in CorpusStore(path):
+            yield case
+        return
+    with open(path, 'rb') as fp:
+        head = fp.read(1024).lstrip()
+        fp.seek(0)
+        if head.startswith("["):
+            for case in iterJsonArray(fp):
+                yield case
+            return
+        for line in fp:
+            if not line.strip():
+                continue
+            try:
+                case = json.loads(line)
+            except ValueError:
+                if line.endswith("\n"):
+                    raise
+                return
+            yield case
+
+
+def loadCases(path):
+    """Load every case in a cases file into a list"""
+    return list(readCases(path))
+
+
+def doneUrls(path):
+    """The set of case urls already in a cases file, used to resume a scrape"""
+    if not os.path.exists(path):
+        return set()
+    return set(case['url'] for case in readCases(path))
@@ -0,0 +1,149 @@
+import os, json, gzip
+from array import array
+import numpy as np
+import networkx as nx
+from networkx.readwrite.gml import generate_gml
+
+#Files of a binary graph directory
+INDPTR, INDICES, NODES = "indptr.npy", "indices.npy", "nodes.jsonl"
+VOL, YEAR = "vol", "year"
+#Numeric node attributes written as columns, analytics and layout ones only when the graph has them
+COLUMNS = [(VOL, np.int32), (YEAR, np.int32), ("inDegree", np.int32), ("outDegree", np.int32),
+           ("pagerank", np.float64), ("authority", np.float64), ("hub", np.float64), ("citeAge", np.float64),
+           ("x", np.float64), ("y", np.float64)]
+
+def writeGML(G, paths, batch=1000):
+    """Write a graph as GML to every path in one pass, paths ending in .gz are gzipped
+    Produces the same file as nx.write_gml.
+    """
+    fps = [gzip.open(p, 'wb') if p.endswith('.gz') else open(p, 'wb') for p in paths]
+    try:
+        lines = []
+        for line in generate_gml(G):
+            lines.append(line)
+            if len(lines) >= batch:
+                _writeAll(fps, lines)
+                lines = []
+        _writeAll(fps, lines)
+    finally:
+        for fp in fps:
+            fp.close()
+
+def _writeAll(fps, lines):
+    if not lines:
+        return
+    data = ("\n".join(lines) + "\n").encode('ascii', 'xmlcharrefreplace')
+    for fp in fps:
+        fp.write(data)
+
+def writeNodeLink(G, path):
+    """Stream a graph out as node-link JSON, the same document json_graph.node_link_data gives,
+    one node or link at a time
+    """
+    index = {}
+    with open(path, 'wb') as fp:
+        fp.write('{"directed": %s, "multigraph": false, "graph": %s, "nodes": [' % (json.dumps(G.is_directed()), json.dumps(list(G.graph.items()))))
+        for i, n in enumerate(G):
+            index[n] = i
+            node = dict(G.node[n])
+            node['id'] = n
+            fp.write((", " if i else "") + json.dumps(node))
+        fp.write('], "links": [')
+        sep = ""
+        for u, v, d in G.edges_iter(data=True):
+            link = dict(d)
+            link['source'], link['target'] = index[u], index[v]
+            fp.write(sep + json.dumps(link))
+            sep = ", "
+        fp.write("]}")
+
+def citationArrays(G):
+    """The citations of a graph as CSR arrays: the nodes in graph order, and int32 indptr and
+    indices where the nodes node i cites are indices[indptr[i]:indptr[i + 1]], sorted.
+    The direction comes from the edges' 'by' attribute; edges without one are taken both ways.
+    """
+    nodes = list(G)
+    index = dict((n, i) for i, n in enumerate(nodes))
+    indptr, indices = array('i', [0]), array('i')
+    for n in nodes:
+        indices.extend(sorted(index[v] for v, e in G[n].iteritems() if e.get('by') in (n, '*', None)))
+        indptr.append(len(indices))
+    return nodes, _int32(indptr), _int32(indices)
+
+def _int32(arr):
+    return np.frombuffer(arr, dtype=np.int32) if arr else np.zeros(0, np.int32)
+
+def writeBinary(G, path):
+    """Write a graph as a directory of compact arrays for tools that can't load the JSON:
+        indptr.npy, indices.npy: the citations from citationArrays
+        vol.npy, year.npy: int32 columns of the node attributes (0 for cited nodes not in the corpus)
+        <attribute>.npy: a column for each of the analytics attributes the nodes have
+        nodes.jsonl: the id and attributes of node i on line i
+    """
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    nodes, indptr, indices = citationArrays(G)
+    present = set([VOL, YEAR])
+    with open(os.path.join(path, NODES), 'wb') as fp:
+        for n in nodes:
+            node = dict(G.node[n])
+            present.update(node)
+            node['id'] = n
+            fp.write(json.dumps(node) + "\n")
+    columns = [(name, dtype) for name, dtype in COLUMNS if name in present]
+    np.save(os.path.join(path, INDPTR), indptr)
+    np.save(os.path.join(path, INDICES), indices)
+    for name, dtype in columns:
+        col = np.array([G.node[n].get(name, 0) for n in nodes], dtype=dtype)
+        np.save(os.path.join(path, name + ".npy"), col)
+
+
+class BinaryGraph(object):
+    """A graph written by writeBinary, with the arrays memory-mapped"""
+    def __init__(self, path, mmap=True):
+        self.path = path
+        mode = 'r' if mmap else None
+        self.indptr = np.load(os.path.join(path, INDPTR), mmap_mode=mode)
+        self.indices = np.load(os.path.join(path, INDICES), mmap_mode=mode)
+        self.columns = {}
+        for name, dtype in COLUMNS:
+            col = os.path.join(path, name + ".npy")
+            if os.path.exists(col):
+                self.columns[name] = np.load(col, mmap_mode=mode)
+        self.vol, self.year = self.columns[VOL], self.columns[YEAR]
+        self.nodes = None
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def cites(self, i):
+        """The indices of the nodes node i cites"""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def loadNodes(self):
+        """The node table, read on first use"""
+        if self.nodes is None:
+            with open(os.path.join(self.path, NODES), 'rb') as fp:
+                self.nodes = [json.loads(line) for line in fp]
+        return self.nodes
+
+    def toGraph(self):
+        """Rebuild the networkx graph, with 'by' set from the direction of the citations"""
+        G = nx.Graph()
+        nodes = self.loadNodes()
+        for node in nodes:
+            attrs = dict(node)
+            G.add_node(attrs.pop('id'), **attrs)
+        for i in xrange(len(self)):
+            u = nodes[i]['id']
+            for j in self.cites(i):
+                v = nodes[j]['id']
+                if G.has_edge(u, v):
+                    G[u][v]['by'] = '*' if u != v else u
+                else:
+                    G.add_edge(u, v, by=u)
+        return G
+
+
+def isBinary(path):
+    return os.path.isfile(os.path.join(path, INDPTR))
@@ -0,0 +1,237 @@
+import httplib, urllib2, urlparse, socket, threading, time, zlib, sys, collections
+import Queue
+from metrics import Metrics
+
+#Status codes that are worth another try before giving up on a page
+TRANSIENT = (429, 500, 502, 503, 504)
+REDIRECTS = (301, 302, 303, 307, 308)
+
+class RateLimiter(object):
+    """Spaces out requests so a single host never sees more than `rate` requests a second.
+    A rate of 0 (or None) disables the limit."""
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0
+        self.nextSlot = 0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block until the caller is allowed to make the next request"""
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.time()
+            slot = max(now, self.nextSlot)
+            self.nextSlot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class Fetcher(object):
+    """Shared HTTP client for the scrapers.
+
+    Keeps one keep-alive connection per host per thread, caps the request rate per host,
+    and retries transient errors (5xx, 429, dropped connections) with exponential backoff.
+    Non-transient HTTP errors (e.g. 404) are raised as urllib2.HTTPError like urlopen does.
+
+    With a PageCache every page is kept on disk. Cached pages are revalidated with their
+    ETag/Last-Modified (or served as they are if revalidate is False), and in offline mode
+    only the cache is used and anything missing from it is reported as a 404.
+
+    Request latencies, response statuses, bytes, retries and cache hits go to `metrics`.
+    """
+    def __init__(self, rate=0, retries=3, backoff=0.5, timeout=30, cache=None, offline=False, revalidate=True, metrics=None):
+        self.rate = rate
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache
+        self.offline = offline
+        self.revalidate = revalidate
+        self.metrics = metrics or Metrics()
+        self.headers = {'User-Agent': 'OpenCourt scraper', 'Accept-Encoding': 'gzip'}
+        self.limiters = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def limiter(self, host):
+        """Get the rate limiter for a host"""
+        with self.lock:
+            if host not in self.limiters:
+                self.limiters[host] = RateLimiter(self.rate)
+            return self.limiters[host]
+
+    def connection(self, scheme, host):
+        """Reuse this thread's open connection to the host or open a new one"""
+        conns = self.local.__dict__.setdefault('conns', {})
+        key = (scheme, host)
+        if key not in conns:
+            if scheme == 'https':
+                conns[key] = httplib.HTTPSConnection(host, timeout=self.timeout)
+            else:
+                conns[key] = httplib.HTTPConnection(host, timeout=self.timeout)
+        return conns[key]
+
+    def dropConnection(self, scheme, host):
+        """Close a connection that has gone bad so the next request reconnects"""
+        conns = self.local.__dict__.get('conns', {})
+        conn = conns.pop((scheme, host), None)
+        if conn is not None:
+            conn.close()
+
+    def request(self, url, headers=None):
+        """Make a single GET request, following redirects.
+        Returns:
+            The status, the response headers as a dict and the decoded body
+        """
+        for hop in xrange(5):
+            parts = urlparse.urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path = path + "?" + parts.query
+            hdrs = dict(self.headers)
+            if headers:
+                hdrs.update(headers)
+            self.limiter(parts.netloc).wait()
+            conn = self.connection(parts.scheme, parts.netloc)
+            try:
+                conn.request('GET', path, headers=hdrs)
+                resp = conn.getresponse()
+                body = resp.read()
+            except (httplib.HTTPException, socket.error):
+                self.dropConnection(parts.scheme, parts.netloc)
+                raise
+            respHeaders = dict(resp.getheaders())
+            if resp.getheader('connection', '').lower() == 'close':
+                self.dropConnection(parts.scheme, parts.netloc)
+            if resp.getheader('content-encoding', '') == 'gzip':
+                body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+            if resp.status in REDIRECTS and resp.getheader('location'):
+                url = urlparse.urljoin(url, resp.getheader('location'))
+                continue
+            return resp.status, respHeaders, body
+        raise urllib2.URLError("Too many redirects for " + url)
+
+    def fetch(self, url, headers=None):
+        """Fetch a page, retrying transient errors with backoff.
+        Returns:
+            The page body
+        Raises:
+            urllib2.HTTPError for error statuses and urllib2.URLError when the host can't be reached
+        """
+        if self.cache is not None:
+            return self.fetchCached(url)
+        status, hdrs, body = self.fetchResponse(url, headers)
+        return body
+
+    def fetchCached(self, url):
+        """Serve a page from the page cache, revalidating it or filling it from the web"""
+        entry = self.cache.lookup(url)
+        if entry and (self.offline or not self.revalidate):
+            body = self.cache.get(url)
+            if body is not None:
+                self.metrics.inc('cache', result='hit')
+                return body
+        if self.offline:
+            self.metrics.inc('cache', result='missing')
+            raise urllib2.HTTPError(url, 404, "Not in the page cache", {}, None)
+        cond = {}
+        if entry and entry['etag']:
+            cond['If-None-Match'] = entry['etag']
+        if entry and entry['lastmod']:
+            cond['If-Modified-Since'] = entry['lastmod']
+        status, hdrs, body = self.fetchResponse(url, cond)
+        if status == 304:
+            body = self.cache.get(url)
+            if body is not None:
+                self.metrics.inc('cache', result='revalidated')
+                return body
+            #the cached body is gone, ask for the full page again
+            status, hdrs, body = self.fetchResponse(url)
+        self.metrics.inc('cache', result='miss')
+        self.cache.put(url, body, hdrs.get('etag'), hdrs.get('last-modified'))
+        return body
+
+    def fetchResponse(self, url, headers=None):
+        """Like fetch but also returns the status and response headers"""
+        for attempt in xrange(self.retries + 1):
+            last = attempt == self.retries
+            start = time.time()
+            try:
+                status, hdrs, body = self.request(url, headers)
+            except (httplib.HTTPException, socket.error), e:
+                self.metrics.inc('request_errors')
+                if last:
+                    raise urllib2.URLError(e)
+            else:
+                self.metrics.observe('request_seconds', time.time() - start)
+                self.metrics.inc('responses', status=str(status))
+                self.metrics.inc('bytes', len(body))
+                if status < 400 or (status not in TRANSIENT) or last:
+                    break
+            self.metrics.inc('retries')
+            time.sleep(self.backoff * (2 ** attempt))
+        if status >= 400:
+            raise urllib2.HTTPError(url, status, httplib.responses.get(status, ''), hdrs, None)
+        return status, hdrs, body
+
+
+class _Slot(object):
+    """One item travelling through orderedMap"""
+    def __init__(self, item):
+        self.item = item
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+    def get(self):
+        # wait in short steps so Ctrl-C still gets through in python 2
+        while not self.done.wait(0.5):
+            pass
+        if self.error:
+            raise self.error[0], self.error[1], self.error[2]
+        return self.result
+
+
+def orderedMap(func, iterable, workers=1, window=None):
+    """Apply func to every item using a pool of threads, yielding the results in input order.
+
+    At most `window` items (default twice the workers) are in flight, so the input is
+    consumed lazily and memory stays bounded even for a streaming source.
+    """
+    if workers <= 1:
+        for item in iterable:
+            yield func(item)
+        return
+    window = window or workers * 2
+    tasks = Queue.Queue()
+
+    def work():
+        while True:
+            slot = tasks.get()
+            if slot is None:
+                return
+            try:
+                slot.result = func(slot.item)
+            except Exception:
+                slot.error = sys.exc_info()
+            slot.done.set()
+
+    threads = []
+    for i in xrange(workers):
+        t = threading.Thread(target=work)
+        t.daemon = True
+        t.start()
+        threads.append(t)
+    pending = collections.deque()
+    try:
+        for item in iterable:
+            slot = _Slot(item)
+            pending.append(slot)
+            tasks.put(slot)
+            if len(pending) >= window:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        for t in threads:
+            tasks.put(None)
@@ -2,17 +2,24 @@ import networkx as nx
 from networkx.readwrite import json_graph
 import json
 import re
+import os
 #import matplotlib.pyplot as plt
 import helper
+import exporters
+import analytics
+import layout
 
 #Class for converting Case Citations into Graph
 class GraphBuilder(object):
     """Class to build the network graph using networkX module"""
-    def __init__(self, caseDict, outfile, gml, baseURL):
+    def __init__(self, caseDict, outfile, gml, baseURL, analytics=False, layout=False, tileLevels=4):
       self.caseDict = caseDict
       self.outfile = outfile
       self.gml = gml
       self.baseURL = baseURL
+      self.analytics = analytics
+      self.layout = layout
+      self.tileLevels = tileLevels
 
     def getYear(self, dat):
       """Extract the Year from the Case Date"""
@@ -22,28 +29,188 @@ class GraphBuilder(object):
       else:
         return 0
 
+    def addCase(self, G, case):
+      """Add a case's node and the edges to the cases it cites
+      Each edge records in 'by' the node that cited the other, or '*' if they cite each other,
+      so the graph stays undirected but a case's own citations can be taken out again.
+      """
+      nodeN = str(case['number'])
+      yr = self.getYear(case['date'])
+      if nodeN in G:
+        G.node[nodeN].clear()
+      G.add_node(nodeN, name=case['name'], url=self.baseURL+case['url'], vol=case['vol'], d=case['date'], year=yr)
+      #times each case is cited per section, for records that have the counts
+      counted = {}
+      for sec, cites in case.get('citationCounts', {}).iteritems():
+        for v, p, times in cites:
+          counted.setdefault(str([v, p]), {})[sec] = times
+      for cite in case['citations']:
+        targ = str(cite)
+        if not G.has_edge(nodeN, targ):
+          G.add_edge(nodeN, targ, by=nodeN)
+        elif G[nodeN][targ].get('by') not in (nodeN, None):
+          G[nodeN][targ]['by'] = '*'
+        if targ in counted:
+          self.setCounts(G, nodeN, targ, counted[targ])
+      return nodeN
+
+    def setCounts(self, G, nodeN, targ, counts):
+      """Record on an edge the times nodeN cites targ per section, None to take them out.
+      The edge's 'counts' keeps each end's citations apart, under 'lo' for the citations made
+      by the end with the lower id and 'hi' for the other, and 'weight' is the total.
+      """
+      e = G[nodeN][targ]
+      side = 'lo' if nodeN <= targ else 'hi'
+      both = dict(e.get('counts', {}))
+      if counts:
+        both[side] = dict(counts)
+      else:
+        both.pop(side, None)
+      if both:
+        e['counts'] = both
+        e['weight'] = sum(n for c in both.values() for n in c.values())
+      else:
+        e.pop('counts', None)
+        e.pop('weight', None)
+
+    def removeCitations(self, G, nodeN):
+      """Take the edges for the citations made by a case out of the graph
+      Cited nodes that are not cases in the corpus and are left without edges go too.
+      Edges from graphs built before 'by' was recorded are kept.
+      """
+      for nbr in G.neighbors(nodeN):
+        by = G[nodeN][nbr].get('by')
+        if by == '*':
+          G[nodeN][nbr]['by'] = nbr
+          self.setCounts(G, nodeN, nbr, None)
+        elif by == nodeN:
+          G.remove_edge(nodeN, nbr)
+          if nbr != nodeN and 'name' not in G.node[nbr] and not G.degree(nbr):
+            G.remove_node(nbr)
+
+    def snapshot(self, G, nodes):
+      """The attributes of some nodes and their neighbours, and the edges touching the nodes"""
+      attrs, links = {}, {}
+      for n in nodes:
+        if n not in G:
+          continue
+        attrs[n] = dict(G.node[n])
+        for nbr, e in G[n].iteritems():
+          attrs[nbr] = dict(G.node[nbr])
+          links[frozenset((n, nbr))] = (n, nbr, e.get('by'))
+      return attrs, links
+
+    def loadGraph(self):
+      """Load the graph written by an earlier run, from the .json, the .gml or the binary directory,
+      whichever is found first. Returns an empty graph if there is none.
+      """
+      base = 'vis/'+self.outfile
+      if os.path.exists(base+'.json'):
+        with open(base+'.json') as fp:
+          return json_graph.node_link_graph(json.load(fp))
+      if os.path.exists(base+'.gml'):
+        return nx.read_gml(base+'.gml', relabel=True)
+      if exporters.isBinary(base+'_csr'):
+        return exporters.BinaryGraph(base+'_csr').toGraph()
+      return nx.Graph()
+
+    def writeGraph(self, G):
+      """Write the graph out in the selected formats
+      0 = .json, 1 = .gml and .gml.gz, 2 = .json and .gml, 3 = binary _csr directory, 4 = all
+      With analytics on, the metrics are computed first so every format carries them and
+      the summary goes to <outfile>.analytics.json. With layout on, every node gets an x and y
+      and the level of detail tiles go to the <outfile>_tiles directory.
+      """
+      base = 'vis/'+self.outfile
+      if self.analytics:
+        analytics.writeAnalytics(analytics.analyze(G), base+'.analytics.json')
+      if self.layout:
+        layout.layoutGraph(G)
+        if self.tileLevels:
+          layout.writeTiles(G, base+'_tiles', self.tileLevels)
+      if self.gml in (1, 2, 4):
+        exporters.writeGML(G, [base+'.gml', base+'.gml.gz'])
+      if self.gml in (0, 2, 4):
+        exporters.writeNodeLink(G, base+'.json')
+      if self.gml in (3, 4):
+        exporters.writeBinary(G, base+'_csr')
+
     def drawGraph(self):
          """Build a Network graph from the citations in a json-derived dictionary"""
          G=nx.Graph()
          cD = self.caseDict
-         print "Number of Cases: " + str(len(cD))
-         #Iterate through cases to create Nodes and a volume dictionary to check cases against
+         n = 0
+         #Iterate through cases to create Nodes and edges
          for case in cD:
-              #nodeN= str(case['number'][0])
-              c = case['number']
-              nodeN= str(c)
-              yr = self.getYear(case['date'])
-              G.add_node(nodeN, name=case['name'], url=self.baseURL+case['url'], vol=case['vol'], d=case['date'], year=yr)
-              #Iterate through cases to build edges
-              for cite in case['citations']:
-                  targ = str(cite)
-                  G.add_edge(nodeN, targ)
-
-         if self.gml == 1 or self.gml == 2:
-              nx.write_gml(G,'vis/'+self.outfile+'.gml')
-              nx.write_gml(G,'vis/'+self.outfile+'.gml.gz')
-         if self.gml != 1:
-              d = json_graph.node_link_data(G)
-              json.dump(d, open('vis/'+self.outfile+'.json','w'))
+              n = n + 1
+              self.addCase(G, case)
+         print "Number of Cases: " + str(n)
+
+         self.writeGraph(G)
          #nx.draw(G)
          #plt.savefig("network.png")
+         return G
+
+    def refreshGraph(self):
+         """Write the graph from an earlier run out again without rebuilding it, so the analytics
+         and layout are redone on it
+         """
+         G = self.loadGraph()
+         self.writeGraph(G)
+         return G
+
+    def knownCases(self, G):
+         """The (number, name) of every case in a graph, for the citations of an update to
+         resolve to"""
+         return [(json.loads(n), d['name']) for n, d in G.nodes_iter(data=True) if 'name' in d]
+
+    def updateGraph(self, G=None):
+         """Update the graph from an earlier run (or G, if it was loaded already) with the cases
+         in caseDict, which are added or replace the cases with the same number; only those
+         cases' nodes and edges are touched.
+         Writes the updated graph and a <outfile>.delta.json of the nodes and links that changed.
+         Only the merge and the delta scale with the cases updated: loading and writing the graph,
+         the analytics and the layout still go over the whole graph.
+         """
+         if G is None:
+              G = self.loadGraph()
+         cases = list(self.caseDict)
+         changed = set(str(case['number']) for case in cases)
+         beforeAttrs, beforeLinks = self.snapshot(G, changed)
+         #take out all the old citations first so a case listed twice keeps both sets of edges
+         for nodeN in changed:
+              if nodeN in G:
+                   self.removeCitations(G, nodeN)
+         for case in cases:
+              self.addCase(G, case)
+              #keep the position from the last layout for the next one to start from
+              old = beforeAttrs.get(str(case['number']), {})
+              if self.layout and 'x' in old:
+                   G.node[str(case['number'])].update(x=old['x'], y=old['y'])
+         afterAttrs, afterLinks = self.snapshot(G, changed)
+         print "Cases updated: " + str(len(cases))
+
+         delta = {'nodes': {'added': [], 'updated': [], 'removed': []},
+                  'links': {'added': [], 'updated': [], 'removed': []}}
+         for n in set(beforeAttrs) | set(afterAttrs):
+              if n not in afterAttrs:
+                   delta['nodes']['removed'].append(n)
+              elif n not in beforeAttrs:
+                   delta['nodes']['added'].append(dict(afterAttrs[n], id=n))
+              elif afterAttrs[n] != beforeAttrs[n]:
+                   delta['nodes']['updated'].append(dict(afterAttrs[n], id=n))
+         for k in set(beforeLinks) | set(afterLinks):
+              if k not in afterLinks:
+                   s, t, by = beforeLinks[k]
+                   delta['links']['removed'].append({'source': s, 'target': t})
+              else:
+                   s, t, by = afterLinks[k]
+                   if k not in beforeLinks:
+                        delta['links']['added'].append({'source': s, 'target': t, 'by': by})
+                   elif by != beforeLinks[k][2]:
+                        delta['links']['updated'].append({'source': s, 'target': t, 'by': by})
+
+         self.writeGraph(G)
+         with open('vis/'+self.outfile+'.delta.json','w') as fp:
+              json.dump(delta, fp)
+         return G, delta
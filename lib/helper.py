@@ -1,20 +1,30 @@
-import smtplib
-import config
+import smtplib, threading, Queue
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
-def sendEmail(per, num, total, startTime):
-    """Sends out periodic emails during the scraping processs"""
+def loadConfig():
+    """The SMTP settings from lib/config.py, only needed once an email is sent"""
+    import config
+    return config
+
+def progressMessage(per, num, total, startTime):
+    """Subject and text of a progress email"""
     if num == 0:
         subject = "Volumes Scraped Starting Case Scraper"
         text = "There are " + str(total) + " cases to scrape started at " + str(startTime)
     else:
         subject = 'Your Script is through '+str(per)+ '% ('+str(num)+'/'+str(total)+ ') cases'
         text = "You are now "+str(per)+"% complete with the crawl start was started at "+  str(startTime)
-    emailSend(subject, text)
+    return subject, text
+
+def sendEmail(per, num, total, startTime):
+    """Sends out periodic emails during the scraping processs"""
+    emailSend(*progressMessage(per, num, total, startTime))
 
-def emailSend(subject, text, smtpserver=config.server):
+def emailSend(subject, text, smtpserver=None):
     """Server Configuration for the sendEmail"""
+    config = loadConfig()
+    smtpserver = smtpserver or config.server
     html = "<p>"+text+"</p>"
     part1 = MIMEText(text, 'plain')
     part2 = MIMEText(html, 'html')
@@ -30,4 +40,39 @@ def emailSend(subject, text, smtpserver=config.server):
     server.starttls()
     server.login(config.user, config.passw)
     problems = server.sendmail(frm, to_add, message.as_string())
-    server.quit()
\ No newline at end of file
+    server.quit()
+
+
+class Notifier(object):
+    """Sends notifications from a background thread so the caller never waits on SMTP.
+    A failed send is printed and dropped.
+    Args:
+        send: Function taking (subject, text), emailSend by default
+    """
+    def __init__(self, send=None):
+        self.send = send or emailSend
+        self.queue = Queue.Queue()
+        self.thread = threading.Thread(target=self.run)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def notify(self, subject, text):
+        self.queue.put((subject, text))
+
+    def progress(self, per, num, total, startTime):
+        self.notify(*progressMessage(per, num, total, startTime))
+
+    def run(self):
+        while True:
+            msg = self.queue.get()
+            if msg is None:
+                return
+            try:
+                self.send(*msg)
+            except Exception, e:
+                print "Notification failed: " + str(e)
+
+    def close(self, timeout=60):
+        """Send what is queued, waiting at most timeout seconds"""
+        self.queue.put(None)
+        self.thread.join(timeout)
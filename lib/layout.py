@@ -0,0 +1,149 @@
+import os, json, shutil
+import numpy as np
+from exporters import citationArrays
+
+#Canvas of the old D3 pre-renderer
+WIDTH, HEIGHT = 5000, 4000
+
+def _kernel(grid, k):
+    """FFT of the repulsive force k^2/d (pointing away) between grid cells, for a 2*grid padded convolution"""
+    off = np.fft.fftfreq(2 * grid, 1.0) * 2 * grid / float(grid)
+    dx, dy = np.meshgrid(off, off, indexing='ij')
+    r2 = dx * dx + dy * dy
+    r2[0, 0] = np.inf
+    return np.fft.rfft2(k * k * dx / r2), np.fft.rfft2(k * k * dy / r2)
+
+def forceLayout(indptr, indices, iterations=100, grid=None, init=None, seed=1, gravity=1.0):
+    """Fruchterman-Reingold force layout of a CSR graph, vectorized with NumPy.
+
+    Attraction runs along every edge. Repulsion between all pairs of nodes is approximated
+    particle-mesh style: nodes are binned on a grid and the grid is convolved with the
+    repulsive force by FFT, so an iteration is O(nodes + edges + grid^2 log grid) rather than
+    O(nodes^2). Nodes sharing a cell don't repel, the grid defaults to about one cell per node.
+    Args:
+        init: Starting positions in the unit square, rows of NaN for nodes to place at random
+    Returns:
+        An (n, 2) array of positions in the unit square
+    """
+    n = len(indptr) - 1
+    rng = np.random.RandomState(seed)
+    pos = rng.rand(n, 2)
+    temp = 0.1
+    if init is not None:
+        known = ~np.isnan(init).any(axis=1)
+        pos[known] = init[known]
+        #a layout that is mostly placed already only needs settling
+        if known.mean() > 0.5:
+            temp = 0.02
+    if n < 2:
+        return pos
+    src = np.repeat(np.arange(n), np.diff(indptr))
+    dst = np.asarray(indices)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    k = np.sqrt(1.0 / n)
+    if grid is None:
+        grid = int(min(256, max(16, 2 ** np.ceil(np.log2(np.sqrt(n))))))
+    fkx, fky = _kernel(grid, k)
+    cool = temp / float(iterations + 1)
+    for it in xrange(iterations):
+        #work in the unit square of the bulk of the nodes so the grid covers the layout
+        lo, span = _box(pos)
+        pos = (pos - lo) / span
+        cells = np.clip((pos * grid).astype(np.int64), 0, grid - 1)
+        flat = cells[:, 0] * grid + cells[:, 1]
+        rho = np.zeros((2 * grid, 2 * grid))
+        rho[:grid, :grid] = np.bincount(flat, minlength=grid * grid).reshape(grid, grid)
+        frho = np.fft.rfft2(rho)
+        fx = np.fft.irfft2(frho * fkx, rho.shape)[:grid, :grid].ravel()[flat]
+        fy = np.fft.irfft2(frho * fky, rho.shape)[:grid, :grid].ravel()[flat]
+        #gravity keeps loosely connected nodes from drifting off and squeezing the rest
+        disp = np.column_stack((fx, fy)) - gravity * (pos - 0.5)
+        if len(src):
+            d = pos[dst] - pos[src]
+            pull = d * (np.sqrt((d * d).sum(axis=1)) / k)[:, None]
+            for c in (0, 1):
+                disp[:, c] += np.bincount(src, pull[:, c], n) - np.bincount(dst, pull[:, c], n)
+        length = np.maximum(np.sqrt((disp * disp).sum(axis=1)), 1e-12)
+        pos = pos + disp * (np.minimum(length, temp) / length)[:, None]
+        temp -= cool
+    lo, span = _box(pos)
+    return np.clip((pos - lo) / span, 0, 1)
+
+def _box(pos, keep=99.0):
+    """The corner and side of the square holding `keep` percent of the nodes, so a few
+    stragglers can't squeeze everyone else into a corner of the canvas"""
+    lo = np.percentile(pos, (100 - keep) / 2, axis=0)
+    hi = np.percentile(pos, 100 - (100 - keep) / 2, axis=0)
+    span = max((hi - lo).max(), 1e-9)
+    #centered on the narrower axis
+    return (lo + hi - span) / 2, span
+
+def layoutGraph(G, iterations=100, width=WIDTH, height=HEIGHT):
+    """Lay out a graph and set the x and y of every node, in pixels of a width x height canvas
+    Nodes placed by an earlier run start where they were.
+    """
+    nodes, indptr, indices = citationArrays(G)
+    init = np.array([(G.node[v].get('x', np.nan), G.node[v].get('y', np.nan)) for v in nodes], dtype=float).reshape(-1, 2)
+    init /= (width, height)
+    pos = forceLayout(indptr, indices, iterations, init=init)
+    for i, v in enumerate(nodes):
+        G.node[v]['x'] = round(float(pos[i, 0]) * width, 1)
+        G.node[v]['y'] = round(float(pos[i, 1]) * height, 1)
+    return nodes, pos
+
+def writeTiles(G, path, levels=4, perTile=500, width=WIDTH, height=HEIGHT):
+    """Write the laid out graph as level of detail tiles for a browser to load what is in view:
+    <path>/<z>/<tx>_<ty>.json for zoom levels z = 0 .. levels - 1, each level splitting the
+    canvas into 2^z x 2^z tiles. A tile holds its most important nodes (PageRank from the
+    analytics, else degree), at most perTile of them except on the last level which has every
+    node, and the links between the nodes shown at that level that start in the tile.
+    An index.json describes the levels.
+    """
+    nodes, indptr, indices = citationArrays(G)
+    n = len(nodes)
+    x = np.array([G.node[v].get('x', 0) for v in nodes], dtype=float)
+    y = np.array([G.node[v].get('y', 0) for v in nodes], dtype=float)
+    if n and 'pagerank' in G.node[nodes[0]]:
+        weight = np.array([G.node[v].get('pagerank', 0) for v in nodes])
+    else:
+        weight = np.array([G.degree(v) for v in nodes], dtype=float)
+    #most important first, so a tile's first perTile nodes are the ones to show
+    order = np.argsort(-weight, kind='mergesort')
+    src = np.repeat(np.arange(n), np.diff(indptr))
+    index = {'width': width, 'height': height, 'levels': []}
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    for z in xrange(levels):
+        side = 2 ** z
+        tx = np.minimum((x * side / width).astype(int), side - 1)[order]
+        ty = np.minimum((y * side / height).astype(int), side - 1)[order]
+        tile = tx * side + ty
+        #rank of each node within its tile, in order of importance
+        byTile = np.argsort(tile, kind='mergesort')
+        starts = np.searchsorted(tile[byTile], tile[byTile])
+        rank = np.empty(n, np.int64)
+        rank[byTile] = np.arange(n) - starts
+        shown = np.zeros(n, bool)
+        shown[order] = (rank < perTile) | (z == levels - 1)
+        nodeTile = np.empty(n, np.int64)
+        nodeTile[order] = tile
+        linked = shown[src] & shown[indices]
+        tiles = {}
+        for i in np.nonzero(shown)[0]:
+            attrs = G.node[nodes[i]]
+            tiles.setdefault(nodeTile[i], {'nodes': [], 'links': []})['nodes'].append(
+                {'id': nodes[i], 'x': attrs.get('x'), 'y': attrs.get('y'), 'name': attrs.get('name'), 'year': attrs.get('year'), 'w': float(weight[i])})
+        for s, t in zip(src[linked], indices[linked]):
+            tiles[nodeTile[s]]['links'].append([nodes[s], nodes[t]])
+        folder = os.path.join(path, str(z))
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        for t, data in tiles.iteritems():
+            with open(os.path.join(folder, "%d_%d.json" % (t // side, t % side)), 'w') as fp:
+                json.dump(data, fp)
+        index['levels'].append({'zoom': z, 'tiles': side, 'tileWidth': width / float(side), 'tileHeight': height / float(side),
+                                'nodes': int(shown.sum()), 'files': len(tiles)})
+    with open(os.path.join(path, "index.json"), 'w') as fp:
+        json.dump(index, fp, indent=2)
+    return index
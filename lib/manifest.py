@@ -0,0 +1,88 @@
+import os, json, hashlib, time
+
+LIB = os.path.dirname(os.path.abspath(__file__))
+
+#The lib modules whose code each pipeline stage's output depends on.
+#Which raw pages are fetched depends on the scraper's sub page urls and the suffix map,
+#changes to the fetcher don't change them. The cases carry the citations the scraper extracts.
+CODE = {
+    'pages': ['scrapers', 'suffixes'],
+    'cases': ['scrapers', 'corpus', 'citation_builders'],
+    'citations': ['citation_builders', 'corpus', 'store'],
+    'graph': ['grapher', 'exporters', 'layout'],
+    'analytics': ['analytics'],
+    'textindex': ['textindex', 'corpus', 'store'],
+}
+
+def fileHash(path, blockSize=1 << 20):
+    """sha1 of a file's content, None for a directory"""
+    if os.path.isdir(path):
+        return None
+    h = hashlib.sha1()
+    with open(path, 'rb') as fp:
+        block = fp.read(blockSize)
+        while block:
+            h.update(block)
+            block = fp.read(blockSize)
+    return h.hexdigest()
+
+def codeHash(modules):
+    """sha1 over the source of lib modules"""
+    h = hashlib.sha1()
+    for m in sorted(modules):
+        h.update(m)
+        with open(os.path.join(LIB, m + ".py"), 'rb') as fp:
+            h.update(fp.read())
+    return h.hexdigest()
+
+
+class Manifest(object):
+    """Records what every pipeline artifact was built from, so a run only redoes the stages
+    whose inputs, parameters or code have changed.
+
+    A stage's key hashes the code of its modules (CODE), its parameters and its inputs, which
+    are the keys of upstream stages or the content hashes of upstream outputs. A stage is up to
+    date when its recorded key matches and its outputs are still there, unchanged.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.stages = {}
+        if os.path.exists(path):
+            with open(path) as fp:
+                self.stages = json.load(fp)
+
+    def key(self, stage, params=None, inputs=None):
+        """The key of a stage run with these parameters and inputs by the current code"""
+        data = {'stage': stage, 'code': codeHash(CODE[stage]), 'params': params or {}, 'inputs': inputs or []}
+        return hashlib.sha1(json.dumps(data, sort_keys=True)).hexdigest()
+
+    def fresh(self, stage, key):
+        """Check if a stage's recorded outputs were built with this key and are unchanged"""
+        entry = self.stages.get(stage)
+        if entry is None or entry['key'] != key:
+            return False
+        for path, digest in entry['outputs'].iteritems():
+            if not os.path.exists(path) or (digest is not None and fileHash(path) != digest):
+                return False
+        return True
+
+    def output(self, stage, path):
+        """The recorded content hash of a stage output, to use as the input of the next stage,
+        None if the stage didn't write it"""
+        return self.stages[stage]['outputs'].get(path)
+
+    def record(self, stage, key, outputs):
+        """Note that a stage was run with this key and wrote these files (or directories).
+        A stage that wrote none of its outputs isn't recorded as built, so it runs again."""
+        written = dict((p, fileHash(p)) for p in outputs if os.path.exists(p))
+        if outputs and not written:
+            self.stages.pop(stage, None)
+        else:
+            self.stages[stage] = {'key': key, 'outputs': written, 'time': time.strftime("%Y-%m-%d %H:%M:%S")}
+        self.save()
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w') as fp:
+            json.dump(self.stages, fp, indent=2, sort_keys=True)
+        os.rename(tmp, self.path)
@@ -0,0 +1,187 @@
+import os, json, time, threading
+from contextlib import contextmanager
+
+#Upper bounds in seconds of the latency histogram buckets, as in a Prometheus histogram
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+PREFIX = "opencourt_"
+
+class Histogram(object):
+    """Counts of observations at or under each bucket bound, with their sum"""
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total, out = 0, []
+        for c in self.counts:
+            total += c
+            out.append(total)
+        return out
+
+
+def _labels(labels):
+    return tuple(sorted(labels.iteritems()))
+
+def _bound(b):
+    return "+Inf" if b == float('inf') else repr(b)
+
+
+class Metrics(object):
+    """Thread-safe counters, histograms and phase timers for a run.
+
+    With a path, start() rewrites a JSON snapshot there and a Prometheus textfile (the path
+    with a .prom extension) every `interval` seconds from a background thread, and stop()
+    writes the final one. Without a path everything is just counted.
+    caseDone() counts the cases of the current phase, which against `total` (if the phase
+    knows how many cases it has) gives the rate and ETA.
+    """
+    def __init__(self, path=None, interval=10):
+        self.path = path
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+        self.phases = {}
+        self.started = time.time()
+        self.current = None
+        self.total = None
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def inc(self, name, value=1, **labels):
+        key = _labels(labels)
+        with self.lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = _labels(labels)
+        with self.lock:
+            series = self.histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram()
+            series[key].observe(value)
+
+    def count(self, name, **labels):
+        with self.lock:
+            return self.counters.get(name, {}).get(_labels(labels), 0)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Observe the time the block takes in the histogram `name`"""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.observe(name, time.time() - start, **labels)
+
+    @contextmanager
+    def phase(self, name):
+        """Time a phase of the run; a phase still running shows its time so far"""
+        with self.lock:
+            self.phases[name] = [time.time(), None]
+            self.current, self.total = name, None
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.phases[name][1] = time.time()
+
+    def setTotal(self, n):
+        """The number of cases the current phase has, or at most has"""
+        with self.lock:
+            self.total = n if self.total is None else min(self.total, n)
+
+    def caseDone(self):
+        self.inc('cases', phase=self.current or "run")
+
+    def progress(self):
+        """Cases done in the current phase, cases per second over the phase and the seconds
+        left if the total is known"""
+        with self.lock:
+            start = self.phases[self.current][0] if self.current else self.started
+        done = self.count('cases', phase=self.current or "run")
+        elapsed = max(time.time() - start, 1e-9)
+        rate = done / elapsed
+        eta = None
+        if self.total is not None and rate > 0:
+            eta = max(self.total - done, 0) / rate
+        return done, rate, eta
+
+    def snapshot(self):
+        """All the metrics as a JSON-able dict"""
+        done, rate, eta = self.progress()
+        now = time.time()
+        with self.lock:
+            counters = dict((name, [dict(k, value=v) for k, v in sorted(series.iteritems())]) for name, series in self.counters.iteritems())
+            histograms = dict((name, [dict(k, buckets=dict(zip(map(_bound, h.buckets), h.cumulative())), sum=h.sum, count=h.count)
+                                      for k, h in sorted(series.iteritems())]) for name, series in self.histograms.iteritems())
+            phases = dict((name, (end or now) - start) for name, (start, end) in self.phases.iteritems())
+        return {'time': now, 'elapsed': now - self.started, 'phase': self.current, 'cases': done, 'total': self.total, 'casesPerSecond': rate,
+                'eta': eta, 'phases': phases, 'counters': counters, 'histograms': histograms}
+
+    def prometheus(self, snap=None):
+        """The metrics in the Prometheus text exposition format"""
+        snap = snap or self.snapshot()
+        lines = ["# TYPE %sphase_seconds gauge" % PREFIX]
+        for name, secs in sorted(snap['phases'].iteritems()):
+            lines.append('%sphase_seconds{phase="%s"} %f' % (PREFIX, name, secs))
+        lines.append("# TYPE %scases_per_second gauge" % PREFIX)
+        lines.append("%scases_per_second %f" % (PREFIX, snap['casesPerSecond']))
+        if snap['eta'] is not None:
+            lines.append("# TYPE %seta_seconds gauge" % PREFIX)
+            lines.append("%seta_seconds %f" % (PREFIX, snap['eta']))
+        for name, series in sorted(snap['counters'].iteritems()):
+            lines.append("# TYPE %s%s_total counter" % (PREFIX, name))
+            for s in series:
+                labels = ",".join('%s="%s"' % (k, v) for k, v in sorted(s.iteritems()) if k != 'value')
+                lines.append("%s%s_total%s %s" % (PREFIX, name, "{%s}" % labels if labels else "", s['value']))
+        for name, series in sorted(snap['histograms'].iteritems()):
+            lines.append("# TYPE %s%s histogram" % (PREFIX, name))
+            for s in series:
+                labels = [('%s="%s"' % (k, v)) for k, v in sorted(s.iteritems()) if k not in ('buckets', 'sum', 'count')]
+                for bound in map(_bound, BUCKETS):
+                    lines.append('%s%s_bucket{%s} %d' % (PREFIX, name, ",".join(labels + ['le="%s"' % bound]), s['buckets'][bound]))
+                tail = "{%s}" % ",".join(labels) if labels else ""
+                lines.append("%s%s_sum%s %f" % (PREFIX, name, tail, s['sum']))
+                lines.append("%s%s_count%s %d" % (PREFIX, name, tail, s['count']))
+        return "\n".join(lines) + "\n"
+
+    def write(self):
+        """Rewrite the JSON and Prometheus files, each replaced atomically"""
+        if not self.path:
+            return
+        snap = self.snapshot()
+        prom = os.path.splitext(self.path)[0] + ".prom"
+        for path, data in ((self.path, json.dumps(snap, indent=2)), (prom, self.prometheus(snap))):
+            with open(path + ".tmp", 'w') as fp:
+                fp.write(data)
+            os.rename(path + ".tmp", path)
+
+    def start(self):
+        """Write the files every interval from a background thread"""
+        if self.path and self.thread is None:
+            self.thread = threading.Thread(target=self.run)
+            self.thread.daemon = True
+            self.thread.start()
+        return self
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.write()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+        self.write()
@@ -0,0 +1,271 @@
+import os, json, mmap, re, urlparse
+from array import array
+import BaseHTTPServer, SocketServer
+import numpy as np
+import exporters
+from networkx.readwrite import json_graph
+
+#Files of a query index directory
+FWD_INDPTR, FWD_INDICES = "fwd_indptr.npy", "fwd_indices.npy"
+REV_INDPTR, REV_INDICES = "rev_indptr.npy", "rev_indices.npy"
+KEYS, KEY_NODES, YEAR, IN_DEGREE = "keys.npy", "key_nodes.npy", "year.npy", "in_degree.npy"
+NODES, NODE_OFFSETS = "nodes.jsonl", "node_offsets.npy"
+
+CITE = re.compile(r'^\D*(\d+)\D+?(\d+)\D*$')
+
+def caseKey(vol, page):
+    """The int64 sort key of a case number"""
+    return (int(vol) << 20) | int(page)
+
+def parseCite(text):
+    """Read a case number written as "347 U.S. 483", "347/483" or "[347, 483]"
+    Returns:
+        (volume, page), or None if the text isn't one
+    """
+    m = CITE.match(text.strip())
+    if m is None:
+        return None
+    return int(m.group(1)), int(m.group(2))
+
+def loadGraph(path):
+    """Load the GraphBuilder output at a prefix like vis/graph: the binary _csr directory if there
+    is one, else the node-link .json
+    Returns:
+        The node attribute dicts (with 'id') and the forward int32 CSR arrays
+    """
+    if exporters.isBinary(path + '_csr'):
+        bg = exporters.BinaryGraph(path + '_csr', False)
+        return bg.loadNodes(), np.asarray(bg.indptr), np.asarray(bg.indices)
+    with open(path + '.json') as fp:
+        G = json_graph.node_link_graph(json.load(fp))
+    nodes, indptr, indices = exporters.citationArrays(G)
+    return [dict(G.node[n], id=n) for n in nodes], indptr, indices
+
+def reverse(indptr, indices, n):
+    """The transpose of a CSR adjacency: the nodes citing node i, sorted"""
+    rows = np.repeat(np.arange(n, dtype=np.int32), np.diff(indptr))
+    order = np.lexsort((rows, indices))
+    counts = np.bincount(indices, minlength=n)
+    revPtr = np.zeros(n + 1, np.int32)
+    np.cumsum(counts, out=revPtr[1:])
+    return revPtr, rows[order].astype(np.int32)
+
+def buildIndex(graph, path):
+    """Precompute the query index for the graph output at prefix `graph` into directory `path`
+    Returns:
+        The number of nodes indexed
+    """
+    nodes, indptr, indices = loadGraph(graph)
+    n = len(nodes)
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    keys, offsets = array('l'), array('l', [0])
+    with open(os.path.join(path, NODES), 'wb') as fp:
+        for node in nodes:
+            cite = parseCite(node['id'])
+            keys.append(caseKey(*cite) if cite else -1)
+            line = json.dumps(node) + "\n"
+            fp.write(line)
+            offsets.append(offsets[-1] + len(line))
+    keys = np.array(keys, dtype=np.int64)
+    order = np.argsort(keys, kind='mergesort').astype(np.int32)
+    revPtr, revIdx = reverse(indptr, indices, n)
+    years = np.array([node.get('year', 0) for node in nodes], dtype=np.int32)
+    for name, arr in ((FWD_INDPTR, indptr), (FWD_INDICES, indices), (REV_INDPTR, revPtr), (REV_INDICES, revIdx),
+                      (KEYS, keys[order]), (KEY_NODES, order), (YEAR, years),
+                      (IN_DEGREE, np.diff(revPtr).astype(np.int32)), (NODE_OFFSETS, np.array(offsets, dtype=np.int64))):
+        np.save(os.path.join(path, name), arr)
+    return n
+
+
+class CitationIndex(object):
+    """Memory-mapped forward and reverse citation index for answering queries without
+    loading the graph. Case numbers are found by binary search over the sorted keys and the
+    node table is read a line at a time.
+    """
+    def __init__(self, path):
+        self.root = path
+        load = lambda name: np.load(os.path.join(path, name), mmap_mode='r')
+        self.fwd = load(FWD_INDPTR), load(FWD_INDICES)
+        self.rev = load(REV_INDPTR), load(REV_INDICES)
+        self.keys, self.keyNodes = load(KEYS), load(KEY_NODES)
+        self.year, self.inDegree = load(YEAR), load(IN_DEGREE)
+        self.offsets = load(NODE_OFFSETS)
+        self.fp = open(os.path.join(path, NODES), 'rb')
+        size = os.fstat(self.fp.fileno()).st_size
+        self.table = mmap.mmap(self.fp.fileno(), 0, access=mmap.ACCESS_READ) if size else ""
+
+    def __len__(self):
+        return len(self.year)
+
+    def find(self, vol, page):
+        """The node of a case number, or None if it isn't in the graph"""
+        key = caseKey(vol, page)
+        i = np.searchsorted(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            return int(self.keyNodes[i])
+        return None
+
+    def node(self, i):
+        """The id and attributes of a node"""
+        return json.loads(self.table[self.offsets[i]:self.offsets[i + 1]])
+
+    def neighbors(self, i, direction="out"):
+        indptr, indices = self.fwd if direction == "out" else self.rev
+        return indices[indptr[i]:indptr[i + 1]]
+
+    def expand(self, frontier, direction):
+        """Every (node, neighbor) pair of the frontier nodes, as two arrays"""
+        dirs = ("out", "in") if direction == "both" else (direction,)
+        srcs, nbrs = [], []
+        for d in dirs:
+            indptr, indices = self.fwd if d == "out" else self.rev
+            starts, ends = indptr[frontier], indptr[frontier + 1]
+            counts = ends - starts
+            if counts.sum() == 0:
+                continue
+            srcs.append(np.repeat(frontier, counts))
+            #positions of every neighbor: a run of starts[k] .. ends[k] per frontier node
+            pos = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(starts, counts)
+            nbrs.append(np.asarray(indices[pos]))
+        if not srcs:
+            return np.zeros(0, np.int32), np.zeros(0, np.int32)
+        return np.concatenate(srcs), np.concatenate(nbrs)
+
+    def cites(self, i):
+        """The cases a case cites"""
+        return [int(j) for j in self.neighbors(i, "out")]
+
+    def citedBy(self, i):
+        """The cases citing a case"""
+        return [int(j) for j in self.neighbors(i, "in")]
+
+    def hops(self, i, k, direction="out"):
+        """The cases within k citations of a case, following citations out, in or both ways
+        Returns:
+            A list of (node, distance) with the case itself left out, nearest first
+        """
+        dist = np.full(len(self), -1, np.int32)
+        dist[i] = 0
+        frontier = np.array([i], np.int32)
+        found = []
+        for d in xrange(1, k + 1):
+            srcs, nbrs = self.expand(frontier, direction)
+            nbrs = np.unique(nbrs)
+            frontier = nbrs[dist[nbrs] == -1]
+            if not len(frontier):
+                break
+            dist[frontier] = d
+            found.extend((int(j), d) for j in frontier)
+        return found
+
+    def path(self, a, b, direction="out", maxHops=50):
+        """The shortest chain of citations from case a to case b, or None if there is none"""
+        parent = np.full(len(self), -1, np.int32)
+        parent[a] = a
+        frontier = np.array([a], np.int32)
+        for d in xrange(maxHops):
+            if parent[b] != -1:
+                break
+            srcs, nbrs = self.expand(frontier, direction)
+            new = parent[nbrs] == -1
+            nbrs, first = np.unique(nbrs[new], return_index=True)
+            if not len(nbrs):
+                return None
+            parent[nbrs] = srcs[new][first]
+            frontier = nbrs
+        if parent[b] == -1:
+            return None
+        chain = [b]
+        while chain[-1] != a:
+            chain.append(int(parent[chain[-1]]))
+        return chain[::-1]
+
+    def top(self, n=10, start=None, end=None):
+        """The most cited cases decided between the years start and end (inclusive)"""
+        mask = self.year > 0
+        if start is not None:
+            mask &= self.year >= start
+        if end is not None:
+            mask &= self.year <= end
+        #candidates in case number order, so ties are broken by case number
+        keyNodes = np.asarray(self.keyNodes)
+        cand = keyNodes[mask[keyNodes]]
+        best = cand[np.argsort(-np.asarray(self.inDegree[cand]), kind='mergesort')[:n]]
+        return [(int(i), int(self.inDegree[i])) for i in best]
+
+    def close(self):
+        if self.table:
+            self.table.close()
+        self.fp.close()
+
+
+def isIndex(path):
+    return os.path.isfile(os.path.join(path, KEYS))
+
+
+class QueryHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """JSON API over a CitationIndex:
+        /cites?case=347/483  /citedby?case=  /hops?case=&k=2&dir=out|in|both
+        /path?from=&to=&dir=  /top?n=10&start=1950&end=1960
+    """
+    def do_GET(self):
+        url = urlparse.urlparse(self.path)
+        args = dict((k, v[-1]) for k, v in urlparse.parse_qs(url.query).iteritems())
+        route = url.path.strip("/")
+        try:
+            status, body = 200, self.answer(route, args)
+        except LookupError as e:
+            status, body = 404, {'error': str(e.args[0])}
+        except ValueError as e:
+            status, body = 400, {'error': str(e)}
+        data = json.dumps(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def answer(self, route, args):
+        idx = self.server.index
+        nodes = lambda found: [idx.node(i) for i in found]
+        if route == "top":
+            start, end = args.get("start"), args.get("end")
+            return [dict(idx.node(i), citedBy=c) for i, c in idx.top(int(args.get("n", 10)), start and int(start), end and int(end))]
+        if route == "cites":
+            return nodes(idx.cites(self.case(args, "case")))
+        if route == "citedby":
+            return nodes(idx.citedBy(self.case(args, "case")))
+        if route == "hops":
+            found = idx.hops(self.case(args, "case"), int(args.get("k", 1)), self.direction(args))
+            return [dict(idx.node(i), hops=d) for i, d in found]
+        if route == "path":
+            chain = idx.path(self.case(args, "from"), self.case(args, "to"), self.direction(args))
+            return nodes(chain) if chain else []
+        raise LookupError("Unknown query /" + route)
+
+    def case(self, args, name):
+        cite = parseCite(args.get(name, ""))
+        if cite is None:
+            raise ValueError("Give a case number as " + name + "=vol/page")
+        i = self.server.index.find(*cite)
+        if i is None:
+            raise LookupError("Case %d/%d is not in the graph" % cite)
+        return i
+
+    def direction(self, args):
+        d = args.get("dir", "out")
+        if d not in ("out", "in", "both"):
+            raise ValueError("dir is one of out, in or both")
+        return d
+
+    def log_message(self, *args):
+        pass
+
+
+class QueryServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, index, address=("127.0.0.1", 8000)):
+        BaseHTTPServer.HTTPServer.__init__(self, address, QueryHandler)
+        self.index = index
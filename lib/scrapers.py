@@ -1,47 +1,226 @@
-import urllib2, re, json, unidecode, time
-from lxml import html
+import urllib2, re, unidecode, time, sys
+from lxml import html, etree
 import helper 
 from citation_builders import citations
+from fetcher import Fetcher, orderedMap
+from corpus import CaseWriter, doneUrls
+from suffixes import SuffixMap
+import threading, itertools, Queue
 from math import floor
 
+DISCLAIMER = "Disclaimer: Official Supreme Court case law is only found in the print version of the United States Reports. Justia case law is provided for general informational purposes only, and may not reflect current legal developments, verdicts or settlements. We make no warranties or guarantees about the accuracy, completeness, or adequacy of the information contained on this site or information linked to from this site. Please check official sources."
+#starts with a literal so the regex engine can skip through the page for it
+OPINION_ID = re.compile(r'id=["\']?opinion["\'\s>]')
+CHARSET = re.compile(r'<meta[^>]+charset\s*=\s*["\']?([\w-]+)', re.I)
+
+class _OpinionTarget(object):
+    """lxml parser target that only keeps the text inside div#opinion, like its text_content()"""
+    def __init__(self):
+        self.parts = []
+        self.depth = 0
+        self.done = False
+
+    def start(self, tag, attrib):
+        if self.depth:
+            self.depth += 1
+        elif tag == 'div' and attrib.get('id') == 'opinion' and not self.done:
+            self.depth = 1
+
+    def end(self, tag):
+        if self.depth:
+            self.depth -= 1
+            self.done = self.depth == 0
+
+    def data(self, text):
+        if self.depth:
+            self.parts.append(text)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        return self.parts
+
+def foldAscii(text):
+    """The text in ASCII, only going through unidecode when it has other characters"""
+    try:
+        if isinstance(text, unicode):
+            return text.encode('ascii')
+        text.decode('ascii')
+        return text
+    except UnicodeError:
+        if not isinstance(text, unicode):
+            text = text.decode('utf-8', 'replace')
+        return unidecode.unidecode(text)
+
+def opinionText(page, chunkSize=4096):
+    """The opinion text of a case page in one streaming pass.
+    Parsing starts at the div#opinion tag (found with a precompiled regex, so the navigation
+    above it is skipped) and the page is fed to the parser in chunks until the div closes,
+    so the footer is never parsed either and no tree is built. The Justia disclaimer,
+    indentation and blank lines are dropped and the text folded to ASCII.
+    """
+    target = _OpinionTarget()
+    found = OPINION_ID.search(page)
+    start = page.rfind("<", 0, found.start()) if found else 0
+    #the charset is declared in the head, which is skipped
+    charset = CHARSET.search(page, 0, start) if start > 0 else None
+    parser = etree.HTMLParser(target=target, encoding=charset.group(1) if charset else None)
+    for i in xrange(max(start, 0), len(page), chunkSize):
+        parser.feed(page[i:i + chunkSize])
+        if target.done:
+            break
+    parts = parser.close()
+    text = u"".join(parts) if parts else ""
+    if "Disclaimer:" in text:
+        text = text.replace(DISCLAIMER, "")
+    #drop the indentation and blank lines the page markup leaves around the opinion's lines
+    lines = [l.strip() for l in text.splitlines()]
+    return foldAscii("\n".join(l for l in lines if l))
+
+#Section of the opinion each case sub page holds, the landing page and "case" hold the majority
+SECTIONS = [("concur", "concurrence"), ("dissent", "dissent")]
+MAJORITY = "majority"
+#Shorter lines are boilerplate that is not de-duplicated across pages
+MIN_PARAGRAPH = 40
+
+def sectionOf(suffix):
+    for prefix, name in SECTIONS:
+        if suffix.startswith(prefix):
+            return name
+    return MAJORITY
+
+def dedupPages(pages, minLength=MIN_PARAGRAPH):
+    """Keep each distinct paragraph of a case's pages once.
+    The sub pages of a case repeat the text of the landing page and of each other, so every
+    paragraph (line) is fingerprinted by its whitespace normalized text and kept on one page
+    only: the first sub page that has it, or the landing page if no sub page does. Lines
+    shorter than minLength ("[Footnote 1]", "It is so ordered.") are boilerplate every page
+    can have, they are never fingerprinted and stay on each page. Lines repeated within a page
+    are kept. A paragraph is tagged with the section of the page it was kept from.
+    Args:
+        pages: (suffix, text) of each page in fetch order
+    Returns:
+        The text and its sections as [section, start, end] runs of character offsets, and the
+        number of duplicate characters dropped
+    """
+    split = [(suffix, [(" ".join(p.split()), p) for p in text.split("\n")]) for suffix, text in pages]
+    #the landing page only keeps what no sub page has
+    owner = {}
+    for i in sorted(xrange(len(split)), key=lambda i: (split[i][0] == "", i)):
+        for key, p in split[i][1]:
+            if len(key) >= minLength:
+                owner.setdefault(key, i)
+    kept, runs, dropped, pos = [], [], 0, 0
+    for i, (suffix, paras) in enumerate(split):
+        sec = sectionOf(suffix)
+        for key, p in paras:
+            if not key:
+                continue
+            if owner.get(key, i) != i:
+                dropped += len(p)
+                continue
+            start = pos + 1 if kept else 0
+            pos = start + len(p)
+            if runs and runs[-1][0] == sec:
+                runs[-1][2] = pos
+            else:
+                runs.append([sec, start, pos])
+            kept.append(p)
+    return "\n".join(kept), runs, dropped
+
 #Class to run through the SCOTUS volumes and collect the Case Names and URLS
 class VolScraper(object):
   """Class to Scrape the case names and urls from Justia's Volume Pages"""
-  def __init__(self, startVol, stopVol, baseURL):
+  def __init__(self, startVol, stopVol, baseURL, fetcher=None):
 		self.sttV = startVol
 		self.stpV = stopVol
 		self.bURL = baseURL
+		self.fetcher = fetcher or Fetcher()
 
   def scrapeVolumes(self):
           """Scraper Method for the volumes"""
           casesUrls = []
           for i in xrange(self.sttV, (self.stpV + 1)):
-              vn = str(i)
               if i % 5 == 0:
-                    print "Current Volume: " + str(vn)
-              vol = urllib2.urlopen(self.bURL+"/cases/federal/us/"+vn+"/").read()
-              #print vol
-              ### Parse to find all opinion links
-              volTree = html.fromstring(vol)
-              #for link in volTree.cssselect('div.result a'):
-              for res in volTree.cssselect('div.result'):
-                   #print res.text_content()
-                   dat = " "
-                   ##
-                   if i > 105:
-                        #Grab Date for volumes over 105
-                        text = unidecode.unidecode(res.text_content())
-                        d = re.findall('[A-Z][a-z]+ \d{1,2}, \d{4}', text )
-                        if len(d) > 0:
-                             dat = d[0]
-                   for link in res.cssselect('a'):
-                        linkText = link.text_content().split(':')
-                        cName = linkText[0].strip()
-                        ### Append link to cases
-                        if cName != "https":
-                             casesUrls.append({'url': link.get('href'), 'vol': i, 'caseName': cName, 'date': dat})
+                    print "Current Volume: " + str(i)
+              casesUrls = casesUrls + self.scrapeVolume(i)
           print "Volumes Scraped"
           return casesUrls
+
+  def scrapeVolume(self, i):
+          """Collect the case links from a single volume page"""
+          casesUrls = []
+          vn = str(i)
+          vol = self.fetcher.fetch(self.bURL+"/cases/federal/us/"+vn+"/")
+          ### Parse to find all opinion links
+          volTree = html.fromstring(vol)
+          for res in volTree.cssselect('div.result'):
+               dat = " "
+               ##
+               if i > 105:
+                    #Grab Date for volumes over 105
+                    text = unidecode.unidecode(res.text_content())
+                    d = re.findall('[A-Z][a-z]+ \d{1,2}, \d{4}', text )
+                    if len(d) > 0:
+                         dat = d[0]
+               for link in res.cssselect('a'):
+                    linkText = link.text_content().split(':')
+                    cName = linkText[0].strip()
+                    ### Append link to cases
+                    if cName != "https":
+                         casesUrls.append({'url': link.get('href'), 'vol': i, 'caseName': cName, 'date': dat})
+          return casesUrls
+
+  def streamVolumes(self, workers=1, queueSize=1000):
+          """Generator version of scrapeVolumes for pipelining with the CaseScraper.
+          Volume pages are fetched by `workers` threads in the background and every case link
+          is yielded, in volume order, as soon as its volume is parsed. At most queueSize links
+          wait in the queue, so the listing never runs far ahead of the case scraping.
+          """
+          links = Queue.Queue(queueSize)
+          done, failed = object(), []
+          #set when the consumer stops early (e.g. at stopCase) so the producer doesn't block on a full queue
+          stop = threading.Event()
+          def put(item):
+               while not stop.is_set():
+                    try:
+                         links.put(item, True, 0.1)
+                         return True
+                    except Queue.Full:
+                         pass
+               return False
+          def produce():
+               listed = 0
+               volumes = orderedMap(self.scrapeVolume, xrange(self.sttV, self.stpV + 1), workers)
+               try:
+                    for vl in volumes:
+                         for link in vl:
+                              if not put(link):
+                                   return
+                         listed += len(vl)
+                    #the total is only known once every volume is listed, from then on there is an ETA
+                    self.fetcher.metrics.setTotal(listed)
+               except Exception:
+                    failed.append(sys.exc_info())
+               finally:
+                    volumes.close()
+               put(done)
+          producer = threading.Thread(target=produce)
+          producer.daemon = True
+          producer.start()
+          try:
+               while True:
+                    link = links.get()
+                    if link is done:
+                         break
+                    yield link
+          finally:
+               stop.set()
+          if failed:
+               raise failed[0][0], failed[0][1], failed[0][2]
+          print "Volumes Scraped"
+
 #print casesUrls
 
 
@@ -50,13 +229,26 @@ class CaseScraper(object):
     """Class to scrape individual case urls and case subpages from a corpus of caseurls
     Args:
         Expects the output from the VolScraper.scrapeVolumes 
+        workers is the number of cases fetched concurrently, fetcher a shared Fetcher
+        resume skips the cases already written to the outfile by an earlier run
+        suffixMap is a SuffixMap used to skip suffix pages that don't exist
+        notifier is a helper.Notifier for the progress emails, one is started if emails is set
+        Page results per suffix and parse times go to the fetcher's metrics.
     """
-    def __init__(self, stopCase, caseLinks, outfile, emails, baseurl):
+    def __init__(self, stopCase, caseLinks, outfile, emails, baseurl, workers=1, fetcher=None, resume=False, suffixMap=None, notifier=None):
         self.stopCase = stopCase
         self.caseLinks = caseLinks
-        self.outfile = outfile+".json"
+        self.outfile = outfile+".jsonl"
+        self.resume = resume
         self.emails = emails
         self.baseURL = baseurl
+        self.workers = workers
+        self.fetcher = fetcher or Fetcher()
+        self.metrics = self.fetcher.metrics
+        self.notifier = notifier
+        self.suffixes = suffixMap or SuffixMap()
+        self.stats = {'cases': 0, 'requests': 0, 'pages': 0, 'skipped': 0, 'chars': 0, 'duplicate': 0}
+        self.statsLock = threading.Lock()
 
     ### Scrape citations - NOW SHOULD CALL FROM citation_builders class
     # def caseExtract(self, case):
@@ -89,16 +281,16 @@ class CaseScraper(object):
          return dock
     #print urlParse(casesUrls[0]['url'])
 
+    def pageText(self, page):
+        """The opinion text of a page"""
+        with self.metrics.timer('parse_seconds'):
+             return opinionText(page)
+
     def caseParse(self, case):
         """Extract the opinion text from the html return"""
-        cTree = html.fromstring(case)
-        opinion = cTree.cssselect('div#opinion')
-        #should handle error if does not have an opinion page
-        op = ""
-        for o in opinion:
-             op = op + o.text_content()
-        unicodeCaseText = unidecode.unidecode(op)
-        caseRef = citations.extractCitations(unicodeCaseText)
+        unicodeCaseText = self.pageText(case)
+        with self.metrics.timer('regex_seconds'):
+             caseRef = citations.extractCitations(unicodeCaseText)
         return unicodeCaseText, caseRef
 
     def setUrls(self, v):
@@ -113,69 +305,143 @@ class CaseScraper(object):
               suffix= suffix + ["opinion3", "concur4", "concur5", "dissent5", "dissent6"]
          return suffix
 
-    def fetchCaseText(self, caseUrl, suffix):
-      """Make the request to Justia to grab the specific page"""
+    def fetchPage(self, caseUrl, suffix):
+      """Make the request to Justia to grab the raw html of a specific page, None if it doesn't exist"""
       url = self.baseURL + caseUrl+suffix+".html"
+      page = suffix or "landing"
       try:
-        cResp = urllib2.urlopen(url).read()
+        body = self.fetcher.fetch(url)
       except urllib2.HTTPError, e:
+        self.metrics.inc('pages', suffix=page, result="missing" if e.code == 404 else "error")
+        return None
+      except urllib2.URLError, e:
+        self.metrics.inc('pages', suffix=page, result="error")
+        raise
+      self.metrics.inc('pages', suffix=page, result="found")
+      return body
+
+    def fetchCaseText(self, caseUrl, suffix):
+      """Make the request to Justia to grab the specific page"""
+      cResp = self.fetchPage(caseUrl, suffix)
+      if cResp is None:
         return None, None
-      else:
-        txt, citations = self.caseParse(cResp)
-        return txt, citations
+      txt, citations = self.caseParse(cResp)
+      return txt, citations
+
+    def suffixLinks(self, page, caseUrl):
+      """Find the suffix pages of a case that its landing page links to"""
+      found = re.findall('href=["\']?(?:https?://[^/"\']+)?' + re.escape(caseUrl) + '([\\w-]+)\\.html', page)
+      return set(found)
 
 
     def deleteDisclamer(self, case):
       """Removes the Justia.com disclaimer from the casetext"""
-      disclaimer = "Disclaimer: Official Supreme Court case law is only found in the print version of the United States Reports. Justia case law is provided for general informational purposes only, and may not reflect current legal developments, verdicts or settlements. We make no warranties or guarantees about the accuracy, completeness, or adequacy of the information contained on this site or information linked to from this site. Please check official sources."
-      clCase = case.replace(disclaimer, "")
-      return clCase
+      return case.replace(DISCLAIMER, "")
+
+    def scrapeCase(self, link):
+         """Fetch every page of a single case and build its record.
+         The landing page is always fetched; the other suffix pages only when the landing page
+         links to them or the suffix map hasn't learned that they are missing in this volume range.
+         The pages overlap, so the record keeps each paragraph once (see dedupPages) with
+         'sections' giving the [section, start, end] runs of the text. 'citations' has each
+         cited case once and 'citationCounts' the times each section cites it.
+         """
+         vol = link['vol']
+         dock = self.urlParse(link['url'])
+         cNum = [vol, dock]
+         candidates = self.setUrls(vol)[1:]
+         texts = []
+         requests = 1
+         landing = self.fetchPage(link['url'], "")
+         linked = None
+         if landing != None:
+           texts.append(("", self.pageText(landing)))
+           linked = self.suffixLinks(landing, link['url'])
+         #Loop through each of the other pages worth scraping
+         plan = self.suffixes.plan(vol, candidates, linked)
+         for suffix in plan:
+           page = self.fetchPage(link['url'], suffix)
+           requests = requests + 1
+           self.suffixes.record(vol, suffix, page != None)
+           if page != None:
+             texts.append((suffix, self.pageText(page)))
+         text, sections, dropped = dedupPages(texts)
+         with self.metrics.timer('regex_seconds'):
+           counts, cites = citations.countCitations(text, sections)
+         self.metrics.inc('duplicate_chars', dropped)
+         with self.statsLock:
+           self.stats['cases'] += 1
+           self.stats['requests'] += requests
+           self.stats['pages'] += len(texts)
+           self.stats['skipped'] += len(set(candidates) - set(plan))
+           self.stats['chars'] += len(text)
+           self.stats['duplicate'] += dropped
+         return {'name': link['caseName'], 'url': link['url'], 'txt': text, 'number': cNum, 'citations': cites, 'vol': link['vol'], 'date': link['date'],
+                 'sections': sections, 'citationCounts': counts}
+
+    def printStats(self):
+         """Print the request statistics of the run"""
+         st = self.stats
+         perCase = float(st['requests']) / st['cases'] if st['cases'] else 0
+         print "Requests: " + str(st['requests']) + " for " + str(st['cases']) + " cases (%.2f per case), " % perCase + str(st['pages']) + " pages found, " + str(st['skipped']) + " probes skipped"
+         total = st['chars'] + st['duplicate']
+         if total:
+              print "Text: %.1f MB kept, %.1f%% of the page text was a duplicate" % (st['chars'] / 1e6, 100.0 * st['duplicate'] / total)
 
-    def getCases(self):
-         """The scaffold method for the whole class."""
+    def getCases(self, retain=True):
+         """The scaffold method for the whole class.
+         Cases are appended to the outfile (JSON lines) as they are scraped.
+         Returns the scraped cases, or an empty list if retain is False to keep memory flat.
+         caseLinks may be a list or a stream such as VolScraper.streamVolumes; for a stream the
+         total isn't known up front so the 10% progress emails are skipped.
+         The emails go through a background notifier so a slow mail server never stalls scraping.
+         """
          lt = time.asctime(time.localtime(time.time()))
          problemCases, cases = [], []
          cL = self.caseLinks
-         if self.stopCase == False:
-              end = len(cL)
+         end = len(cL) if hasattr(cL, '__len__') else None
+         if self.stopCase != False:
+              cL = itertools.islice(cL, self.stopCase)
+              end = min(end, self.stopCase) if end != None else self.stopCase
+         if self.resume:
+              done = doneUrls(self.outfile)
+              cL = [l for l in cL if l['url'] not in done] if end != None else (l for l in cL if l['url'] not in done)
+              end = len(cL) if end != None else None
+              print "Resuming, " + str(len(done)) + " cases already scraped"
+         if end != None:
               print "Number of cases " + str(end)
-         else:
-              end = self.stopCase
+              self.metrics.setTotal(end)
+         notifier = self.notifier
+         if self.emails and notifier is None:
+              notifier = helper.Notifier()
           # for sometimes count variables to only print once
          lastVol, lastPer = 0, -1
-         # Loop through cases
-         for c in xrange(end):
-              vol = cL[c]['vol']
-              dock = self.urlParse(cL[c]['url'])
-              cNum = [vol, dock]
-              if vol % 5 == 0 and vol > lastVol:
-                   print "Volume " + str(vol)
-                   lastVol = vol
-              #iterate through all of the pages
-              links = self.setUrls(vol)
-              text = ""
-              cites = []
-              #Loop through each set of urls to scrape
-              for l in xrange(len(links)):
-                txt, citations = self.fetchCaseText(cL[c]['url'], links[l])
-                if txt != None:
-                  text = text + txt
-                  cites = cites + citations
-              #Add to the list of cases the case information
-              cases.append({'name': cL[c]['caseName'], 'url': cL[c]['url'], 'txt': text, 'number': cNum, 'citations': cites, 'vol': cL[c]['vol'], 'date': cL[c]['date']})
-              #Save every hunderd cases
-              if c % 100 == 0:
-                with open(self.outfile, 'w') as fp:
-                  json.dump(cases, fp, indent=2)
-
-              #Email every 10% of cases
-              per = int(floor((float(c)/float(end)*100)))
-              if per % 10 == 0 and self.emails and per > lastPer:
-                helper.sendEmail(per, c,end, lt)
-                lastPer = per
-        #Save at the end of the loop
-         with open(self.outfile, 'w') as fp:
-              json.dump(cases, fp, indent=2)
+         # Loop through cases, fetching self.workers of them at a time but keeping their order
+         scraped = orderedMap(self.scrapeCase, cL, self.workers)
+         with CaseWriter(self.outfile, self.resume) as out:
+              for c, case in enumerate(scraped):
+                   vol = case['vol']
+                   if vol % 5 == 0 and vol > lastVol:
+                        print "Volume " + str(vol)
+                        lastVol = vol
+                   #Save each case as soon as it is scraped
+                   out.write(case)
+                   self.metrics.caseDone()
+                   if retain:
+                        cases.append(case)
+                   if c % 100 == 0:
+                        self.suffixes.save()
+
+                   #Email every 10% of cases
+                   if end == None:
+                     continue
+                   per = int(floor((float(c)/float(end)*100)))
+                   if per % 10 == 0 and self.emails and per > lastPer:
+                     notifier.progress(per, c, end, lt)
+                     lastPer = per
+         if notifier is not None and self.notifier is None:
+              notifier.close()
+         self.suffixes.save()
+         self.printStats()
          print problemCases
          return cases
-
@@ -0,0 +1,196 @@
+import os, socket, sqlite3, threading, time
+
+PENDING, LEASED, DONE = "pending", "leased", "done"
+
+def workerName():
+    """host:pid, unique among the workers sharing a queue"""
+    return "%s:%d" % (socket.gethostname(), os.getpid())
+
+
+class ShardQueue(object):
+    """Work queue of volume shards in an SQLite file, which can sit on a filesystem shared by
+    the machines running the workers.
+
+    A worker claims a shard by taking a lease on it for `lease` seconds and keeps renewing
+    the lease while it scrapes. A shard whose lease ran out (its worker died or hung) goes
+    back to whoever claims next. Every claim and update is one IMMEDIATE transaction, so
+    two workers never hold the same shard.
+    """
+    def __init__(self, path, timeout=60):
+        self.path = path
+        self.db = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.db.execute("CREATE TABLE IF NOT EXISTS shards (id INTEGER PRIMARY KEY, vStart INTEGER, vStop INTEGER, state TEXT, worker TEXT, "
+                        "expires REAL, attempts INTEGER DEFAULT 0, output TEXT, cases INTEGER)")
+
+    def transaction(self, sql, params=()):
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                cur = self.db.execute(sql, params)
+                rows = cur.fetchall()
+                self.db.execute("COMMIT")
+            except:
+                self.db.execute("ROLLBACK")
+                raise
+        return cur.rowcount, rows
+
+    def create(self, vStart, vStop, size, folder):
+        """Split the volumes vStart..vStop into shards of `size` volumes, each scraped into a
+        file in `folder`. A queue that already has shards is left as it is.
+        Returns:
+            The number of shards in the queue
+        """
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                n = self.db.execute("SELECT COUNT(*) FROM shards").fetchone()[0]
+                if n == 0:
+                    for s in xrange(vStart, vStop + 1, size):
+                        e = min(s + size - 1, vStop)
+                        self.db.execute("INSERT INTO shards (vStart, vStop, state, output) VALUES (?, ?, ?, ?)",
+                                        (s, e, PENDING, os.path.join(folder, "cases-%d-%d.jsonl" % (s, e))))
+                        n += 1
+                self.db.execute("COMMIT")
+            except:
+                self.db.execute("ROLLBACK")
+                raise
+        return n
+
+    def claim(self, worker, lease=600):
+        """Lease the first shard that is pending or whose lease has run out
+        Returns:
+            The shard as a dict, or None if there is none to claim right now
+        """
+        now = time.time()
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.db.execute("SELECT id, vStart, vStop, output, attempts FROM shards WHERE state = ? OR (state = ? AND expires < ?) ORDER BY id LIMIT 1",
+                                      (PENDING, LEASED, now)).fetchone()
+                if row is not None:
+                    self.db.execute("UPDATE shards SET state = ?, worker = ?, expires = ?, attempts = attempts + 1 WHERE id = ?",
+                                    (LEASED, worker, now + lease, row[0]))
+                self.db.execute("COMMIT")
+            except:
+                self.db.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return {'id': row[0], 'vStart': row[1], 'vStop': row[2], 'output': row[3], 'attempts': row[4] + 1}
+
+    def renew(self, shard, worker, lease=600):
+        """Extend a worker's lease on a shard, False if the lease was lost to another worker"""
+        n, rows = self.transaction("UPDATE shards SET expires = ? WHERE id = ? AND worker = ? AND state = ?",
+                                   (time.time() + lease, shard['id'], worker, LEASED))
+        return n == 1
+
+    def complete(self, shard, worker, cases):
+        """Mark a shard done, False if the worker no longer holds its lease"""
+        n, rows = self.transaction("UPDATE shards SET state = ?, cases = ?, expires = NULL WHERE id = ? AND worker = ? AND state = ?",
+                                   (DONE, cases, shard['id'], worker, LEASED))
+        return n == 1
+
+    def release(self, shard, worker):
+        """Give a shard back, e.g. after its scrape failed, for another worker to retry"""
+        self.transaction("UPDATE shards SET state = ?, worker = NULL, expires = NULL WHERE id = ? AND worker = ? AND state = ?",
+                         (PENDING, shard['id'], worker, LEASED))
+
+    def shards(self):
+        with self.lock:
+            rows = self.db.execute("SELECT id, vStart, vStop, state, worker, expires, attempts, output, cases FROM shards ORDER BY id").fetchall()
+        keys = ('id', 'vStart', 'vStop', 'state', 'worker', 'expires', 'attempts', 'output', 'cases')
+        return [dict(zip(keys, r)) for r in rows]
+
+    def status(self):
+        """The number of shards in each state"""
+        counts = {PENDING: 0, LEASED: 0, DONE: 0}
+        for s in self.shards():
+            counts[s['state']] += 1
+        return counts
+
+    def close(self):
+        self.db.close()
+
+
+class Lease(object):
+    """Keeps renewing a worker's lease on a shard from a background thread while it is held;
+    `lost` is set if another worker took the shard over"""
+    def __init__(self, queue, shard, worker, lease):
+        self.queue, self.shard, self.worker, self.lease = queue, shard, worker, lease
+        self.lost = False
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run)
+        self.thread.daemon = True
+
+    def run(self):
+        while not self.stopped.wait(self.lease / 3.0):
+            if not self.queue.renew(self.shard, self.worker, self.lease):
+                self.lost = True
+                return
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.thread.join()
+
+
+def work(queue, scrapeShard, worker=None, lease=600, poll=5):
+    """Worker loop: claim shards and scrape each into its output file until every shard is done.
+    scrapeShard(shard, prefix) scrapes the shard's volumes into prefix + ".jsonl", like the
+    CaseScraper outfile, and returns the number of cases. The prefix is one of the worker's own
+    and the file is only moved to the shard's output once the shard is marked done, so a worker
+    that lost its lease can't clobber the output.
+    While other workers hold the last shards this waits, to take them over if their leases run out.
+    Returns:
+        The ids of the shards this worker completed
+    """
+    worker = worker or workerName()
+    done = []
+    while True:
+        shard = queue.claim(worker, lease)
+        if shard is None:
+            if queue.status()[LEASED] == 0:
+                return done
+            time.sleep(poll)
+            continue
+        folder = os.path.dirname(shard['output'])
+        if folder and not os.path.isdir(folder):
+            try:
+                os.makedirs(folder)
+            except OSError:
+                pass
+        prefix = "%s.tmp-%s" % (os.path.splitext(shard['output'])[0], worker.replace(os.sep, "_"))
+        tmp = prefix + ".jsonl"
+        try:
+            with Lease(queue, shard, worker, lease) as held:
+                cases = scrapeShard(shard, prefix)
+        except:
+            queue.release(shard, worker)
+            raise
+        if not held.lost and queue.complete(shard, worker, cases):
+            os.rename(tmp, shard['output'])
+            done.append(shard['id'])
+        elif os.path.exists(tmp):
+            os.remove(tmp)
+
+def merge(queue, path):
+    """Concatenate the shard outputs, in volume order, into one JSON lines corpus
+    Returns:
+        The number of cases
+    """
+    shards = queue.shards()
+    missing = [s for s in shards if s['state'] != DONE]
+    if missing:
+        raise ValueError("%d of %d shards are not done yet, first %d-%d" % (len(missing), len(shards), missing[0]['vStart'], missing[0]['vStop']))
+    n = 0
+    with open(path, 'wb') as out:
+        for s in shards:
+            with open(s['output'], 'rb') as fp:
+                for line in fp:
+                    out.write(line)
+                    n += 1
+    return n
@@ -0,0 +1,95 @@
+import os, json, mmap, zlib, struct
+
+META, TEXT, OFFSETS = "meta.json", "text.bin", "offsets.bin"
+
+class LazyCase(dict):
+    """A case whose metadata is held in memory and whose opinion text ('txt') is only
+    read from the store when it is accessed"""
+    __slots__ = ('store', 'index')
+
+    def __missing__(self, key):
+        if key != 'txt':
+            raise KeyError(key)
+        return self.store.text(self.index)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __reduce__(self):
+        #send the full case, text included, when pickled for a worker process
+        case = dict(self)
+        case['txt'] = self['txt']
+        return (dict, (case,))
+
+
+class CorpusStore(object):
+    """Compact on-disk corpus: a directory with a small metadata table, a blob of
+    zlib compressed opinion texts and an offset index (little-endian uint64) into the blob.
+
+    The metadata (everything but 'txt') loads in one json.load; the text blob is memory-mapped
+    and a case's text is decompressed only when LazyCase['txt'] is read.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, META), 'rb') as fp:
+            self.meta = json.load(fp)
+        with open(os.path.join(path, OFFSETS), 'rb') as fp:
+            data = fp.read()
+        self.offsets = struct.unpack('<%dQ' % (len(data) // 8), data)
+        self.fp = open(os.path.join(path, TEXT), 'rb')
+        size = os.fstat(self.fp.fileno()).st_size
+        self.blob = mmap.mmap(self.fp.fileno(), 0, access=mmap.ACCESS_READ) if size else ""
+
+    def __len__(self):
+        return len(self.meta)
+
+    def __getitem__(self, i):
+        case = LazyCase(self.meta[i])
+        case.store, case.index = self, i
+        return case
+
+    def __iter__(self):
+        for i in xrange(len(self.meta)):
+            yield self[i]
+
+    def text(self, i):
+        """The opinion text of the i-th case"""
+        return zlib.decompress(self.blob[self.offsets[i]:self.offsets[i + 1]]).decode('utf-8')
+
+    def close(self):
+        if self.blob:
+            self.blob.close()
+        self.fp.close()
+
+
+def isStore(path):
+    return os.path.isfile(os.path.join(path, META))
+
+def convert(cases, path, level=6):
+    """Write an iterable of cases (e.g. corpus.readCases of a cases.json) out as a CorpusStore
+    Returns:
+        The number of cases written
+    """
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    offsets = [0]
+    n = 0
+    with open(os.path.join(path, META), 'wb') as meta, open(os.path.join(path, TEXT), 'wb') as text:
+        meta.write("[")
+        for case in cases:
+            txt = case.get('txt', u"")
+            if isinstance(txt, unicode):
+                txt = txt.encode('utf-8')
+            data = zlib.compress(txt, level)
+            text.write(data)
+            offsets.append(offsets[-1] + len(data))
+            info = dict((k, v) for k, v in case.iteritems() if k != 'txt')
+            meta.write((",\n" if n else "\n") + json.dumps(info))
+            n += 1
+        meta.write("\n]")
+    with open(os.path.join(path, OFFSETS), 'wb') as fp:
+        fp.write(struct.pack('<%dQ' % len(offsets), *offsets))
+    return n
@@ -0,0 +1,71 @@
+import json, os, threading
+
+class SuffixMap(object):
+    """Learns which case sub pages (the suffixes from CaseScraper.setUrls) actually exist on Justia.
+
+    Two sources are used: the suffix pages linked from a case's landing page, and hit/miss
+    counts per suffix kept for each range of `span` volumes. A suffix that has missed
+    `minTrials` times in a range without a single hit is no longer requested there, apart
+    from one probe in every `reprobe` so the map can still notice a change.
+    The counts can be saved to and loaded from a json file between runs.
+    """
+    def __init__(self, path=None, span=10, minTrials=20, reprobe=50):
+        self.path = path
+        self.span = span
+        self.minTrials = minTrials
+        self.reprobe = reprobe
+        self.stats = {}
+        self.lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, 'r') as fp:
+                self.stats = json.load(fp)
+
+    def volRange(self, vol):
+        """The key of the volume range a volume falls in"""
+        return str(vol // self.span * self.span)
+
+    def counts(self, vol, suffix):
+        """The [hits, misses, skipped] list for a suffix in a volume's range"""
+        rng = self.stats.setdefault(self.volRange(vol), {})
+        return rng.setdefault(suffix, [0, 0, 0])
+
+    def plan(self, vol, candidates, linked=None):
+        """Pick the suffixes worth requesting for a case
+        Args:
+            vol: The case volume
+            candidates: The suffixes that might exist (from setUrls)
+            linked: The suffixes linked from the case's landing page, or None when unknown
+        Returns:
+            The suffixes to request, in candidate order
+        """
+        if linked:
+            return [s for s in candidates if s in linked] + sorted(s for s in linked if s not in candidates)
+        keep = []
+        with self.lock:
+            for s in candidates:
+                c = self.counts(vol, s)
+                if c[0] == 0 and c[1] >= self.minTrials:
+                    c[2] = c[2] + 1
+                    if c[2] % self.reprobe != 0:
+                        continue
+                keep.append(s)
+        return keep
+
+    def record(self, vol, suffix, hit):
+        """Count a request for a suffix page and whether the page existed"""
+        with self.lock:
+            c = self.counts(vol, suffix)
+            c[0 if hit else 1] += 1
+
+    def save(self, path=None):
+        """Write the counts to the json file"""
+        path = path or self.path
+        if not path:
+            return
+        with self.lock:
+            data = json.dumps(self.stats, indent=1, sort_keys=True)
+        #a temporary file of the process's own, as workers scraping shards share the map
+        tmp = "%s.%d.tmp" % (path, os.getpid())
+        with open(tmp, 'w') as fp:
+            fp.write(data)
+        os.rename(tmp, path)
@@ -0,0 +1,281 @@
+import os, re, json, mmap
+from array import array
+import numpy as np
+
+#Files of a text index directory; the postings files come once per field (txt, name)
+TERMS, TERM_OFFSETS, POSTINGS, POSTING_OFFSETS = "%s.terms", "%s.term_offsets.npy", "%s.postings", "%s.posting_offsets.npy"
+DOCS, DOC_OFFSETS, VOL, YEAR = "docs.jsonl", "doc_offsets.npy", "vol.npy", "year.npy"
+FIELDS = ("txt", "name")
+
+WORD = re.compile(r'\w+', re.UNICODE)
+YEAR_RE = re.compile(r'(\d{4})\s*$')
+CLAUSE = re.compile(r'(name:)?(?:"([^"]*)"?|(\S+))')
+
+def tokenize(text):
+    """The lower-cased words of a text, in order; a word's position is its index here"""
+    if isinstance(text, str):
+        text = text.decode('utf-8', 'replace')
+    return WORD.findall(text.lower())
+
+def caseYear(date):
+    """The year of a case date like "May 17, 1954", 0 if there is none"""
+    m = YEAR_RE.search(date or "")
+    return int(m.group(1)) if m else 0
+
+def writeVarints(values, out):
+    """Append unsigned ints to a bytearray, 7 bits a byte, low bits first, the high bit set on
+    every byte but the last of a value"""
+    for v in values:
+        while v >= 0x80:
+            out.append((v & 0x7f) | 0x80)
+            v >>= 7
+        out.append(v)
+
+def readVarints(data):
+    """Decode a buffer of varints into an int64 array"""
+    b = np.frombuffer(data, np.uint8)
+    if not len(b):
+        return np.zeros(0, np.int64)
+    last = b < 0x80
+    #each byte's place within its value, counted from the value's first byte
+    starts = np.flatnonzero(np.concatenate(([True], last[:-1])))
+    place = np.arange(len(b)) - np.repeat(starts, np.diff(np.append(starts, len(b))))
+    return np.add.reduceat((b & 0x7f).astype(np.int64) << (7 * place), starts)
+
+
+class PostingsWriter(object):
+    """Collects the positional postings of one field, document by document in increasing
+    order, already delta and varint encoded so the index being built stays about as small as
+    it is on disk.
+
+    Each term's postings are three varint runs: the document gaps, the number of times the term
+    occurs in each document and the gaps between its positions in each document.
+    """
+    def __init__(self):
+        self.terms = {}
+
+    def add(self, doc, words):
+        positions = {}
+        for pos, w in enumerate(words):
+            positions.setdefault(w, []).append(pos)
+        for w, ps in positions.iteritems():
+            entry = self.terms.get(w)
+            if entry is None:
+                entry = self.terms[w] = [0, bytearray(), bytearray(), bytearray()]
+            writeVarints((doc - entry[0],), entry[1])
+            writeVarints((len(ps),), entry[2])
+            writeVarints([p - q for p, q in zip(ps, [0] + ps[:-1])], entry[3])
+            entry[0] = doc
+
+    def write(self, path, field):
+        """Write the sorted term table and the postings of every term
+        Returns:
+            The number of terms
+        """
+        #in the byte order the queries binary search the table in
+        terms = sorted(self.terms, key=lambda w: w.encode('utf-8'))
+        termOffsets, offsets = array('l', [0]), array('l')
+        with open(os.path.join(path, TERMS % field), 'wb') as tf, open(os.path.join(path, POSTINGS % field), 'wb') as pf:
+            at = 0
+            for w in terms:
+                data = w.encode('utf-8')
+                tf.write(data)
+                termOffsets.append(termOffsets[-1] + len(data))
+                last, docs, counts, pos = self.terms[w]
+                offsets.extend((at, at + len(docs), at + len(docs) + len(counts)))
+                for block in (docs, counts, pos):
+                    pf.write(block)
+                    at += len(block)
+            offsets.append(at)
+        np.save(os.path.join(path, TERM_OFFSETS % field), np.array(termOffsets, dtype=np.int64))
+        np.save(os.path.join(path, POSTING_OFFSETS % field), np.array(offsets, dtype=np.int64))
+        return len(terms)
+
+
+def buildIndex(cases, path):
+    """Index the opinion text and the names of an iterable of cases (e.g. a corpus.CaseFile)
+    into directory `path`. Documents are numbered in the order of the cases.
+    Returns:
+        The number of cases indexed
+    """
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    fields = dict((f, PostingsWriter()) for f in FIELDS)
+    offsets, vols, years = array('l', [0]), array('l'), array('l')
+    n = 0
+    with open(os.path.join(path, DOCS), 'wb') as fp:
+        for case in cases:
+            fields['txt'].add(n, tokenize(case.get('txt', u"")))
+            fields['name'].add(n, tokenize(case.get('name', u"")))
+            vols.append(int(case.get('vol', 0)))
+            years.append(caseYear(case.get('date')))
+            line = json.dumps({'number': case.get('number'), 'name': case.get('name'), 'date': case.get('date'), 'url': case.get('url')}) + "\n"
+            fp.write(line)
+            offsets.append(offsets[-1] + len(line))
+            n += 1
+    for f in FIELDS:
+        fields[f].write(path, f)
+    for name, arr in ((DOC_OFFSETS, offsets), (VOL, vols), (YEAR, years)):
+        np.save(os.path.join(path, name), np.array(arr, dtype=np.int64 if name == DOC_OFFSETS else np.int32))
+    return n
+
+def isIndex(path):
+    return os.path.isfile(os.path.join(path, DOC_OFFSETS))
+
+def readMap(path):
+    fp = open(path, 'rb')
+    size = os.fstat(fp.fileno()).st_size
+    return fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) if size else ""
+
+
+class Postings(object):
+    """The memory-mapped postings of one field. Terms are found by binary search over the
+    sorted term table and only the postings of the terms in a query are decoded.
+    """
+    def __init__(self, path, field):
+        self.termOffsets = np.load(os.path.join(path, TERM_OFFSETS % field), mmap_mode='r')
+        self.offsets = np.load(os.path.join(path, POSTING_OFFSETS % field), mmap_mode='r')
+        self.files = [readMap(os.path.join(path, name % field)) for name in (TERMS, POSTINGS)]
+        self.terms, self.data = self.files[0][1], self.files[1][1]
+
+    def __len__(self):
+        return len(self.termOffsets) - 1
+
+    def term(self, i):
+        return self.terms[self.termOffsets[i]:self.termOffsets[i + 1]]
+
+    def find(self, word):
+        """The number of a term, or None if no document has it"""
+        key = word.encode('utf-8') if isinstance(word, unicode) else word
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.term(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self) and self.term(lo) == key:
+            return lo
+        return None
+
+    def block(self, i, k):
+        at = 3 * i + k
+        return self.data[self.offsets[at]:self.offsets[at + 1]]
+
+    def size(self, word):
+        """Bytes of a word's document list, to order the words of a phrase rarest first"""
+        i = self.find(word)
+        return -1 if i is None else len(self.block(i, 0))
+
+    def docs(self, word):
+        """The documents containing a word, sorted"""
+        i = self.find(word)
+        if i is None:
+            return np.zeros(0, np.int64)
+        return np.cumsum(readVarints(self.block(i, 0)))
+
+    def positions(self, word):
+        """Every occurrence of a word
+        Returns:
+            Two arrays of the same length, the document and the position of each occurrence
+        """
+        i = self.find(word)
+        if i is None:
+            return np.zeros(0, np.int64), np.zeros(0, np.int64)
+        docs = np.cumsum(readVarints(self.block(i, 0)))
+        counts = readVarints(self.block(i, 1))
+        pos = np.cumsum(readVarints(self.block(i, 2)))
+        #the position gaps start again in every document
+        firsts = np.cumsum(counts) - counts
+        before = np.concatenate(([0], pos))[firsts]
+        return np.repeat(docs, counts), pos - np.repeat(before, counts)
+
+    def phrase(self, words):
+        """The documents with the words next to each other in this order, sorted"""
+        if len(words) == 1:
+            return self.docs(words[0])
+        #only the documents with every word need their positions compared
+        cand = None
+        for w in sorted(set(words), key=self.size):
+            cand = self.docs(w) if cand is None else np.intersect1d(cand, self.docs(w), assume_unique=True)
+            if not len(cand):
+                return cand
+        starts = None
+        for k, w in enumerate(words):
+            docs, pos = self.positions(w)
+            keep = np.in1d(docs, cand) & (pos >= k)
+            #an occurrence as the k-th word marks a phrase starting k words earlier
+            keys = np.unique((docs[keep] << 32) + pos[keep] - k)
+            starts = keys if starts is None else np.intersect1d(starts, keys, assume_unique=True)
+            if not len(starts):
+                break
+        return np.unique(starts >> 32)
+
+    def close(self):
+        for fp, data in self.files:
+            if data:
+                data.close()
+            fp.close()
+
+
+def parseQuery(text):
+    """Split a query into its clauses: words, "quoted phrases" and name: clauses on the case
+    name, e.g. name:brown "equal protection" segregation
+    Returns:
+        A list of (field, words)
+    """
+    clauses = []
+    for m in CLAUSE.finditer(text):
+        words = tokenize(m.group(2) if m.group(2) is not None else m.group(3))
+        if words:
+            clauses.append(("name" if m.group(1) else "txt", words))
+    return clauses
+
+
+class TextIndex(object):
+    """Memory-mapped positional index of the opinion text and case names, answering word,
+    phrase and case name queries filtered by volume and year.
+    """
+    def __init__(self, path):
+        self.root = path
+        self.fields = dict((f, Postings(path, f)) for f in FIELDS)
+        self.vol = np.load(os.path.join(path, VOL), mmap_mode='r')
+        self.year = np.load(os.path.join(path, YEAR), mmap_mode='r')
+        self.offsets = np.load(os.path.join(path, DOC_OFFSETS), mmap_mode='r')
+        self.fp, self.table = readMap(os.path.join(path, DOCS))
+
+    def __len__(self):
+        return len(self.vol)
+
+    def doc(self, i):
+        """The number, name, date and url of a case"""
+        return json.loads(self.table[self.offsets[i]:self.offsets[i + 1]])
+
+    def search(self, text, vStart=None, vStop=None, start=None, end=None):
+        """The cases matching every clause of a query (see parseQuery), decided in volumes
+        vStart..vStop and the years start..end (all inclusive)
+        Returns:
+            The matching documents, in corpus order
+        """
+        clauses = parseQuery(text)
+        if not clauses:
+            raise ValueError("Empty query")
+        found = None
+        for field, words in clauses:
+            docs = self.fields[field].phrase(words)
+            found = docs if found is None else np.intersect1d(found, docs, assume_unique=True)
+            if not len(found):
+                break
+        for arr, lo, hi in ((self.vol, vStart, vStop), (self.year, start, end)):
+            if lo is not None:
+                found = found[np.asarray(arr)[found] >= lo]
+            if hi is not None:
+                found = found[np.asarray(arr)[found] <= hi]
+        return [int(i) for i in found]
+
+    def close(self):
+        for p in self.fields.values():
+            p.close()
+        if self.table:
+            self.table.close()
+        self.fp.close()
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+import argparse, time
+from lib import corpus, store
+
+def main():
+     """Convert a cases.json(l) file into a compact CorpusStore directory"""
+     parser = argparse.ArgumentParser()
+     parser.add_argument("input", help="The cases file to convert (JSON lines or JSON array)")
+     parser.add_argument("output", help="The corpus store directory to write")
+     parser.add_argument("-l", "--level", help="zlib compression level for the opinion text. Default 6.", type=int, default=6)
+     args = parser.parse_args()
+     start = time.time()
+     n = store.convert(corpus.readCases(args.input), args.output, args.level)
+     print "Converted " + str(n) + " cases in %.1fs" % (time.time() - start)
+
+if __name__ == "__main__":
+   main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+import argparse, time, sys
+from lib import query, textindex
+
+def show(node, extra=""):
+     """One line per case: volume/page, name and year"""
+     print "%-12s %s (%s)%s" % (node['id'], node.get('name', "?"), node.get('year', "?"), extra)
+
+def findCase(idx, text):
+     cite = query.parseCite(text)
+     if cite is None:
+          sys.exit("Not a case number: " + text)
+     i = idx.find(*cite)
+     if i is None:
+          sys.exit("Case %d/%d is not in the graph" % cite)
+     return i
+
+def search(args):
+     if not textindex.isIndex(args.textIndex):
+          sys.exit("No text index at " + args.textIndex + ", run scotus-runner.py -p 4 first")
+     idx = textindex.TextIndex(args.textIndex)
+     start = time.time()
+     try:
+          found = idx.search(" ".join(args.query), args.vStart, args.vStop, args.start, args.end)
+     except ValueError as e:
+          sys.exit(str(e))
+     secs = time.time() - start
+     for i in found[:args.n or None]:
+          doc = idx.doc(i)
+          print "%-12s %s (%s)" % ("%d/%d" % tuple(doc['number']), doc['name'], doc['date'])
+     print "%d cases in %.1fms" % (len(found), secs * 1000)
+
+def parseArgs():
+     """Pulling and cleaning the CLI parameters"""
+     parser = argparse.ArgumentParser(description="Query the citation graph. Cases are given as 347/483 or \"347 U.S. 483\".")
+     parser.add_argument("-x", "--index", help="The query index directory. Default vis/graph_index.", default="vis/graph_index")
+     sub = parser.add_subparsers(dest="command")
+     build = sub.add_parser("build", help="Build the query index from the graph output")
+     build.add_argument("-g", "--graphOutput", help="Graph output prefix the runner wrote, reads its _csr directory or .json", default="graph")
+     for name, desc in (("cites", "Cases a case cites"), ("citedby", "Cases citing a case")):
+          sub.add_parser(name, help=desc).add_argument("case")
+     hops = sub.add_parser("hops", help="Cases within k citations of a case")
+     hops.add_argument("case")
+     hops.add_argument("-k", help="Number of hops. Default 2.", type=int, default=2)
+     hops.add_argument("-d", "--direction", help="Follow citations out, in or both. Default out.", choices=["out", "in", "both"], default="out")
+     path = sub.add_parser("path", help="Shortest citation path between two cases")
+     path.add_argument("source")
+     path.add_argument("target")
+     path.add_argument("-d", "--direction", help="Follow citations out, in or both. Default out.", choices=["out", "in", "both"], default="out")
+     top = sub.add_parser("top", help="Most cited cases, optionally decided within a range of years")
+     top.add_argument("-n", help="Number of cases. Default 10.", type=int, default=10)
+     top.add_argument("--start", help="First year", type=int, default=None)
+     top.add_argument("--end", help="Last year", type=int, default=None)
+     search = sub.add_parser("search", help="Cases whose opinion text has words, \"phrases\" or name:words in the case name, e.g. 'name:brown \"equal protection\"'")
+     search.add_argument("query", nargs="+")
+     search.add_argument("-t", "--textIndex", help="The text index the runner built with -p 4. Default text_index.", default="text_index")
+     search.add_argument("-n", help="Number of cases to list, 0 for all. Default 20.", type=int, default=20)
+     search.add_argument("--vStart", help="First volume", type=int, default=None)
+     search.add_argument("--vStop", help="Last volume", type=int, default=None)
+     search.add_argument("--start", help="First year", type=int, default=None)
+     search.add_argument("--end", help="Last year", type=int, default=None)
+     serve = sub.add_parser("serve", help="Answer the queries as JSON over HTTP")
+     serve.add_argument("--host", default="127.0.0.1")
+     serve.add_argument("--port", type=int, default=8000)
+     return parser.parse_args()
+
+def main():
+     """Main function to scaffold functions"""
+     args = parseArgs()
+     if args.command == "build":
+          start = time.time()
+          n = query.buildIndex("vis/" + args.graphOutput, args.index)
+          print "Indexed " + str(n) + " cases in %.1fs" % (time.time() - start)
+          return
+     if args.command == "search":
+          search(args)
+          return
+     if not query.isIndex(args.index):
+          sys.exit("No query index at " + args.index + ", run the build command first")
+     idx = query.CitationIndex(args.index)
+     if args.command == "cites":
+          for i in idx.cites(findCase(idx, args.case)):
+               show(idx.node(i))
+     elif args.command == "citedby":
+          for i in idx.citedBy(findCase(idx, args.case)):
+               show(idx.node(i))
+     elif args.command == "hops":
+          for i, d in idx.hops(findCase(idx, args.case), args.k, args.direction):
+               show(idx.node(i), " %d hop%s" % (d, "s" if d > 1 else ""))
+     elif args.command == "path":
+          chain = idx.path(findCase(idx, args.source), findCase(idx, args.target), args.direction)
+          if chain is None:
+               print "No citation path"
+          for i in chain or []:
+               show(idx.node(i))
+     elif args.command == "top":
+          for i, c in idx.top(args.n, args.start, args.end):
+               show(idx.node(i), " cited %d times" % c)
+     elif args.command == "serve":
+          server = query.QueryServer(idx, (args.host, args.port))
+          print "Serving on http://%s:%d" % server.server_address
+          server.serve_forever()
+
+if __name__ == "__main__":
+   main()
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 import networkx as nx
 from networkx.readwrite import json_graph
-import argparse, json
+import argparse, json, os
 #import matplotlib.pyplot as plt
-from lib import helper, scrapers, grapher, citation_builders
+from lib import helper, scrapers, grapher, citation_builders, fetcher, corpus, cache, suffixes, manifest, metrics, shards, textindex
 
 
 baseURL = "https://supreme.justia.com"
@@ -13,7 +13,7 @@ baseURL = "https://supreme.justia.com"
 def parseArgs():
       """Pulling and cleaning the CLI parameters"""
       parser = argparse.ArgumentParser()
-      parser.add_argument("-p", "--phase", help="Start With 1 - scrape, 2 - citation building, 3- graph building. Default 2.", type=int, default=2)
+      parser.add_argument("-p", "--phase", help="Start With 1 - scrape, 2 - citation building, 3- graph building, 4 - only index the opinion text for search, 0 - run only the stages that are out of date. Default 2.", type=int, default=2)
       parser.add_argument("-s", "--vStart", help="The volume to start", type=int, default=1)
       parser.add_argument("-t", "--vStop", help="The volume to stop, if omitted will be start", type=int, default=1)
       parser.add_argument("-o", "--output", help="The outputfile", default="cases.json")
@@ -22,10 +22,39 @@ def parseArgs():
       parser.add_argument("-c", "--citeOutput", help="Output for the citation step", default="cites")
       parser.add_argument("-g", "--graphOutput", help="Graph output prifix for gml and json", default="graph")
       parser.add_argument("-e", "--emailsend", help="Send emails to mark progress", default=True)
-      parser.add_argument("-f", "--format", help="File formats for graph output. 0 = .json only 1 = .gml only 2= output .json and .gml", type=int, default=0)
+      parser.add_argument("-n", "--threads", help="Number of cases to fetch concurrently while scraping. Default 1.", type=int, default=1)
+      parser.add_argument("-r", "--rate", help="Max requests per second to Justia, 0 for no limit. Default 0.", type=float, default=0)
+      parser.add_argument("--queueSize", help="Max case links listed ahead of the case scraper. Default 1000.", type=int, default=1000)
+      parser.add_argument("--resume", help="Skip the cases already in the output file and carry on scraping", action="store_true")
+      parser.add_argument("--cache", help="Directory to keep the raw Justia pages in, so they are never downloaded twice", default=None)
+      parser.add_argument("--cacheSize", help="Cap on the page cache size in MB, 0 for no cap. Default 0.", type=int, default=0)
+      parser.add_argument("--offline", help="Scrape only from the page cache without touching Justia", action="store_true")
+      parser.add_argument("--suffixMap", help="File to load and save the learned map of which case sub pages exist", default="suffixes.json")
+      parser.add_argument("-w", "--workers", help="Number of processes to build the citations on. Default 1.", type=int, default=1)
+      parser.add_argument("--update", help="Update the existing graph with just the cases in the input (new or changed cases) and write a .delta.json of the changes", action="store_true")
+      parser.add_argument("-a", "--analytics", help="Compute citation metrics (degrees, PageRank, HITS, citation ages) into the graph output", action="store_true")
+      parser.add_argument("-l", "--layout", help="Compute a force layout and write x and y into the graph output, with level of detail tiles", action="store_true")
+      parser.add_argument("--tileLevels", help="Zoom levels of layout tiles to write, 0 for none. Default 4.", type=int, default=4)
+      parser.add_argument("-m", "--manifest", help="Manifest of what each artifact was built from, for -p 0. Default manifest.json.", default="manifest.json")
+      parser.add_argument("--shard", help="Sharded scraping: coordinator splits vStart..vStop into shards in the --queue, worker scrapes shards until all are done, merge joins them into the output file and carries on with phases 2 and 3", choices=["coordinator", "worker", "merge"], default=None)
+      parser.add_argument("--queue", help="SQLite file of the shard queue, on a filesystem the workers share. Default shards.sqlite.", default="shards.sqlite")
+      parser.add_argument("--shardSize", help="Volumes per shard. Default 10.", type=int, default=10)
+      parser.add_argument("--shardDir", help="Directory the workers write the shard outputs to. Default shards.", default="shards")
+      parser.add_argument("--lease", help="Seconds a worker's claim on a shard lasts without being renewed. Default 600.", type=float, default=600)
+      parser.add_argument("--worker", help="Name of this worker in the queue. Default host:pid.", default=None)
+      parser.add_argument("--textIndex", help="Directory of the full text index -p 4 builds from the input and -p 0 keeps up to date when given. Default text_index for -p 4.", default=None)
+      parser.add_argument("--metrics", help="File to keep rewriting the run metrics (phase times, request latencies, errors per suffix, cases per second and ETA) to as JSON, with a Prometheus textfile next to it", default=None)
+      parser.add_argument("--metricsInterval", help="Seconds between rewrites of the metrics file. Default 10.", type=float, default=10)
+      parser.add_argument("-f", "--format", help="File formats for graph output. 0 = .json only 1 = .gml only 2= output .json and .gml 3 = binary arrays only 4 = all", type=int, default=0)
       args = parser.parse_args()
+      if args.offline and not args.cache:
+            parser.error("--offline needs a --cache directory")
+      if args.phase == 0 and args.update:
+            parser.error("--update can't be used with -p 0")
+      if args.shard and (args.phase == 0 or args.update):
+            parser.error("--shard can't be used with -p 0 or --update")
       args.emailsend = False if args.emailsend != True else True
-      if args.format == 2 or args.format == 1:
+      if args.format in (1, 2, 3, 4):
             args.form = args.format
       else:
             args.format = 0
@@ -35,40 +64,180 @@ def parseArgs():
           args.stopCase = int(args.stopCase)
       return args
 
+def scrape(args, run, offline=False):
+     """Phase 1: scrape the cases of the volumes into the output file
+     Offline, the cases are parsed again from the page cache without going to Justia.
+     """
+     pages = cache.PageCache(args.cache, args.cacheSize * 1024 * 1024) if args.cache else None
+     web = fetcher.Fetcher(args.rate, cache=pages, offline=args.offline or offline, metrics=run)
+     scrape = scrapers.VolScraper(args.vStart, args.vStop, baseURL, web)
+     #Case links stream out of the volume pages while the cases are being scraped
+     caseUrls = scrape.streamVolumes(args.threads, args.queueSize)
+
+     #Grab cases
+     cScraper = scrapers.CaseScraper(args.stopCase, caseUrls, args.output, args.emailsend, baseURL, args.threads, web, args.resume, suffixes.SuffixMap(args.suffixMap))
+     with run.phase('scrape'):
+          cScraper.getCases(False)
+     print "Cases scraped"
+     return corpus.CaseFile(cScraper.outfile)
+
+def buildCitations(args, cases, run, known=()):
+     """Phase 2: resolve the citations of the cases, to them or the (number, name) known cases"""
+     CB = citation_builders.citations(cases, args.citeOutput, run, known)
+     with run.phase('citations'):
+          cites, metrics = CB.processText(True, args.workers, False)
+     print metrics
+     return cites
+
+def graphBuilder(args, cites):
+     return grapher.GraphBuilder(cites, args.graphOutput, args.format, baseURL, args.analytics, args.layout, args.tileLevels)
+
+def buildTextIndex(args, cases, run):
+     """Phase 4: index the opinion text and case names for scotus-query.py search"""
+     path = args.textIndex or "text_index"
+     with run.phase('textindex'):
+          n = textindex.buildIndex(cases, path)
+     print "Indexed the text of " + str(n) + " cases into " + path
+
+def graphOutputs(args):
+     base = 'vis/' + args.graphOutput
+     return [base + ext for ext in ('.json', '.gml', '.gml.gz', '_csr', '_tiles')]
+
+def scrapeShard(args, run):
+     """The scrape of one shard for shards.work: phase 1 over the shard's volumes"""
+     def scrapeVolumes(shard, prefix):
+          shardArgs = argparse.Namespace(**vars(args))
+          shardArgs.vStart, shardArgs.vStop, shardArgs.output, shardArgs.resume = shard['vStart'], shard['vStop'], prefix, False
+          print "Shard " + str(shard['vStart']) + "-" + str(shard['vStop']) + " (attempt " + str(shard['attempts']) + ")"
+          return sum(1 for case in scrape(shardArgs, run))
+     return scrapeVolumes
+
+def runShard(args, run):
+     """Coordinator, worker and merge modes of the sharded scrape
+     Returns:
+          The merged cases for the next phases, or None
+     """
+     queue = shards.ShardQueue(args.queue)
+     try:
+          if args.shard == "coordinator":
+               n = queue.create(args.vStart, args.vStop, args.shardSize, args.shardDir)
+               print str(n) + " shards in " + args.queue + ": " + json.dumps(queue.status(), sort_keys=True)
+          elif args.shard == "worker":
+               done = shards.work(queue, scrapeShard(args, run), args.worker, args.lease)
+               print "Scraped " + str(len(done)) + " shards: " + json.dumps(queue.status(), sort_keys=True)
+          else:
+               n = shards.merge(queue, args.output + ".jsonl")
+               print "Merged " + str(n) + " cases into " + args.output + ".jsonl"
+               return corpus.CaseFile(args.output + ".jsonl")
+     finally:
+          queue.close()
+     return None
+
+def runPipeline(args, run):
+     """Phase 0: run only the stages whose inputs, parameters or code changed since the
+     manifest was written, and everything downstream of them
+     """
+     mf = manifest.Manifest(args.manifest)
+     casesFile = args.output + ".jsonl"
+     citesFile = args.citeOutput + ".json"
+
+     #the output paths are parameters too, so a stage writing somewhere new is run again
+     pagesKey = mf.key('pages', {'vStart': args.vStart, 'vStop': args.vStop, 'stopCase': args.stopCase, 'baseURL': baseURL, 'cache': args.cache})
+     casesKey = mf.key('cases', {'output': casesFile}, [pagesKey])
+     if mf.fresh('cases', casesKey):
+          print "Cases up to date"
+     else:
+          #with the pages already in the cache only the parsing needs redoing
+          offline = bool(args.cache) and mf.fresh('pages', pagesKey)
+          scrape(args, run, offline)
+          if args.cache:
+               mf.record('pages', pagesKey, [args.cache])
+          mf.record('cases', casesKey, [casesFile])
+
+     if args.textIndex:
+          textKey = mf.key('textindex', {'output': args.textIndex}, [mf.output('cases', casesFile)])
+          if mf.fresh('textindex', textKey):
+               print "Text index up to date"
+          else:
+               buildTextIndex(args, corpus.CaseFile(casesFile), run)
+               mf.record('textindex', textKey, [args.textIndex])
+
+     citesKey = mf.key('citations', {'output': citesFile}, [mf.output('cases', casesFile)])
+     if mf.fresh('citations', citesKey):
+          print "Citations up to date"
+     else:
+          buildCitations(args, corpus.CaseFile(casesFile), run)
+          mf.record('citations', citesKey, [citesFile])
+
+     graphKey = mf.key('graph', {'graphOutput': args.graphOutput, 'format': args.format, 'layout': args.layout, 'tileLevels': args.tileLevels, 'baseURL': baseURL}, [mf.output('citations', citesFile)])
+     analyticsKey = mf.key('analytics', {'analytics': args.analytics}, [graphKey])
+     analyticsFile = 'vis/' + args.graphOutput + '.analytics.json'
+     gb = graphBuilder(args, corpus.CaseFile(citesFile))
+     if not mf.fresh('graph', graphKey) or (not mf.fresh('analytics', analyticsKey) and not args.analytics):
+          with run.phase('graph'):
+               gb.drawGraph()
+     elif not mf.fresh('analytics', analyticsKey):
+          #only the metrics changed, add them to the graph already written
+          with run.phase('graph'):
+               gb.refreshGraph()
+     else:
+          print "Graph up to date"
+          return
+     mf.record('graph', graphKey, graphOutputs(args))
+     mf.record('analytics', analyticsKey, [analyticsFile] if args.analytics else [])
+
 def main():
      """Main function to scaffold functions"""
      args = parseArgs()
+     run = metrics.Metrics(args.metrics, args.metricsInterval).start()
+     #the emails are sent from a background thread so they never hold up the run
+     notifier = helper.Notifier() if args.emailsend else None
 
-     # See if scraping has been called
-     if (args.phase == 1):
-        scrape = scrapers.VolScraper(args.vStart, args.vStop, baseURL)
-        caseUrls = scrape.scrapeVolumes()
-
-        #Grab cases
-        cScraper = scrapers.CaseScraper(args.stopCase, caseUrls, args.output, args.emailsend, baseURL)
-        cases = cScraper.getCases()
-        print "Cases scraped"
-     #or load from json
-     else:
-          try:
-               with open(args.input, 'r') as fp:
-                    cases = json.load(fp)
-                    #print cases
-                    print "yeha! Json loaded"
-          except EnvironmentError:
+     if args.phase == 0:
+          runPipeline(args, run)
+     elif args.shard in ("coordinator", "worker"):
+          runShard(args, run)
+     elif args.phase == 4:
+          if not os.path.exists(args.input):
                print "Select select a valid load file."
-     if (args.phase < 3):
-          CB = citation_builders.citations(cases, args.citeOutput)
-          cites, metrics = CB.processText(True)
-          #print cites
-          print metrics
+               return
+          buildTextIndex(args, corpus.CaseFile(args.input), run)
      else:
-          cites = cases
-          
-     grapher.GraphBuilder(cites, args.graphOutput, args.format, baseURL).drawGraph()
+          # See if scraping has been called
+          if args.shard == "merge":
+               cases = runShard(args, run)
+          elif (args.phase == 1):
+               cases = scrape(args, run)
+          #or stream from json
+          else:
+               if not os.path.exists(args.input):
+                    print "Select select a valid load file."
+                    return
+               cases = corpus.CaseFile(args.input)
+          G, known = None, ()
+          if args.update:
+               #the new cases may cite any case already in the graph
+               gb = graphBuilder(args, [])
+               G = gb.loadGraph()
+               known = gb.knownCases(G)
+          if (args.phase < 3):
+               cites = buildCitations(args, cases, run, known)
+          else:
+               cites = cases
+
+          gb = graphBuilder(args, cites)
+          with run.phase('graph'):
+               if args.update:
+                    gb.updateGraph(G)
+               else:
+                    gb.drawGraph()
+     run.stop()
+     for name, secs in sorted(run.snapshot()['phases'].iteritems()):
+          print name + " took %.1fs" % secs
      print "done"
-     if args.emailsend:
-          helper.emailSend('Your Script done', "ALL DONE")
+     if notifier is not None:
+          notifier.notify('Your Script done', "ALL DONE")
+          notifier.close()
 
 if __name__ == "__main__":
    main()
@@ -0,0 +1,142 @@
+"""A local stand-in for supreme.justia.com that serves Justia-shaped volume and case pages"""
+import BaseHTTPServer, SocketServer, threading, re, hashlib, random
+from lib.scrapers import DISCLAIMER
+
+VOLUME = '<html><body><div class="results">%s</div></body></html>'
+RESULT = '<div class="result"><a href="%s">%s</a><p>Decided: %s</p></div>'
+CASE = '<html><body><div id="nav"><a href="/">Home</a>%s</div><div id="opinion">%s</div></body></html>'
+LINK = '<a href="%s%s.html">%s</a>'
+
+def buildCorpus(vols, perVol):
+    """Make a small corpus of fake cases, citing the previous case in the volume"""
+    pages = {}
+    for v in xrange(1, vols + 1):
+        for p in xrange(1, perVol + 1):
+            url = "/cases/federal/us/%d/%d/" % (v, p)
+            body = "U.S. Supreme Court CASE %d v. TEST, %d U. S. %d (1800) See %d U. S. %d." % (p, v, p, v, max(p - 1, 1))
+            pages[url] = {'name': "CASE %d v. TEST" % p, 'vol': v, 'date': "March %d, 1800" % p, 'pages': {"": body}}
+    return pages
+
+def layout(vol):
+    """The sub pages Justia splits a case of the volume into, as CaseScraper.setUrls expects"""
+    if vol < 540:
+        return ["case"]
+    if vol < 565:
+        return ["opinion", "concurrence", "dissent"]
+    return ["opinion3", "concur4", "concur5", "dissent5", "dissent6"]
+
+def fromCases(cases, seed=1, overlap=False):
+    """Serve cases in the scraper output schema (like benchmarks.synthetic makes) the way Justia
+    lays them out: the paragraphs (lines) of the text are split over the landing page and some
+    of the volume's sub pages, which the landing page links to in its navigation, and every page
+    ends with the disclaimer. With overlap the landing page has the whole text, repeating the
+    sub pages. Scraping them gives back each case's text and citations.
+    """
+    rng = random.Random(seed)
+    pages = {}
+    for case in cases:
+        subs = layout(case['vol'])
+        parts = case['txt'].split("\n")
+        used = [""] + sorted(rng.sample(subs, rng.randint(0, min(len(subs), len(parts) - 1))), key=subs.index)
+        cuts = sorted(rng.sample(xrange(1, len(parts)), len(used) - 1))
+        bounds = [0] + cuts + [len(parts)]
+        body = {}
+        for i, s in enumerate(used):
+            body[s] = "\n".join(parts[bounds[i]:bounds[i + 1]])
+        if overlap:
+            body[""] = case['txt']
+        pages[case['url']] = {'name': case['name'], 'vol': case['vol'], 'date': case['date'], 'pages': body, 'links': True}
+    return pages
+
+
+class JustiaStub(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """Serves the pages dict from buildCorpus on a free local port.
+
+    failFirst makes the first N requests answer 503 to exercise retries,
+    and the server counts requests and accepted connections. Pages carry an ETag
+    and a matching If-None-Match gets a 304.
+    """
+    daemon_threads = True
+
+    def __init__(self, cases, failFirst=0):
+        BaseHTTPServer.HTTPServer.__init__(self, ('127.0.0.1', 0), _Handler)
+        self.cases = cases
+        self.failFirst = failFirst
+        self.requests = []
+        self.connections = 0
+        self.lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:%d" % self.server_address[1]
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def page(self, path):
+        """Return the html for a path or None for a 404"""
+        m = re.match(r'^/cases/federal/us/(\d+)/$', path)
+        if m:
+            vol = int(m.group(1))
+            res = [RESULT % (u, c['name'], c['date']) for u, c in sorted(self.cases.items(), key=lambda i: _order(i[0])) if c['vol'] == vol]
+            return VOLUME % "".join(res)
+        m = re.match(r'^(/cases/federal/us/\d+/[^/]+/)(.*)\.html$', path)
+        if m and m.group(1) in self.cases:
+            case = self.cases[m.group(1)]
+            body = case['pages'].get(m.group(2))
+            if body is None:
+                return None
+            links = ""
+            if case.get('links'):
+                if m.group(2) == "":
+                    links = "".join(LINK % (m.group(1), s, s) for s in sorted(case['pages']) if s)
+                body = body + "<p>" + DISCLAIMER + "</p>"
+            return CASE % (links, body)
+        return None
+
+
+def _order(url):
+    return [int(p) if p.isdigit() else p for p in url.strip("/").split("/")]
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    #headers and body go out in separate writes, which Nagle would hold back for the delayed ACK
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        srv = self.server
+        with srv.lock:
+            srv.requests.append(self.path)
+            fail = srv.failFirst > 0
+            if fail:
+                srv.failFirst -= 1
+        body = None if fail else srv.page(self.path)
+        status = 503 if fail else (200 if body is not None else 404)
+        etag = '"%s"' % hashlib.sha1(body).hexdigest() if status == 200 else None
+        if etag and self.headers.get('If-None-Match') == etag:
+            status, body = 304, ""
+        body = body if body is not None else "error"
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html")
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
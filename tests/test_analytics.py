@@ -0,0 +1,80 @@
+import unittest, os, json, tempfile, shutil
+import networkx as nx
+from lib import analytics, exporters, grapher
+from test_grapher import record
+
+class TestAnalytics(unittest.TestCase):
+    """Tests for the citation metrics"""
+    def setUp(self):
+        self.cases = [record(1, 1, [[1, 5], [2, 9]]), record(1, 5, [[1, 1]]), record(2, 1, [[1, 1], [1, 5], [3, 3]]),
+                      record(3, 3, [[1, 1]]), record(3, 7, [[3, 3], [1, 1]])]
+        self.G = nx.Graph()
+        gb = grapher.GraphBuilder([], 'g', 0, "")
+        for case in self.cases:
+            gb.addCase(self.G, case)
+        #the same citations as a directed graph for comparing with networkx
+        self.D = nx.DiGraph()
+        for case in self.cases:
+            self.D.add_node(str(case['number']))
+            for cite in case['citations']:
+                self.D.add_edge(str(case['number']), str(cite))
+
+    def test_adjacency(self):
+        nodes, A = analytics.adjacency(self.G)
+        edges = set((nodes[i], nodes[j]) for i, j in zip(*A.nonzero()))
+        self.assertEqual(edges, set(self.D.edges()))
+
+    def test_matchesNetworkx(self):
+        nodes, A = analytics.adjacency(self.G)
+        rank = analytics.pagerank(A)
+        hub, authority = analytics.hits(A)
+        nxRank = nx.pagerank(self.D)
+        nxHub, nxAuthority = nx.hits(self.D)
+        for i, n in enumerate(nodes):
+            self.assertAlmostEqual(rank[i], nxRank[n], 5)
+            self.assertAlmostEqual(hub[i], nxHub[n], 5)
+            self.assertAlmostEqual(authority[i], nxAuthority[n], 5)
+
+    def test_analyze(self):
+        summary = analytics.analyze(self.G)
+        node = self.G.node["[1, 1]"]
+        self.assertEqual((node['inDegree'], node['outDegree']), (4, 2))
+        self.assertEqual(node['citeAge'], 0.0)
+        self.assertEqual(self.G.node["[3, 7]"]['citeAge'], 1.0)
+        self.assertEqual(summary['citations'], 9)
+        self.assertEqual(summary['laterCitations'], 1)
+        self.assertEqual(summary['ageHistogram'], [3, 2, 2])
+        self.assertEqual(summary['topCited'][0], "[1, 1]")
+        self.assertEqual(summary['topPagerank'][0], "[1, 1]")
+        vols = dict((v['vol'], v) for v in summary['volumes'])
+        self.assertEqual(sorted(vols), [1, 2, 3])
+        self.assertEqual((vols[3]['cases'], vols[3]['citationsMade'], vols[3]['citationsReceived']), (2, 3, 2))
+        self.assertEqual(vols[1]['topCase'], "[1, 1]")
+
+    def test_empty(self):
+        summary = analytics.analyze(nx.Graph())
+        self.assertEqual((summary['nodes'], summary['volumes'], summary['ageHistogram']), (0, [], []))
+
+    def test_exports(self):
+        cwd, tmp = os.getcwd(), tempfile.mkdtemp()
+        try:
+            os.chdir(tmp)
+            os.mkdir('vis')
+            grapher.GraphBuilder(self.cases, 'g', 4, "", True).drawGraph()
+            with open('vis/g.json') as fp:
+                nodes = dict((n['id'], n) for n in json.load(fp)['nodes'])
+            self.assertEqual(nodes["[1, 1]"]['inDegree'], 4)
+            with open('vis/g.gml') as fp:
+                self.assertTrue('    pagerank ' in fp.read())
+            bg = exporters.BinaryGraph('vis/g_csr')
+            i = [n['id'] for n in bg.loadNodes()].index("[1, 1]")
+            self.assertEqual(bg.columns['inDegree'][i], 4)
+            self.assertAlmostEqual(bg.columns['pagerank'][i], nodes["[1, 1]"]['pagerank'])
+            with open('vis/g.analytics.json') as fp:
+                self.assertEqual(json.load(fp)['citations'], 9)
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(tmp)
+
+if __name__ == '__main__':
+    unittest.main()
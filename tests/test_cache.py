@@ -0,0 +1,55 @@
+import unittest, tempfile, shutil, os
+from lib import cache, fetcher, scrapers
+import justia_stub
+
+class TestPageCache(unittest.TestCase):
+    """Tests for the raw page cache and offline scraping"""
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_putGet(self):
+        for compress in (True, False):
+            pc = cache.PageCache(os.path.join(self.dir, str(compress)), compress=compress)
+            pc.put("http://a/1", "<html>one</html>", '"e1"')
+            self.assertEqual(pc.get("http://a/1"), "<html>one</html>")
+            self.assertEqual(pc.lookup("http://a/1")['etag'], '"e1"')
+            self.assertEqual(pc.get("http://a/2"), None)
+
+    def test_contentAddressed(self):
+        pc = cache.PageCache(self.dir)
+        pc.put("http://a/1", "same body")
+        pc.put("http://a/2", "same body")
+        self.assertEqual(len(pc), 2)
+        self.assertEqual(pc.db.execute("SELECT COUNT(*) FROM objects").fetchone()[0], 1)
+
+    def test_eviction(self):
+        pc = cache.PageCache(self.dir, maxBytes=250, compress=False)
+        for i in xrange(5):
+            pc.put("http://a/%d" % i, str(i) * 100)
+        self.assertTrue(pc.size <= 250)
+        self.assertEqual(pc.get("http://a/0"), None)
+        self.assertEqual(pc.get("http://a/4"), "4" * 100)
+
+    def test_revalidateAndOffline(self):
+        server = justia_stub.JustiaStub(justia_stub.buildCorpus(1, 3)).start()
+        url = server.url
+        try:
+            web = fetcher.Fetcher(cache=cache.PageCache(self.dir))
+            links = scrapers.VolScraper(1, 1, url, web).scrapeVolumes()
+            online = scrapers.CaseScraper(False, links, os.path.join(self.dir, "on"), False, url, fetcher=web).getCases()
+            n = len(server.requests)
+            web.fetch(url + "/cases/federal/us/1/")
+            self.assertEqual(len(server.requests), n + 1)
+            self.assertEqual(len(web.cache), 4)
+        finally:
+            server.stop()
+        off = fetcher.Fetcher(cache=cache.PageCache(self.dir), offline=True)
+        links = scrapers.VolScraper(1, 1, url, off).scrapeVolumes()
+        offline = scrapers.CaseScraper(False, links, os.path.join(self.dir, "off"), False, url, fetcher=off).getCases()
+        self.assertEqual(offline, online)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,21 +8,29 @@ nameList = [
     ], 
     "vol": 1, 
     "citations": [
-      [
-        1, 
-        1
-      ], 
-      [
-        1, 
-        1
-      ], 
       [
         1, 
         1
       ]
     ], 
     "date": " ", 
-    "txt": "\n\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\tSyllabus\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\tCase\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\n\t\t\t\n\t\t\t\t\t\t\tU.S. Supreme Court HYAM'S LESSEE v. EDWARDS, 1 U.S. 1 (1759)  1 U.S. 1 (Dall.)  The Lessee of Hyam and others v. Edwards  Supreme Court of Pennsylvania  April Term, 1759  Copy of a Deed inrolled in the King's Bench in England, proved before the Lord Mayor of London to be a true one; allowed to be given in Evidence to a Jury to support a Title to Lands in this Province.* Footnotes [Footnote *] 11 mod. 2 c. 2. [ Hyam's Lessee v. Edwards Footnote 1 U.S. 1 (1759) ] \n\t\t\t\t\n\n\t\t\t\n\t\t\t\tDisclaimer: Official Supreme Court case law is only found in the print version of the United States Reports. Justia case law is provided for general informational purposes only, and may not reflect current legal developments, verdicts or settlements. We make no warranties or guarantees about the accuracy, completeness, or adequacy of the information contained on this site or information linked to from this site. Please check official sources.\n\t\t\t\t\n\t\t"
+    "txt": "Syllabus\nCase\nU.S. Supreme Court HYAM'S LESSEE v. EDWARDS, 1 U.S. 1 (1759)  1 U.S. 1 (Dall.)  The Lessee of Hyam and others v. Edwards  Supreme Court of Pennsylvania  April Term, 1759  Copy of a Deed inrolled in the King's Bench in England, proved before the Lord Mayor of London to be a true one; allowed to be given in Evidence to a Jury to support a Title to Lands in this Province.* Footnotes [Footnote *] 11 mod. 2 c. 2. [ Hyam's Lessee v. Edwards Footnote 1 U.S. 1 (1759) ]", 
+    "sections": [
+      [
+        "majority", 
+        0, 
+        479
+      ]
+    ], 
+    "citationCounts": {
+      "majority": [
+        [
+          1, 
+          1, 
+          3
+        ]
+      ]
+    }
   }, 
   {
     "name": "BETHEL v. LLOYD", 
@@ -33,23 +41,31 @@ nameList = [
     ], 
     "vol": 1, 
     "citations": [
-      [
-        1, 
-        2
-      ], 
-      [
-        1, 
-        2
-      ], 
       [
         1, 
         2
       ]
     ], 
     "date": " ", 
-    "txt": "\n\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\tSyllabus\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\tCase\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\n\t\t\t\n\t\t\t\t\t\t\tU.S. Supreme Court BETHEL v. LLOYD, 1 U.S. 2 (1759)  1 U.S. 2 (Dall.)  Bethel v. Lloyd and Others.  Supreme Court of Pennsylvania  April Term, 1759  Partition. Plea nontenet insimul, & c. Defendants permitted to give in Evidence to the Jury, that some of them were not Tenants of the Freehold* but only Tenants at Will. Footnotes [Footnote *] Cro. El. 759. Litt. Rep.[ Bethel v. Lloyd Footnote 1 U.S. 2 (1759) ] \n\t\t\t\t\n\n\t\t\t\n\t\t\t\tDisclaimer: Official Supreme Court case law is only found in the print version of the United States Reports. Justia case law is provided for general informational purposes only, and may not reflect current legal developments, verdicts or settlements. We make no warranties or guarantees about the accuracy, completeness, or adequacy of the information contained on this site or information linked to from this site. Please check official sources.\n\t\t\t\t\n\t\t"
-    }]
-
+    "txt": "Syllabus\nCase\nU.S. Supreme Court BETHEL v. LLOYD, 1 U.S. 2 (1759)  1 U.S. 2 (Dall.)  Bethel v. Lloyd and Others.  Supreme Court of Pennsylvania  April Term, 1759  Partition. Plea nontenet insimul, & c. Defendants permitted to give in Evidence to the Jury, that some of them were not Tenants of the Freehold* but only Tenants at Will. Footnotes [Footnote *] Cro. El. 759. Litt. Rep.[ Bethel v. Lloyd Footnote 1 U.S. 2 (1759) ]", 
+    "sections": [
+      [
+        "majority", 
+        0, 
+        425
+      ]
+    ], 
+    "citationCounts": {
+      "majority": [
+        [
+          1, 
+          2, 
+          3
+        ]
+      ]
+    }
+  }
+]
 caseUrls = [{'url': '/cases/federal/us/1/1/', 'vol': 1, 'date': ' ', 'caseName': "HYAM'S LESSEE v. EDWARDS"}, {'url': '/cases/federal/us/1/2/', 'vol': 1, 'date': ' ', 'caseName': 'BETHEL v. LLOYD'}, {'url': '/cases/federal/us/1/3/', 'vol': 1, 'date': ' ', 'caseName': 'STEVENSON v. PEMBERTON'}, {'url': '/cases/federal/us/1/4/', 'vol': 1, 'date': ' ', 'caseName': 'ASHETON v. ASHETON'}, {'url': '/cases/federal/us/1/5/', 'vol': 1, 'date': ' ', 'caseName': 'KING v. LUKENS'}, {'url': '/cases/federal/us/1/7/', 'vol': 1, 'date': ' ', 'caseName': 'WALLACE v. CHILD AND STYLES'}, {'url': '/cases/federal/us/1/8/', 'vol': 1, 'date': ' ', 'caseName': 'PRICE v. WATKINS'}, {'url': '/cases/federal/us/1/11/', 'vol': 1, 'date': ' ', 'caseName': 'DAVEY v. TURNER'}, {'url': '/cases/federal/us/1/15/', 'vol': 1, 'date': ' ', 'caseName': 'BOEHM AND SHITZ v. ENGLE'}, {'url': '/cases/federal/us/1/16/', 'vol': 1, 'date': ' ', 'caseName': 'RICHE AND RICHARDS v. BROADFIELD'}, {'url': '/cases/federal/us/1/17/', 'vol': 1, 'date': ' ', 'caseName': "LLOYD'S LESSEE v. TAYLOR"}, {'url': '/cases/federal/us/1/18/', 'vol': 1, 'date': ' ', 'caseName': "PROPRIETARY'S LESSEE v. RALSTON"}, {'url': '/cases/federal/us/1/20/', 'vol': 1, 'date': ' ', 'caseName': 'ANONYMOUS'}, {'url': '/cases/federal/us/1/22/', 'vol': 1, 'date': ' ', 'caseName': 'STEINER v. FELL'}, {'url': '/cases/federal/us/1/23/', 'vol': 1, 'date': ' ', 'caseName': 'WHEELER v. HUGHES'}, {'url': '/cases/federal/us/1/28/', 'vol': 1, 'date': ' ', 'caseName': 'TOWNSHIP OF FALLOWFIELD v. MARLBOROUGH TOWNSHIP'}, {'url': '/cases/federal/us/1/29/', 'vol': 1, 'date': ' ', 'caseName': 'KEPPELE v. WILLIAMS'}, {'url': '/cases/federal/us/1/33/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. MALIN'}, {'url': '/cases/federal/us/1/35/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. CARLISLE'}, {'url': '/cases/federal/us/1/39/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. ROBERTS'}, {'url': '/cases/federal/us/1/41/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. SWEERS'}, {'url': '/cases/federal/us/1/47/', 'vol': 1, 'date': ' ', 'caseName': "IN RE JAMES' CLAIM"}, {'url': '/cases/federal/us/1/49/', 'vol': 1, 'date': ' ', 'caseName': 'MONTGOMERY v. HENRY'}, {'url': '/cases/federal/us/1/52/', 'vol': 1, 'date': ' ', 'caseName': 'JACOBS v. ADAMS'}, {'url': '/cases/federal/us/1/53/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. CHAPMAN'}, {'url': '/cases/federal/us/1/60/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. BUFFINGTON'}, {'url': '/cases/federal/us/1/62/', 'vol': 1, 'date': ' ', 'caseName': 'MCVEAUGH v. GOODS'}, {'url': '/cases/federal/us/1/63/', 'vol': 1, 'date': ' ', 'caseName': 'MCDILL v. MCDILL'}, {'url': '/cases/federal/us/1/64/', 'vol': 1, 'date': ' ', 'caseName': "MORRIS' LESSEE v. VANDEREN"}, {'url': '/cases/federal/us/1/68/', 'vol': 1, 'date': ' ', 'caseName': "SHRIDER'S LESSEE v. MORGAN"}, {'url': '/cases/federal/us/1/69/', 'vol': 1, 'date': ' ', 'caseName': 'WILCOX v. HENRY'}, {'url': '/cases/federal/us/1/72/', 'vol': 1, 'date': ' ', 'caseName': 'KENNEDY v. FURY'}, {'url': '/cases/federal/us/1/73/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. MESCA'}, {'url': '/cases/federal/us/1/77/', 'vol': 1, 'date': ' ', 'caseName': 'MCCARTY v. NIXON'}, {'url': '/cases/federal/us/1/81/', 'vol': 1, 'date': ' ', 'caseName': 'CARLISLE v. CUNNINGHAM'}, {'url': '/cases/federal/us/1/82/', 'vol': 1, 'date': ' ', 'caseName': 'LEIB v. BOLTON'}, {'url': '/cases/federal/us/1/85/', 'vol': 1, 'date': ' ', 'caseName': "RODMAN v. HOOPS EX'RS"}, {'url': '/cases/federal/us/1/86/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. DOAN'}, {'url': '/cases/federal/us/1/93/', 'vol': 1, 'date': ' ', 'caseName': "HAMILTON'S LESSEE v. GALLOWAY"}, {'url': '/cases/federal/us/1/94/', 'vol': 1, 'date': ' ', 'caseName': 'HIGHT v. WILSON'}, {'url': '/cases/federal/us/1/95/', 'vol': 1, 'date': ' ', 'caseName': 'TALBOT v. COMMANDERS & OWNERS OF THREE BRIGS'}, {'url': '/cases/federal/us/1/110/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. KEATING'}, {'url': '/cases/federal/us/1/111/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. DE LONGCHAMPS'}, {'url': '/cases/federal/us/1/119/', 'vol': 1, 'date': ' ', 'caseName': 'GERARD v. BASSE'}, {'url': '/cases/federal/us/1/123/', 'vol': 1, 'date': ' ', 'caseName': "DAVISON'S LESSEE v. BLOOMER"}, {'url': '/cases/federal/us/1/124/', 'vol': 1, 'date': ' ', 'caseName': 'TRACY v. WIKOFF'}, {'url': '/cases/federal/us/1/125/', 'vol': 1, 'date': ' ', 'caseName': 'WHARTON v. MORRIS'}, {'url': '/cases/federal/us/1/126/', 'vol': 1, 'date': ' ', 'caseName': "WILSON'S LESSEE v. CAMPBELL"}, {'url': '/cases/federal/us/1/127/', 'vol': 1, 'date': ' ', 'caseName': 'SHOEMAKER v. SHIRTLIFFE'}, {'url': '/cases/federal/us/1/129/', 'vol': 1, 'date': ' ', 'caseName': 'BUCKLEY v. DURANT'}, {'url': '/cases/federal/us/1/130/', 'vol': 1, 'date': ' ', 'caseName': 'CARREW v. WILLING'}, {'url': '/cases/federal/us/1/131/', 'vol': 1, 'date': ' ', 'caseName': 'CAMPBELL v. RICHARDSON'}, {'url': '/cases/federal/us/1/136/', 'vol': 1, 'date': ' ', 'caseName': 'APPEAL OF GRAHAM'}, {'url': '/cases/federal/us/1/137/', 'vol': 1, 'date': ' ', 'caseName': "VANHORN'S LESSEE v. HARRISON"}, {'url': '/cases/federal/us/1/139/', 'vol': 1, 'date': ' ', 'caseName': 'MCCULLUM v. COXE'}, {'url': '/cases/federal/us/1/140/', 'vol': 1, 'date': ' ', 'caseName': 'MORRIS v. DE MARS'}, {'url': '/cases/federal/us/1/141/', 'vol': 1, 'date': ' ', 'caseName': 'WOODS v. COURTER'}, {'url': '/cases/federal/us/1/142/', 'vol': 1, 'date': ' ', 'caseName': 'DORROW v. KELLY'}, {'url': '/cases/federal/us/1/145/', 'vol': 1, 'date': ' ', 'caseName': 'BROWN v. SCOTT'}, {'url': '/cases/federal/us/1/147/', 'vol': 1, 'date': ' ', 'caseName': 'MORRIS v. TARIN'}, {'url': '/cases/federal/us/1/149/', 'vol': 1, 'date': ' ', 'caseName': 'HENDERSON v. ALLEN'}, {'url': '/cases/federal/us/1/150/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. CALDWELL'}, {'url': '/cases/federal/us/1/151/', 'vol': 1, 'date': ' ', 'caseName': 'HOLLINGSWORTH v. HAMELIN'}, {'url': '/cases/federal/us/1/152/', 'vol': 1, 'date': ' ', 'caseName': 'IN RE BARNET'}, {'url': '/cases/federal/us/1/154/', 'vol': 1, 'date': ' ', 'caseName': 'VIENNE v. MCCARTY'}, {'url': '/cases/federal/us/1/156/', 'vol': 1, 'date': ' ', 'caseName': 'WEAVER v. LAWRENCE'}, {'url': '/cases/federal/us/1/158/', 'vol': 1, 'date': ' ', 'caseName': 'TAYLOR v. KNOX'}, {'url': '/cases/federal/us/1/161/', 'vol': 1, 'date': ' ', 'caseName': 'HOLLINGSWORTH v. LEIPER'}, {'url': '/cases/federal/us/1/162/', 'vol': 1, 'date': ' ', 'caseName': 'OGDEN v. ASH'}, {'url': '/cases/federal/us/1/165/', 'vol': 1, 'date': ' ', 'caseName': 'SLIVER v. SHELBACK'}, {'url': '/cases/federal/us/1/167/', 'vol': 1, 'date': ' ', 'caseName': 'PIRATE v. DALBY'}, {'url': '/cases/federal/us/1/169/', 'vol': 1, 'date': ' ', 'caseName': 'KUNCKEL v. BAKER'}, {'url': '/cases/federal/us/1/170/', 'vol': 1, 'date': ' ', 'caseName': "MOORE'S LESSEE v. FEW"}, {'url': '/cases/federal/us/1/171/', 'vol': 1, 'date': ' ', 'caseName': 'DUTILH v. RITCHIE'}, {'url': '/cases/federal/us/1/172/', 'vol': 1, 'date': ' ', 'caseName': 'SHOTWELL v. BOEHM'}, {'url': '/cases/federal/us/1/173/', 'vol': 1, 'date': ' ', 'caseName': 'GRIER v. GRIER'}, {'url': '/cases/federal/us/1/175/', 'vol': 1, 'date': ' ', 'caseName': "KERLIN'S LESSEE v. BULL"}, {'url': '/cases/federal/us/1/180/', 'vol': 1, 'date': ' ', 'caseName': 'PURVIANCE v. ANGUS'}, {'url': '/cases/federal/us/1/188/', 'vol': 1, 'date': ' ', 'caseName': 'JAMES v. ALLEN'}, {'url': '/cases/federal/us/1/194/', 'vol': 1, 'date': ' ', 'caseName': 'GERARD v. LA COSTE'}, {'url': '/cases/federal/us/1/197/', 'vol': 1, 'date': ' ', 'caseName': 'PHILE v. THE ANNA'}, {'url': '/cases/federal/us/1/208/', 'vol': 1, 'date': ' ', 'caseName': 'JANUARY v. GOODMAN'}, {'url': '/cases/federal/us/1/210/', 'vol': 1, 'date': ' ', 'caseName': 'POLLARD v. SHAFFER'}, {'url': '/cases/federal/us/1/216/', 'vol': 1, 'date': ' ', 'caseName': 'MUSGROVE v. GIBBS'}, {'url': '/cases/federal/us/1/218/', 'vol': 1, 'date': ' ', 'caseName': "DOANE'S ADM'RS v. PENHALLOW"}, {'url': '/cases/federal/us/1/222/', 'vol': 1, 'date': ' ', 'caseName': 'EASTWICK v. HUGG'}, {'url': '/cases/federal/us/1/225/', 'vol': 1, 'date': ' ', 'caseName': 'KUHN v. TRIMER'}, {'url': '/cases/federal/us/1/226/', 'vol': 1, 'date': ' ', 'caseName': 'BUSBY v. BUSBY'}, {'url': '/cases/federal/us/1/229/', 'vol': 1, 'date': ' ', 'caseName': 'MILLER v. HALL'}, {'url': '/cases/federal/us/1/233/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. GORDON'}, {'url': '/cases/federal/us/1/234/', 'vol': 1, 'date': ' ', 'caseName': 'STEINMETZ v. CURREY'}, {'url': '/cases/federal/us/1/236/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. SHAFFER'}, {'url': '/cases/federal/us/1/238/', 'vol': 1, 'date': ' ', 'caseName': 'POULTNEY v. ROSS'}, {'url': '/cases/federal/us/1/239/', 'vol': 1, 'date': ' ', 'caseName': 'BROWN v. SUTTER'}, {'url': '/cases/federal/us/1/240/', 'vol': 1, 'date': ' ', 'caseName': 'NEWMAN v. BRADLEY'}, {'url': '/cases/federal/us/1/241/', 'vol': 1, 'date': ' ', 'caseName': 'PENMAN v. WAYNE'}, {'url': '/cases/federal/us/1/248/', 'vol': 1, 'date': ' ', 'caseName': 'WALLACE v. FITZSIMMONS'}, {'url': '/cases/federal/us/1/252/', 'vol': 1, 'date': ' ', 'caseName': 'ROBERTSON v. VOGLE'}, {'url': '/cases/federal/us/1/257/', 'vol': 1, 'date': ' ', 'caseName': 'HOLLINGSWORTH v. OGLE'}, {'url': '/cases/federal/us/1/261/', 'vol': 1, 'date': ' ', 'caseName': 'PHELPS v. HOLKER'}, {'url': '/cases/federal/us/1/265/', 'vol': 1, 'date': ' ', 'caseName': 'HENRY v. RISK'}, {'url': '/cases/federal/us/1/267/', 'vol': 1, 'date': ' ', 'caseName': 'WILLIAMS v. GEHEOGAN'}, {'url': '/cases/federal/us/1/268/', 'vol': 1, 'date': ' ', 'caseName': 'GUTHRIE v. WHITE'}, {'url': '/cases/federal/us/1/269/', 'vol': 1, 'date': ' ', 'caseName': 'TILLIER v. WHITEHEAD'}, {'url': '/cases/federal/us/1/270/', 'vol': 1, 'date': ' ', 'caseName': 'STEINMETZ v. CURRIE'}, {'url': '/cases/federal/us/1/272/', 'vol': 1, 'date': ' ', 'caseName': 'MIFFLIN v. BINGHAM'}, {'url': '/cases/federal/us/1/278/', 'vol': 1, 'date': ' ', 'caseName': 'LEWIS v. MARIS'}, {'url': '/cases/federal/us/1/288/', 'vol': 1, 'date': ' ', 'caseName': 'KIRKBRIDE v. DURDEN'}, {'url': '/cases/federal/us/1/293/', 'vol': 1, 'date': ' ', 'caseName': 'TETTER v. RAPESNYDER'}, {'url': '/cases/federal/us/1/295/', 'vol': 1, 'date': ' ', 'caseName': 'MORGAN v. ECKART'}, {'url': '/cases/federal/us/1/296/', 'vol': 1, 'date': ' ', 'caseName': 'BOLTON v. MARTIN'}, {'url': '/cases/federal/us/1/305/', 'vol': 1, 'date': ' ', 'caseName': 'KUNCKLE v. WYNICK'}, {'url': '/cases/federal/us/1/308/', 'vol': 1, 'date': ' ', 'caseName': 'COOPER v. COATS'}, {'url': '/cases/federal/us/1/311/', 'vol': 1, 'date': ' ', 'caseName': 'APPEAL OF BROWN'}, {'url': '/cases/federal/us/1/313/', 'vol': 1, 'date': ' ', 'caseName': 'WILLIAMS v. CRAIG'}, {'url': '/cases/federal/us/1/316/', 'vol': 1, 'date': ' ', 'caseName': 'PLOWMAN v. ABRAMS'}, {'url': '/cases/federal/us/1/317/', 'vol': 1, 'date': ' ', 'caseName': 'RICHETTE v. STEWART'}, {'url': '/cases/federal/us/1/319/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. OSWALD'}, {'url': '/cases/federal/us/1/330/', 'vol': 1, 'date': ' ', 'caseName': 'LESHER v. GEHR'}, {'url': '/cases/federal/us/1/335/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. TEISCHER'}, {'url': '/cases/federal/us/1/339/', 'vol': 1, 'date': ' ', 'caseName': 'JAMES v. BROWNE'}, {'url': '/cases/federal/us/1/340/', 'vol': 1, 'date': ' ', 'caseName': 'BUTCHER v. COATS'}, {'url': '/cases/federal/us/1/341/', 'vol': 1, 'date': ' ', 'caseName': 'INGLES v. BRINGHURST'}, {'url': '/cases/federal/us/1/347/', 'vol': 1, 'date': ' ', 'caseName': 'GEYER v. SMITH'}, {'url': '/cases/federal/us/1/349/', 'vol': 1, 'date': ' ', 'caseName': 'OXLEY v. COWPERTHWAITE'}, {'url': '/cases/federal/us/1/351/', 'vol': 1, 'date': ' ', 'caseName': 'WALTON v. WILLIS'}, {'url': '/cases/federal/us/1/355/', 'vol': 1, 'date': ' ', 'caseName': 'HART v. JAMES'}, {'url': '/cases/federal/us/1/356/', 'vol': 1, 'date': ' ', 'caseName': 'CASE OF STARRET'}, {'url': '/cases/federal/us/1/357/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. SPARHAWK'}, {'url': '/cases/federal/us/1/364/', 'vol': 1, 'date': ' ', 'caseName': 'KUNKLE v. KUNCKLE'}, {'url': '/cases/federal/us/1/366/', 'vol': 1, 'date': ' ', 'caseName': 'GORGERAT v. MCCARTY'}, {'url': '/cases/federal/us/1/369/', 'vol': 1, 'date': ' ', 'caseName': 'WATERS v. MILLAR'}, {'url': '/cases/federal/us/1/371/', 'vol': 1, 'date': ' ', 'caseName': 'GIBBS v. GIBBS'}, {'url': '/cases/federal/us/1/375/', 'vol': 1, 'date': ' ', 'caseName': 'MCCLENACHAN v. MCCARTY'}, {'url': '/cases/federal/us/1/378/', 'vol': 1, 'date': ' ', 'caseName': 'PENROSE v. HART'}, {'url': '/cases/federal/us/1/380/', 'vol': 1, 'date': ' ', 'caseName': 'PLEASANTS v. MENG'}, {'url': '/cases/federal/us/1/392/', 'vol': 1, 'date': ' ', 'caseName': 'FARREL v. MCCLEA'}, {'url': '/cases/federal/us/1/393/', 'vol': 1, 'date': ' ', 'caseName': 'CAMP v. LOCKWOOD'}, {'url': '/cases/federal/us/1/406/', 'vol': 1, 'date': ' ', 'caseName': 'JOHNSON v. HOCKER'}, {'url': '/cases/federal/us/1/409/', 'vol': 1, 'date': ' ', 'caseName': 'STEELE v. STEELE'}, {'url': '/cases/federal/us/1/411/', 'vol': 1, 'date': ' ', 'caseName': 'SCHLOSSER v. LESHER'}, {'url': '/cases/federal/us/1/415/', 'vol': 1, 'date': ' ', 'caseName': 'KENNEDY v. NEDROW'}, {'url': '/cases/federal/us/1/420/', 'vol': 1, 'date': ' ', 'caseName': "HAMILTON v. CALLENDER'S EXRS"}, {'url': '/cases/federal/us/1/424/', 'vol': 1, 'date': ' ', 'caseName': "THOMSON'S LESSEE v. WHITE"}, {'url': '/cases/federal/us/1/428/', 'vol': 1, 'date': ' ', 'caseName': "D'UTRICHT v. MELCHOR"}, {'url': '/cases/federal/us/1/430/', 'vol': 1, 'date': ' ', 'caseName': 'LEVINZ v. WILL'}, {'url': '/cases/federal/us/1/436/', 'vol': 1, 'date': ' ', 'caseName': 'PARKER v. WOOD'}, {'url': '/cases/federal/us/1/439/', 'vol': 1, 'date': ' ', 'caseName': 'PHILLIPS v. HYDE'}, {'url': '/cases/federal/us/1/440/', 'vol': 1, 'date': ' ', 'caseName': 'ADAMS v. LA COMB'}, {'url': '/cases/federal/us/1/441/', 'vol': 1, 'date': ' ', 'caseName': 'MCCULLOUGH v. HOUSTON'}, {'url': '/cases/federal/us/1/444/', 'vol': 1, 'date': ' ', 'caseName': 'CUMMINGS v. LYNN'}, {'url': '/cases/federal/us/1/449/', 'vol': 1, 'date': ' ', 'caseName': 'QUESNEL v. MUSSY'}, {'url': '/cases/federal/us/1/450/', 'vol': 1, 'date': ' ', 'caseName': 'HOOTON v. WILL'}, {'url': '/cases/federal/us/1/452/', 'vol': 1, 'date': ' ', 'caseName': 'PRIMER v. KUHN'}, {'url': '/cases/federal/us/1/456/', 'vol': 1, 'date': ' ', 'caseName': 'GRAEME v. HARRIS'}, {'url': '/cases/federal/us/1/457/', 'vol': 1, 'date': ' ', 'caseName': 'BUNNER v. NEIL'}, {'url': '/cases/federal/us/1/458/', 'vol': 1, 'date': ' ', 'caseName': 'THOMPSON v. MUSSER'}, {'url': '/cases/federal/us/1/469/', 'vol': 1, 'date': ' ', 'caseName': 'RESPUBLICA v. BETSEY'}, {'url': '/cases/federal/us/1/480/', 'vol': 1, 'date': ' ', 'caseName': 'LYLE v. FOREMAN'}, {'url': '/cases/federal/us/1/481/', 'vol': 1, 'date': ' ', 'caseName': "GRAFF v. SMITH'S ADM'RS"}, {'url': '/cases/federal/us/1/486/', 'vol': 1, 'date': ' ', 'caseName': 'PRINGLE v. MCCLENACHAN'}, {'url': '/cases/federal/us/2/1/', 'vol': 2, 'date': ' ', 'caseName': 'THE RESOLUTION'}, {'url': '/cases/federal/us/2/19/', 'vol': 2, 'date': ' ', 'caseName': 'THE RESOLUTION'}, {'url': '/cases/federal/us/2/34/', 'vol': 2, 'date': ' ', 'caseName': 'THE ERSTERN'}, {'url': '/cases/federal/us/2/36/', 'vol': 2, 'date': ' ', 'caseName': 'KEANE v. THE GLOUCESTER'}, {'url': '/cases/federal/us/2/43/', 'vol': 2, 'date': ' ', 'caseName': 'BOINOD v. PELOSI'}, {'url': '/cases/federal/us/2/44/', 'vol': 2, 'date': ' ', 'caseName': 'BOWEN v. DOUGLASS'}, {'url': '/cases/federal/us/2/45/', 'vol': 2, 'date': ' ', 'caseName': "INGLIS FOR USE OF REEDE v. INGLIS'S EXRS"}, {'url': '/cases/federal/us/2/50/', 'vol': 2, 'date': ' ', 'caseName': 'INNIS v. MILLER'}, {'url': '/cases/federal/us/2/51/', 'vol': 2, 'date': ' ', 'caseName': 'RAPALJE v. EMORY'}, {'url': '/cases/federal/us/2/55/', 'vol': 2, 'date': ' ', 'caseName': 'COWPERTHWAITE v. JONES'}, {'url': '/cases/federal/us/2/58/', 'vol': 2, 'date': ' ', 'caseName': 'RUE v. MITCHELL'}, {'url': '/cases/federal/us/2/60/', 'vol': 2, 'date': ' ', 'caseName': 'PRICE v. RALSTON'}, {'url': '/cases/federal/us/2/68/', 'vol': 2, 'date': ' ', 'caseName': 'WOGLAM v. COWPERTHWAITE'}, {'url': '/cases/federal/us/2/70/', 'vol': 2, 'date': ' ', 'caseName': 'POWELL v. BIDDLE'}, {'url': '/cases/federal/us/2/74/', 'vol': 2, 'date': ' ', 'caseName': 'BRAILEY v. MILLER'}, {'url': '/cases/federal/us/2/75/', 'vol': 2, 'date': ' ', 'caseName': 'HOWELL v. WOLFERT'}, {'url': '/cases/federal/us/2/77/', 'vol': 2, 'date': ' ', 'caseName': 'SHARPE v. THATCHER'}, {'url': '/cases/federal/us/2/80/', 'vol': 2, 'date': ' ', 'caseName': "STACKHOUSE'S LESSEE v. STACKHOUSE"}, {'url': '/cases/federal/us/2/81/', 'vol': 2, 'date': ' ', 'caseName': 'TAXIER v. SWEET'}, {'url': '/cases/federal/us/2/86/', 'vol': 2, 'date': ' ', 'caseName': 'RESPUBLICA v. MCCARTY'}, {'url': '/cases/federal/us/2/88/', 'vol': 2, 'date': ' ', 'caseName': 'RESPUBLICA v. WEIDLE'}, {'url': '/cases/federal/us/2/92/', 'vol': 2, 'date': ' ', 'caseName': 'RESPUBLICA v. STEELE'}, {'url': '/cases/federal/us/2/93/', 'vol': 2, 'date': ' ', 'caseName': "ANDREW'S LESSEE v. FLEMING"}, {'url': '/cases/federal/us/2/94/', 'vol': 2, 'date': ' ', 'caseName': 'PENNINGTON v. SCOTT'}, {'url': '/cases/federal/us/2/95/', 'vol': 2, 'date': ' ', 'caseName': "CECIL'S LESSEE v. LEBENSTONE"}, {'url': '/cases/federal/us/2/96/', 'vol': 2, 'date': ' ', 'caseName': "LESHER'S LESSEE v. LEVAN"}, {'url': '/cases/federal/us/2/97/', 'vol': 2, 'date': ' ', 'caseName': "PRINGLE v. BLACK'S EX'RS"}, {'url': '/cases/federal/us/2/98/', 'vol': 2, 'date': ' ', 'caseName': 'MCCURDY v. POTTS'}, {'url': '/cases/federal/us/2/100/', 'vol': 2, 'date': ' ', 'caseName': 'MCKIMM v. RIDDLE'}, {'url': '/cases/federal/us/2/102/', 'vol': 2, 'date': ' ', 'caseName': 'HOARE v. ALLEN'}, {'url': '/cases/federal/us/2/105/', 'vol': 2, 'date': ' ', 'caseName': 'TODD v. THOMPSON'}, {'url': '/cases/federal/us/2/108/', 'vol': 2, 'date': ' ', 'caseName': 'RESPUBLICA v. MATLACK'}, {'url': '/cases/federal/us/2/109/', 'vol': 2, 'date': ' ', 'caseName': 'RESPUBLICA v. COATES'}, {'url': '/cases/federal/us/2/110/', 'vol': 2, 'date': ' ', 'caseName': 'BORGER v. SEARLE'}, {'url': '/cases/federal/us/2/112/', 'vol': 2, 'date': ' ', 'caseName': 'RESPUBLICA V.GRIFFITHS'}, {'url': '/cases/federal/us/2/115/', 'vol': 2, 'date': ' ', 'caseName': 'TARIN v. MORRIS'}, {'url': '/cases/federal/us/2/116/', 'vol': 2, 'date': ' ', 'caseName': "DOUGLASS' LESSEE v. SANDERSON"}, {'url': '/cases/federal/us/2/118/', 'vol': 2, 'date': ' ', 'caseName': 'RESPUBLICA v. LACAZE'}, {'url': '/cases/federal/us/2/124/', 'vol': 2, 'date': ' ', 'caseName': 'RESPUBLICA v. ROBERTS'}, {'url': '/cases/federal/us/2/125/', 'vol': 2, 'date': ' ', 'caseName': 'LEECH v. ARMITAGE'}, {'url': '/cases/federal/us/2/126/', 'vol': 2, 'date': ' ', 'caseName': "JOY'S LESSEE v. COSSART"}, {'url': '/cases/federal/us/2/127/', 'vol': 2, 'date': ' ', 'caseName': 'SCOTT v. CROSDALE'}, {'url': '/cases/federal/us/2/128/', 'vol': 2, 'date': ' ', 'caseName': 'THOMPSON v. THOMPSON'}, {'url': '/cases/federal/us/2/129/', 'vol': 2, 'date': ' ', 'caseName': "SWEENEY'S LESSEE v. TONER"}, {'url': '/cases/federal/us/2/131/', 'vol': 2, 'date': ' ', 'caseName': 'FREY v. LEEPER'}, {'url': '/cases/federal/us/2/132/', 'vol': 2, 'date': ' ', 'caseName': 'FOXCRAFT v. NAGLE'}, {'url': '/cases/federal/us/2/133/', 'vol': 2, 'date': ' ', 'caseName': "BOND v. HAAS' EXRS"}, {'url': '/cases/federal/us/2/134/', 'vol': 2, 'date': ' ', 'caseName': 'INGRAHAM v. GIBBS'}, {'url': '/cases/federal/us/2/137/', 'vol': 2, 'date': ' ', 'caseName': "HOOD'S EX'RS v. NESBIT"}, {'url': '/cases/federal/us/2/141/', 'vol': 2, 'date': ' ', 'caseName': 'CATON v. MCCARTY'}, {'url': '/cases/federal/us/2/144/', 'vol': 2, 'date': ' ', 'caseName': 'GORGERAT v. MCCARTY'}, {'url': '/cases/federal/us/2/150/', 'vol': 2, 'date': ' ', 'caseName': 'FOXCRAFT v. NAGLE'}, {'url': '/cases/federal/us/2/151/', 'vol': 2, 'date': ' ', 'caseName': 'BARR v. CRAIG'}, {'url': '/cases/federal/us/2/156/', 'vol': 2, 'date': ' ', 'caseName': 'DUFFIELD v. STILLE'}, {'url': '/cases/federal/us/2/158/', 'vol': 2, 'date': ' ', 'caseName': 'RALSTON v. BELL'}, {'url': '/cases/federal/us/2/160/', 'vol': 2, 'date': ' ', 'caseName': 'ROSS v. RITTENHOUSE'}, {'url': '/cases/federal/us/2/170/', 'vol': 2, 'date': ' ', 'caseName': 'MARSHALL v. MONTGOMERY'}, {'url': '/cases/federal/us/2/171/', 'vol': 2, 'date': ' ', 'caseName': 'FIELD, FOR USE OF OXLEY v. BIDDLE'}, {'url': '/cases/federal/us/2/173/', 'vol': 2, 'date': ' ', 'caseName': 'MCMINN v. OWEN'}, {'url': '/cases/federal/us/2/174/', 'vol': 2, 'date': ' ', 'caseName': 'HENDERSON v. CLARKSON'}, {'url': '/cases/federal/us/2/176/', 'vol': 2, 'date': ' ', 'caseName': "HALDANE v. DUCHE'S EX'RS"}, {'url': '/cases/federal/us/2/179/', 'vol': 2, 'date': ' ', 'caseName': 'SHAW v. WALLACE'}, {'url': '/cases/federal/us/2/180/', 'vol': 2, 'date': ' ', 'caseName': 'WOOD v. ROACH'}, {'url': '/cases/federal/us/2/183/', 'vol': 2, 'date': ' ', 'caseName': 'BLOOMFIELD v. BUDDEN'}, {'url': '/cases/federal/us/2/184/', 'vol': 2, 'date': ' ', 'caseName': 'JOHNS v. NICHOLS'}, {'url': '/cases/federal/us/2/191/', 'vol': 2, 'date': ' ', 'caseName': "GRUBB'S EX'RS v. GRUBB'S EX'RS"}, {'url': '/cases/federal/us/2/193/', 'vol': 2, 'date': ' ', 'caseName': 'KNOX v. JONES'}, {'url': '/cases/federal/us/2/194/', 'vol': 2, 'date': ' ', 'caseName': 'CUPISINO v. PEREZ'}, {'url': '/cases/federal/us/2/197/', 'vol': 2, 'date': ' ', 'caseName': 'RESPUBLICA v. KEPPELE'}, {'url': '/cases/federal/us/2/199/', 'vol': 2, 'date': ' ', 'caseName': "BARNES' LESSEE v. IRWIN"}, {'url': '/cases/federal/us/2/205/', 'vol': 2, 'date': ' ', 'caseName': 'FITZALDEN v. LEE'}, {'url': '/cases/federal/us/2/206/', 'vol': 2, 'date': ' ', 'caseName': 'ROACH v. COM. OF PENNSYLVANIA'}, {'url': '/cases/federal/us/2/211/', 'vol': 2, 'date': ' ', 'caseName': 'WALKER v. GIBBS'}, {'url': '/cases/federal/us/2/214/', 'vol': 2, 'date': ' ', 'caseName': "FOX'S LESSEE v. PALMER"}, {'url': '/cases/federal/us/2/215/', 'vol': 2, 'date': ' ', 'caseName': 'FITZGERALD v. CALDWELL'}, {'url': '/cases/federal/us/2/219/', 'vol': 2, 'date': ' ', 'caseName': 'FULLER v. MCCALL'}, {'url': '/cases/federal/us/2/224/', 'vol': 2, 'date': ' ', 'caseName': 'RESPUBLICA v. RICHARDS'}, {'url': '/cases/federal/us/2/228/', 'vol': 2, 'date': ' ', 'caseName': 'RESPUBLICA v. HONEYMAN'}, {'url': '/cases/federal/us/2/229/', 'vol': 2, 'date': ' ', 'caseName': 'BURRAL v. DU BLOIS'}, {'url': '/cases/federal/us/2/230/', 'vol': 2, 'date': ' ', 'caseName': "PENN'S LESSEE v. HARTMAN"}, {'url': '/cases/federal/us/2/231/', 'vol': 2, 'date': ' ', 'caseName': 'RAPELJE v. EMERY'}, {'url': '/cases/federal/us/2/233/', 'vol': 2, 'date': ' ', 'caseName': "WARDER v. CARSON'S EX'RS"}, {'url': '/cases/federal/us/2/234/', 'vol': 2, 'date': ' ', 'caseName': 'CAIGNET v. PETTIT'}, {'url': '/cases/federal/us/2/237/', 'vol': 2, 'date': ' ', 'caseName': 'KACHLIN v. MULHALLON'}, {'url': '/cases/federal/us/2/239/', 'vol': 2, 'date': ' ', 'caseName': 'RESPUBLICA v. ROSS'}, {'url': '/cases/federal/us/2/242/', 'vol': 2, 'date': ' ', 'caseName': 'RALSTON v. BELL'}, {'url': '/cases/federal/us/2/243/', 'vol': 2, 'date': ' ', 'caseName': "RUSTON'S EX'RS v. RUSTON"}, {'url': '/cases/federal/us/2/247/', 'vol': 2, 'date': ' ', 'caseName': 'WATERS v. COLLOT'}, {'url': '/cases/federal/us/2/249/', 'vol': 2, 'date': ' ', 'caseName': 'BARRIERE v. NAIRAC'}, {'url': '/cases/federal/us/2/252/', 'vol': 2, 'date': ' ', 'caseName': 'PERIT v. WALLIS'}, {'url': '/cases/federal/us/2/256/', 'vol': 2, 'date': ' ', 'caseName': 'HARRIS v. MANDEVILLE'}, {'url': '/cases/federal/us/2/257/', 'vol': 2, 'date': ' ', 'caseName': 'WALKER v. DILWORTH'}, {'url': '/cases/federal/us/2/260/', 'vol': 2, 'date': ' ', 'caseName': "ROBERTS v. CAY'S EX'RS"}, {'url': '/cases/federal/us/2/264/', 'vol': 2, 'date': ' ', 'caseName': 'STILES v. DONALDSON'}, {'url': '/cases/federal/us/2/265/', 'vol': 2, 'date': ' ', 'caseName': 'ZANTZINGER v. OLD'}, {'url': '/cases/federal/us/2/266/', 'vol': 2, 'date': ' ', 'caseName': 'BOUDINOT v. BRADFORD'}, {'url': '/cases/federal/us/2/268/', 'vol': 2, 'date': ' ', 'caseName': 'CASE OF GREENE'}, {'url': '/cases/federal/us/2/269/', 'vol': 2, 'date': ' ', 'caseName': 'EWING v. MCNAIR'}, {'url': '/cases/federal/us/2/270/', 'vol': 2, 'date': ' ', 'caseName': 'VASSE v. BALL'}, {'url': '/cases/federal/us/2/276/', 'vol': 2, 'date': ' ', 'caseName': 'YOUNG v. WILLING'}, {'url': '/cases/federal/us/2/277/', 'vol': 2, 'date': ' ', 'caseName': 'MCCARTY v. EMLEN'}, {'url': '/cases/federal/us/2/280/', 'vol': 2, 'date': ' ', 'caseName': 'CAMBERLING v. MCCALL'}, {'url': '/cases/federal/us/2/286/', 'vol': 2, 'date': ' ', 'caseName': 'LAWSON v. MORRISON'}, {'url': '/cases/federal/us/2/291/', 'vol': 2, 'date': ' ', 'caseName': 'HANNUM v. SPEAR'}, {'url': '/cases/federal/us/2/294/', 'vol': 2, 'date': ' ', 'caseName': 'COLLET v. COLLET'}, {'url': '/cases/federal/us/2/297/', 'vol': 2, 'date': ' ', 'caseName': 'U S v. RAVARA'}, {'url': '/cases/federal/us/2/300/', 'vol': 2, 'date': ' ', 'caseName': 'LIVINGSTON v. SWANWICK'}, {'url': '/cases/federal/us/2/302/', 'vol': 2, 'date': ' ', 'caseName': 'BRUDENELL ET AL v. VAUX'}, {'url': '/cases/federal/us/2/304/', 'vol': 2, 'date': ' ', 'caseName': "VANHORNE'S LESSEE v. DORRANCE"}, {'url': '/cases/federal/us/2/321/', 'vol': 2, 'date': ' ', 'caseName': 'U S v. GUINET'}, {'url': '/cases/federal/us/2/330/', 'vol': 2, 'date': ' ', 'caseName': 'PARASSEL v. GAUTIER'}, {'url': '/cases/federal/us/2/332/', 'vol': 2, 'date': ' ', 'caseName': "GEYGER'S LESSEE v. GEYGER"}, {'url': '/cases/federal/us/2/333/', 'vol': 2, 'date': ' ', 'caseName': 'U S v. CALDWELL'}, {'url': '/cases/federal/us/2/335/', 'vol': 2, 'date': ' ', 'caseName': 'THE UNITED STATES v. THE INSURGENTS OF PENNSYLVANIA'}, {'url': '/cases/federal/us/2/343/', 'vol': 2, 'date': ' ', 'caseName': 'THE UNITED STATES v. STEWART AND WRIGHT'}, {'url': '/cases/federal/us/2/345/', 'vol': 2, 'date': ' ', 'caseName': 'U S v. PORTER'}, {'url': '/cases/federal/us/2/346/', 'vol': 2, 'date': ' ', 'caseName': 'U.S. v. VIGOL'}, {'url': '/cases/federal/us/2/348/', 'vol': 2, 'date': ' ', 'caseName': 'THE UNITED STATES v. MITCHELL'}, {'url': '/cases/federal/us/2/357/', 'vol': 2, 'date': ' ', 'caseName': 'U S v. MITCHELL'}, {'url': '/cases/federal/us/2/358/', 'vol': 2, 'date': ' ', 'caseName': 'HULSECAMP v. TEEL'}, {'url': '/cases/federal/us/2/360/', 'vol': 2, 'date': ' ', 'caseName': "SCHERMERHORN v. L'ESPENASSE"}, {'url': '/cases/federal/us/2/364/', 'vol': 2, 'date': ' ', 'caseName': 'WHARTON v. LOWREY'}, {'url': '/cases/federal/us/2/365/', 'vol': 2, 'date': ' ', 'caseName': 'KETLAND v. THE CASSIUS'}, {'url': '/cases/federal/us/2/370/', 'vol': 2, 'date': ' ', 'caseName': 'THE UNITED STATES v. VILLATO'}, {'url': '/cases/federal/us/2/373/', 'vol': 2, 'date': ' ', 'caseName': 'THE UNITED STATES v. PARKER ET AL'}, {'url': '/cases/federal/us/2/380/', 'vol': 2, 'date': ' ', 'caseName': 'HANCOCK v. HILLYERS'}, {'url': '/cases/federal/us/2/382/', 'vol': 2, 'date': ' ', 'caseName': 'ANONYMOUS'}, {'url': '/cases/federal/us/2/383/', 'vol': 2, 'date': ' ', 'caseName': "SYMES'S LESSEE v. IRVINE"}, {'url': '/cases/federal/us/2/384/', 'vol': 2, 'date': ' ', 'caseName': 'THE UNITED STATES v. WORRALL'}, {'url': '/cases/federal/us/2/396/', 'vol': 2, 'date': ' ', 'caseName': 'HOLLINGSWORTH v. ADAMS'}, {'url': '/cases/federal/us/2/399/', 'vol': 2, 'date': ' ', 'caseName': 'APPOINTMENT OF JUSTICES'}, {'url': '/cases/federal/us/2/400/', 'vol': 2, 'date': ' ', 'caseName': 'QUALIFICATION OF COUNSELLORS AND ATTORNEYS'}, {'url': '/cases/federal/us/2/401/', 'vol': 2, 'date': ' ', 'caseName': 'OSWALD v. STATE OF NEW YORK'}, {'url': '/cases/federal/us/2/402/', 'vol': 2, 'date': ' ', 'caseName': 'Georgia v. Brailsford'}, {'url': '/cases/federal/us/2/409/', 'vol': 2, 'date': ' ', 'caseName': "Hayburn's Case"}, {'url': '/cases/federal/us/2/415/', 'vol': 2, 'date': ' ', 'caseName': 'Georgia v. Brailsford'}, {'url': '/cases/federal/us/2/419/', 'vol': 2, 'date': ' ', 'caseName': 'Chisholm v. Georgia'}, {'url': '/cases/federal/us/2/479/', 'vol': 2, 'date': ' ', 'caseName': 'APPOINTMENT OF PATERSON'}, {'url': '/cases/federal/us/3/1/', 'vol': 3, 'date': ' ', 'caseName': 'Georgia v. Brailsford, Powell & Hopton'}, {'url': '/cases/federal/us/3/6/', 'vol': 3, 'date': ' ', 'caseName': 'Glass v. The Betsey'}, {'url': '/cases/federal/us/3/17/', 'vol': 3, 'date': ' ', 'caseName': 'United States v. Hamilton'}, {'url': '/cases/federal/us/3/19/', 'vol': 3, 'date': ' ', 'caseName': 'Bingham v. Cabot'}, {'url': '/cases/federal/us/3/42/', 'vol': 3, 'date': ' ', 'caseName': 'United States v. Lawrence'}, {'url': '/cases/federal/us/3/54/', 'vol': 3, 'date': ' ', 'caseName': "Penhallow v. Doan's Administrators"}, {'url': '/cases/federal/us/3/121/', 'vol': 3, 'date': ' ', 'caseName': 'United States v. Peters'}, {'url': '/cases/federal/us/3/133/', 'vol': 3, 'date': ' ', 'caseName': 'Talbot v. Jansen'}, {'url': '/cases/federal/us/3/171/', 'vol': 3, 'date': ' ', 'caseName': 'Hylton v. United States'}, {'url': '/cases/federal/us/3/184/', 'vol': 3, 'date': ' ', 'caseName': 'Hills v. Ross'}, {'url': '/cases/federal/us/3/188/', 'vol': 3, 'date': ' ', 'caseName': 'McDonough v. Danery and Ship Mary Ford'}, {'url': '/cases/federal/us/3/199/', 'vol': 3, 'date': ' ', 'caseName': 'Ware v. Hylton'}, {'url': '/cases/federal/us/3/285/', 'vol': 3, 'date': ' ', 'caseName': 'THE DEN ONZEKEREN'}, {'url': '/cases/federal/us/3/297/', 'vol': 3, 'date': ' ', 'caseName': 'United States v. La Vengeance'}, {'url': '/cases/federal/us/3/302/', 'vol': 3, 'date': ' ', 'caseName': 'Cotton v. Wallace'}, {'url': '/cases/federal/us/3/305/', 'vol': 3, 'date': ' ', 'caseName': 'HUNTER v. FAIRFAX'}, {'url': '/cases/federal/us/3/306/', 'vol': 3, 'date': ' ', 'caseName': 'Arcambel v. Wiseman'}, {'url': '/cases/federal/us/3/307/', 'vol': 3, 'date': ' ', 'caseName': 'Moodie v. The Alfred'}, {'url': '/cases/federal/us/3/308/', 'vol': 3, 'date': ' ', 'caseName': 'Olney v. Arnold'}, {'url': '/cases/federal/us/3/319/', 'vol': 3, 'date': ' ', 'caseName': 'Moodie v. The Phoebe Anne'}, {'url': '/cases/federal/us/3/320/', 'vol': 3, 'date': ' ', 'caseName': 'Grayson v. Virginia'}, {'url': '/cases/federal/us/3/321/', 'vol': 3, 'date': ' ', 'caseName': 'Wiscart v. Dauchy'}, {'url': '/cases/federal/us/3/331/', 'vol': 3, 'date': ' ', 'caseName': 'Hills v. Ross'}, {'url': '/cases/federal/us/3/333/', 'vol': 3, 'date': ' ', 'caseName': 'Del Col v. Arnold'}, {'url': '/cases/federal/us/3/336/', 'vol': 3, 'date': ' ', 'caseName': 'Jennings v. The Perseverance'}, {'url': '/cases/federal/us/3/339/', 'vol': 3, 'date': ' ', 'caseName': 'Huger v. South Carolina'}, {'url': '/cases/federal/us/3/342/', 'vol': 3, 'date': ' ', 'caseName': 'Clarke v. Harwood'}, {'url': '/cases/federal/us/3/344/', 'vol': 3, 'date': ' ', 'caseName': 'Brown v. Van Braam'}, {'url': '/cases/federal/us/3/357/', 'vol': 3, 'date': ' ', 'caseName': 'Fenemore v. United States'}, {'url': '/cases/federal/us/3/365/', 'vol': 3, 'date': ' ', 'caseName': 'Brown v. Barry'}, {'url': '/cases/federal/us/3/369/', 'vol': 3, 'date': ' ', 'caseName': 'EMORY v. GRENOUGH'}, {'url': '/cases/federal/us/3/378/', 'vol': 3, 'date': ' ', 'caseName': 'Hollingsworth v. Virginia'}, {'url': '/cases/federal/us/3/382/', 'vol': 3, 'date': ' ', 'caseName': 'Bingham v. Cabot'}, {'url': '/cases/federal/us/3/384/', 'vol': 3, 'date': ' ', 'caseName': 'Jones v. La Tombe'}, {'url': '/cases/federal/us/3/386/', 'vol': 3, 'date': ' ', 'caseName': 'Calder v. Bull'}, {'url': '/cases/federal/us/3/401/', 'vol': 3, 'date': ' ', 'caseName': 'Wilson v. Daniel'}, {'url': '/cases/federal/us/3/409/', 'vol': 3, 'date': ' ', 'caseName': 'Dewhurst v. Coulthard'}, {'url': '/cases/federal/us/3/411/', 'vol': 3, 'date': ' ', 'caseName': 'Fowler v. Lindsey'}, {'url': '/cases/federal/us/3/415/', 'vol': 3, 'date': ' ', 'caseName': 'Clarke v. Russell'}, {'url': '/cases/federal/us/3/425/', 'vol': 3, 'date': ' ', 'caseName': "Sims' Lessee v. Irvine"}, {'url': '/cases/federal/us/3/467/', 'vol': 3, 'date': ' ', 'caseName': 'Respublica v. Cobbett'}, {'url': '/cases/federal/us/3/477/', 'vol': 3, 'date': ' ', 'caseName': 'ANONYMOUS'}, {'url': '/cases/federal/us/3/478/', 'vol': 3, 'date': ' ', 'caseName': 'COXE v. MCCLENACHAN'}, {'url': '/cases/federal/us/3/479/', 'vol': 3, 'date': ' ', 'caseName': "PEMBERTON'S LESSEE v. HICKS"}, {'url': '/cases/federal/us/3/486/', 'vol': 3, 'date': ' ', 'caseName': "MCKEE'S LESSEE v. PFOUT"}, {'url': '/cases/federal/us/3/490/', 'vol': 3, 'date': ' ', 'caseName': 'RESPUBLICA v. WRAY'}, {'url': '/cases/federal/us/3/491/', 'vol': 3, 'date': ' ', 'caseName': 'MURGATROYD v. CRAWFORD'}, {'url': '/cases/federal/us/3/496/', 'vol': 3, 'date': ' ', 'caseName': 'BRECKBILL v. LANCASTER TURNPIKE CO'}, {'url': '/cases/federal/us/3/500/', 'vol': 3, 'date': ' ', 'caseName': "DALLAS v. CHALONER'S EX'RS"}, {'url': '/cases/federal/us/3/503/', 'vol': 3, 'date': ' ', 'caseName': 'WHARTON v. FITZGERALD'}, {'url': '/cases/federal/us/3/505/', 'vol': 3, 'date': ' ', 'caseName': 'REED v. INGRAHAM'}, {'url': '/cases/federal/us/3/506/', 'vol': 3, 'date': ' ', 'caseName': 'Peterson v. Willing'}, {'url': '/cases/federal/us/3/510/', 'vol': 3, 'date': ' ', 'caseName': 'POLLOCK v. DONALDSON'}, {'url': '/cases/federal/us/3/512/', 'vol': 3, 'date': ' ', 'caseName': 'HURST v. HURST'}, {'url': '/cases/federal/us/3/513/', 'vol': 3, 'date': ' ', 'caseName': 'U.S. v. INSURGENTS'}, {'url': '/cases/federal/us/3/515/', 'vol': 3, 'date': ' ', 'caseName': 'United States v. Fries'}, {'url': '/cases/federal/us/4/1/', 'vol': 4, 'date': ' ', 'caseName': 'New York v. Connecticut'}, {'url': '/cases/federal/us/4/3/', 'vol': 4, 'date': ' ', 'caseName': 'STATE OF NEW YORK v. STATE OF CONNECTICUT'}, {'url': '/cases/federal/us/4/6/', 'vol': 4, 'date': ' ', 'caseName': 'NEW YORK v. CONNECTICUT'}, {'url': '/cases/federal/us/4/7/', 'vol': 4, 'date': ' ', 'caseName': 'Turner v. Enrille'}, {'url': '/cases/federal/us/4/8/', 'vol': 4, 'date': ' ', 'caseName': 'Turner v. Bank of North America'}, {'url': '/cases/federal/us/4/12/', 'vol': 4, 'date': ' ', 'caseName': 'Mossman v. Higginson'}, {'url': '/cases/federal/us/4/14/', 'vol': 4, 'date': ' ', 'caseName': 'Cooper v. Telfair'}, {'url': '/cases/federal/us/4/20/', 'vol': 4, 'date': ' ', 'caseName': 'Williamson v. Kincaid'}, {'url': '/cases/federal/us/4/21/', 'vol': 4, 'date': ' ', 'caseName': 'BLAIR v. MILLER'}, {'url': '/cases/federal/us/4/22/', 'vol': 4, 'date': ' ', 'caseName': 'Rutherford v. Fischer'}, {'url': '/cases/federal/us/4/28/', 'vol': 4, 'date': ' ', 'caseName': 'Priestman v. United States'}, {'url': '/cases/federal/us/4/34/', 'vol': 4, 'date': ' ', 'caseName': 'THE AMELIA'}, {'url': '/cases/federal/us/4/37/', 'vol': 4, 'date': ' ', 'caseName': 'Bas v. Tingy'}, {'url': '/cases/federal/us/4/47/', 'vol': 4, 'date': ' ', 'caseName': 'LUDLOW v. BINGHAM'}, {'url': '/cases/federal/us/4/64/', 'vol': 4, 'date': ' ', 'caseName': "JOHNSON v. HAINES' LESSEE"}, {'url': '/cases/federal/us/4/67/', 'vol': 4, 'date': ' ', 'caseName': 'EWING v. HOUSTON'}, {'url': '/cases/federal/us/4/71/', 'vol': 4, 'date': ' ', 'caseName': 'LEVEZEY v. GORGAS'}, {'url': '/cases/federal/us/4/76/', 'vol': 4, 'date': ' ', 'caseName': 'BURD v. SMITH'}, {'url': '/cases/federal/us/4/95/', 'vol': 4, 'date': ' ', 'caseName': 'LEA v. YARD'}, {'url': '/cases/federal/us/4/107/', 'vol': 4, 'date': ' ', 'caseName': "GEYER'S LESSEE v. IRWIN"}, {'url': '/cases/federal/us/4/108/', 'vol': 4, 'date': ' ', 'caseName': "CARSON v. HOOD'S EX'RS"}, {'url': '/cases/federal/us/4/109/', 'vol': 4, 'date': ' ', 'caseName': 'DONALDSON v. MEANS'}, {'url': '/cases/federal/us/4/111/', 'vol': 4, 'date': ' ', 'caseName': 'LITTLE v. DAWSON'}, {'url': '/cases/federal/us/4/112/', 'vol': 4, 'date': ' ', 'caseName': "BRADLEY'S LESSEE v. BRADLEY"}, {'url': '/cases/federal/us/4/115/', 'vol': 4, 'date': ' ', 'caseName': "SMITH v. BRODHEAD'S EX'RS"}, {'url': '/cases/federal/us/4/116/', 'vol': 4, 'date': ' ', 'caseName': 'COM. OF PENNSYLVANIA v. DILLON'}, {'url': '/cases/federal/us/4/119/', 'vol': 4, 'date': ' ', 'caseName': "MORRIS' LESSEE v. SMITH"}, {'url': '/cases/federal/us/4/120/', 'vol': 4, 'date': ' ', 'caseName': "CALHOUN'S LESSEE v. DUNNING"}, {'url': '/cases/federal/us/4/122/', 'vol': 4, 'date': ' ', 'caseName': "GANDER'S LESSEE v. BURNS"}, {'url': '/cases/federal/us/4/123/', 'vol': 4, 'date': ' ', 'caseName': 'MASSEY v. LEAMING'}, {'url': '/cases/federal/us/4/124/', 'vol': 4, 'date': ' ', 'caseName': 'VAUGHAN v. BLANCHARD'}, {'url': '/cases/federal/us/4/125/', 'vol': 4, 'date': ' ', 'caseName': 'COM. OF PENNSYLVANIA v. BIRON'}, {'url': '/cases/federal/us/4/127/', 'vol': 4, 'date': ' ', 'caseName': 'BANK OF NORTH AMERICA v. PETTIT'}, {'url': '/cases/federal/us/4/130/', 'vol': 4, 'date': ' ', 'caseName': 'CONRAD v. CONRAD'}, {'url': '/cases/federal/us/4/132/', 'vol': 4, 'date': ' ', 'caseName': 'ZANTZINGER v. KETCH'}, {'url': '/cases/federal/us/4/133/', 'vol': 4, 'date': ' ', 'caseName': 'EDDOWES v. NIELL'}, {'url': '/cases/federal/us/4/136/', 'vol': 4, 'date': ' ', 'caseName': 'SCHENKHOUSE v. GIBBS'}, {'url': '/cases/federal/us/4/137/', 'vol': 4, 'date': ' ', 'caseName': 'MCEWEN v. GIBBS'}, {'url': '/cases/federal/us/4/138/', 'vol': 4, 'date': ' ', 'caseName': "BOYD'S LESSEE v. COWAN"}, {'url': '/cases/federal/us/4/143/', 'vol': 4, 'date': ' ', 'caseName': 'COM. OF PENNSYLVANIA v. CHAMBRE'}, {'url': '/cases/federal/us/4/145/', 'vol': 4, 'date': ' ', 'caseName': 'RESPUBLICA v. MULATTO BOB'}, {'url': '/cases/federal/us/4/147/', 'vol': 4, 'date': ' ', 'caseName': 'ANONYMOUS'}, {'url': '/cases/federal/us/4/149/', 'vol': 4, 'date': ' ', 'caseName': 'GRAHAM v. BICKHAM'}, {'url': '/cases/federal/us/4/152/', 'vol': 4, 'date': ' ', 'caseName': 'BELL v. ANDREWS'}, {'url': '/cases/federal/us/4/154/', 'vol': 4, 'date': ' ', 'caseName': "NICHOLSON'S LESSEE v. WALLIS"}, {'url': '/cases/federal/us/4/155/', 'vol': 4, 'date': ' ', 'caseName': 'KEPPELE v. CARR'}, {'url': '/cases/federal/us/4/160/', 'vol': 4, 'date': ' ', 'caseName': 'MCCLAY v. HANNA'}, {'url': '/cases/federal/us/4/161/', 'vol': 4, 'date': ' ', 'caseName': "EWALT'S LESSEE v. HIGHLANDS"}, {'url': '/cases/federal/us/4/163/', 'vol': 4, 'date': ' ', 'caseName': 'BALL v. DENNISON'}, {'url': '/cases/federal/us/4/167/', 'vol': 4, 'date': ' ', 'caseName': 'LEVY v. WALLIS'}, {'url': '/cases/federal/us/4/168/', 'vol': 4, 'date': ' ', 'caseName': "PEMBERTON'S LESSEE v. HICKS"}, {'url': '/cases/federal/us/4/169/', 'vol': 4, 'date': ' ', 'caseName': 'REED v. INGRAHAM'}, {'url': '/cases/federal/us/4/170/', 'vol': 4, 'date': ' ', 'caseName': 'COM. OF PENNSYLVANIA v. COXE'}, {'url': '/cases/federal/us/4/205/', 'vol': 4, 'date': ' ', 'caseName': 'JACKSON v. WINCHESTER'}, {'url': '/cases/federal/us/4/206/', 'vol': 4, 'date': ' ', 'caseName': 'BUSSY v. DONALDSON'}, {'url': '/cases/federal/us/4/208/', 'vol': 4, 'date': ' ', 'caseName': "WATERS' EX'RS v. MCCLELLAN"}, {'url': '/cases/federal/us/4/209/', 'vol': 4, 'date': ' ', 'caseName': "MORRIS' LESSEE v. NEIGHMAN"}, {'url': '/cases/federal/us/4/210/', 'vol': 4, 'date': ' ', 'caseName': "BELL'S LESSEE v. LEVERS"}, {'url': '/cases/federal/us/4/211/', 'vol': 4, 'date': ' ', 'caseName': 'BEISSELL v. SHOLL'}, {'url': '/cases/federal/us/4/213/', 'vol': 4, 'date': ' ', 'caseName': 'CHANCELLOR v. PHILLIPS'}, {'url': '/cases/federal/us/4/214/', 'vol': 4, 'date': ' ', 'caseName': 'FREEMAN v. RUSTON'}, {'url': '/cases/federal/us/4/218/', 'vol': 4, 'date': ' ', 'caseName': "WEITZELL'S LESSEE v. FRY"}, {'url': '/cases/federal/us/4/221/', 'vol': 4, 'date': ' ', 'caseName': "MCLAUGHLIN'S LESSEE v. DAWSON"}, {'url': '/cases/federal/us/4/222/', 'vol': 4, 'date': ' ', 'caseName': 'POLLOCK v. HALL'}, {'url': '/cases/federal/us/4/224/', 'vol': 4, 'date': ' ', 'caseName': 'MATHER v. PRATT'}, {'url': '/cases/federal/us/4/225/', 'vol': 4, 'date': ' ', 'caseName': 'COM. OF PENNSYLVANIA v. ADDISON'}, {'url': '/cases/federal/us/4/226/', 'vol': 4, 'date': ' ', 'caseName': 'WAINRIGHT v. CRAWFORD'}, {'url': '/cases/federal/us/4/227/', 'vol': 4, 'date': ' ', 'caseName': 'AUSTYN v. MCLURE'}, {'url': '/cases/federal/us/4/229/', 'vol': 4, 'date': ' ', 'caseName': 'COM. OF PENNSYLVANIA v. DALLAS'}, {'url': '/cases/federal/us/4/232/', 'vol': 4, 'date': ' ', 'caseName': 'FALCONER v. MONTGOMERY'}, {'url': '/cases/federal/us/4/234/', 'vol': 4, 'date': ' ', 'caseName': 'LEVY v. BANK OF U S'}, {'url': '/cases/federal/us/4/237/', 'vol': 4, 'date': ' ', 'caseName': 'ATTORNEY GENERAL v. GRANTEES'}, {'url': '/cases/federal/us/4/246/', 'vol': 4, 'date': ' ', 'caseName': 'JONES v. INSURANCE CO OF NORTH AMERICA'}, {'url': '/cases/federal/us/4/250/', 'vol': 4, 'date': ' ', 'caseName': 'COCHRAN v. CUMMINGS'}, {'url': '/cases/federal/us/4/251/', 'vol': 4, 'date': ' ', 'caseName': "FITZGERALD v. CALDWELL'S EX'RS"}, {'url': '/cases/federal/us/4/253/', 'vol': 4, 'date': ' ', 'caseName': 'COM. OF PENNSYLVANIA v. GIBBS'}, {'url': '/cases/federal/us/4/255/', 'vol': 4, 'date': ' ', 'caseName': 'COM. OF PENNSYLVANIA v. FRANKLIN'}, {'url': '/cases/federal/us/4/266/', 'vol': 4, 'date': ' ', 'caseName': 'CITY OF PHILADELPHIA v. MASON.'}, {'url': '/cases/federal/us/4/267/', 'vol': 4, 'date': ' ', 'caseName': 'BLACK v. WISTAR'}, {'url': '/cases/federal/us/4/269/', 'vol': 4, 'date': ' ', 'caseName': 'MITCHELL v. SMITH'}, {'url': '/cases/federal/us/4/271/', 'vol': 4, 'date': ' ', 'caseName': 'PASSMORE v. PETTIT & BAYARD'}, {'url': '/cases/federal/us/4/272/', 'vol': 4, 'date': ' ', 'caseName': 'BELL v. BEVERIDGE'}, {'url': '/cases/federal/us/4/274/', 'vol': 4, 'date': ' ', 'caseName': 'KINGSTON v. GIRARD'}, {'url': '/cases/federal/us/4/275/', 'vol': 4, 'date': ' ', 'caseName': 'MCFADDEN v. PARKER'}, {'url': '/cases/federal/us/4/279/', 'vol': 4, 'date': ' ', 'caseName': 'SHARPLESS v. WELSH'}, {'url': '/cases/federal/us/4/282/', 'vol': 4, 'date': ' ', 'caseName': 'COM. OF PENNSYLVANIA v. BAYNTON'}, {'url': '/cases/federal/us/4/283/', 'vol': 4, 'date': ' ', 'caseName': 'WATSON v. INSURANCE CO OF NORTH AMERICA'}, {'url': '/cases/federal/us/4/284/', 'vol': 4, 'date': ' ', 'caseName': 'WILLIAMS v. PASCHALL'}, {'url': '/cases/federal/us/4/286/', 'vol': 4, 'date': ' ', 'caseName': 'CRAWFORD v. WILLING'}, {'url': '/cases/federal/us/4/291/', 'vol': 4, 'date': ' ', 'caseName': 'CRAMOND v. BANK OF U S'}, {'url': '/cases/federal/us/4/292/', 'vol': 4, 'date': ' ', 'caseName': 'COM. OF PENNSYLVANIA v. MCKISSICK'}, {'url': '/cases/federal/us/4/294/', 'vol': 4, 'date': ' ', 'caseName': 'CROUSILLAT v. BALL'}, {'url': '/cases/federal/us/4/298/', 'vol': 4, 'date': ' ', 'caseName': 'MAYBIN v. COULON'}, {'url': '/cases/federal/us/4/300/', 'vol': 4, 'date': ' ', 'caseName': 'DESHLER v. BEERY'}, {'url': '/cases/federal/us/4/302/', 'vol': 4, 'date': ' ', 'caseName': 'COM. OF PENNSYLVANIA v. LYON'}, {'url': '/cases/federal/us/4/303/', 'vol': 4, 'date': ' ', 'caseName': 'COM. OF PENNSYLVANIA v. MATLACK'}, {'url': '/cases/federal/us/4/304/', 'vol': 4, 'date': ' ', 'caseName': "RUNDLE v. MURGATROYD'S ASSIGNEES"}, {'url': '/cases/federal/us/4/308/', 'vol': 4, 'date': ' ', 'caseName': 'DUNCANSON v. MCLURE'}, {'url': '/cases/federal/us/4/316/', 'vol': 4, 'date': ' ', 'caseName': 'COM. OF PENNSYLVANIA v. FRANKLIN'}, {'url': '/cases/federal/us/4/320/', 'vol': 4, 'date': ' ', 'caseName': 'WELSH v. MURRAY'}, {'url': '/cases/federal/us/4/321/', 'vol': 4, 'date': ' ', 'caseName': 'DUPONT v. PICHON'}, {'url': '/cases/federal/us/4/325/', 'vol': 4, 'date': ' ', 'caseName': 'SEARIGHT v. CALBRAITH'}, {'url': '/cases/federal/us/4/329/', 'vol': 4, 'date': ' ', 'caseName': 'SMYTHE v. BANKS'}, {'url': '/cases/federal/us/4/330/', 'vol': 4, 'date': ' ', 'caseName': 'MAXFIELD v. LEVY'}, {'url': '/cases/federal/us/4/340/', 'vol': 4, 'date': ' ', 'caseName': "O'HARRA v. HALL"}, {'url': '/cases/federal/us/4/341/', 'vol': 4, 'date': ' ', 'caseName': 'U S v. COOPER'}, {'url': '/cases/federal/us/4/342/', 'vol': 4, 'date': ' ', 'caseName': 'EVANS v. BOLLEN'}, {'url': '/cases/federal/us/4/345/', 'vol': 4, 'date': ' ', 'caseName': 'HOLLINGSWORTH v. FRY'}, {'url': '/cases/federal/us/4/348/', 'vol': 4, 'date': ' ', 'caseName': 'THURSTON v. KOCH'}, {'url': '/cases/federal/us/4/353/', 'vol': 4, 'date': ' ', 'caseName': 'HOLLINGSWORTH v. DUANE'}, {'url': '/cases/federal/us/4/354/', 'vol': 4, 'date': ' ', 'caseName': 'PENN v. BUTLER'}, {'url': '/cases/federal/us/4/358/', 'vol': 4, 'date': ' ', 'caseName': 'U S v. CONYNGHAM'}, {'url': '/cases/federal/us/4/360/', 'vol': 4, 'date': ' ', 'caseName': 'KNOX v. GREENLEAF'}, {'url': '/cases/federal/us/4/363/', 'vol': 4, 'date': ' ', 'caseName': "BALFOUR'S LESSEE v. MEADE"}, {'url': '/cases/federal/us/4/370/', 'vol': 4, 'date': ' ', 'caseName': "HUMPHRIES v. BLIGHT'SASSIGNEES"}, {'url': '/cases/federal/us/4/372/', 'vol': 4, 'date': ' ', 'caseName': 'U S v. PASSMORE'}, {'url': '/cases/federal/us/4/374/', 'vol': 4, 'date': ' ', 'caseName': 'WILLING v. U S'}, {'url': '/cases/federal/us/4/387/', 'vol': 4, 'date': ' ', 'caseName': 'EX PARTE HURST'}, {'url': '/cases/federal/us/4/389/', 'vol': 4, 'date': ' ', 'caseName': 'WALKER v. SMITH'}, {'url': '/cases/federal/us/4/392/', 'vol': 4, 'date': ' ', 'caseName': "HUIDEKOPER'S LESSEE v. DOUGLASS"}, {'url': '/cases/federal/us/4/402/', 'vol': 4, 'date': ' ', 'caseName': 'PENN v. KLYNE'}, {'url': '/cases/federal/us/4/410/', 'vol': 4, 'date': ' ', 'caseName': 'GUPPE v. BROWN'}, {'url': '/cases/federal/us/4/412/', 'vol': 4, 'date': ' ', 'caseName': 'U S v. JOHNS'}, {'url': '/cases/federal/us/4/417/', 'vol': 4, 'date': ' ', 'caseName': 'SIMONDS v. UNION INS CO'}, {'url': '/cases/federal/us/4/419/', 'vol': 4, 'date': ' ', 'caseName': 'CONFRAMP v. BUNEL'}, {'url': '/cases/federal/us/4/421/', 'vol': 4, 'date': ' ', 'caseName': 'RUSSELL v. UNION INS CO'}, {'url': '/cases/federal/us/4/426/', 'vol': 4, 'date': ' ', 'caseName': 'U S v. MCGILL'}, {'url': '/cases/federal/us/4/430/', 'vol': 4, 'date': ' ', 'caseName': 'SNELL v. DELAWARE INS CO'}, {'url': '/cases/federal/us/4/433/', 'vol': 4, 'date': ' ', 'caseName': 'LYLE v. BAKER'}, {'url': '/cases/federal/us/4/434/', 'vol': 4, 'date': ' ', 'caseName': 'OZEAS v. JOHNSON'}, {'url': '/cases/federal/us/4/436/', 'vol': 4, 'date': ' ', 'caseName': 'BENDER v. FROMBERGER'}, {'url': '/cases/federal/us/4/441/', 'vol': 4, 'date': ' ', 'caseName': 'BENDER v. FROMBERGER'}, {'url': '/cases/federal/us/4/446/', 'vol': 4, 'date': ' ', 'caseName': 'DUTILH v. GATLIFF'}, {'url': '/cases/federal/us/4/450/', 'vol': 4, 'date': ' ', 'caseName': "MOLIERE'S LESSEE v. NOE"}, {'url': '/cases/federal/us/4/455/', 'vol': 4, 'date': ' ', 'caseName': 'MORGAN v. INSURANCE CO OF NORTH AMERICA'}, {'url': '/cases/federal/us/4/459/', 'vol': 4, 'date': ' ', 'caseName': 'SANSOM v. BALL'}, {'url': '/cases/federal/us/4/463/', 'vol': 4, 'date': ' ', 'caseName': 'DONATH v. INSURANCE CO OF NORTH AMERICA'}, {'url': '/cases/federal/us/5/1/', 'vol': 5, 'date': ' ', 'caseName': 'Talbot  v. Seeman'}, {'url': '/cases/federal/us/5/45/', 'vol': 5, 'date': ' ', 'caseName': 'Wilson v. Mason'}, {'url': '/cases/federal/us/5/103/', 'vol': 5, 'date': ' ', 'caseName': 'United States v. Schooner Peggy'}, {'url': '/cases/federal/us/5/110/', 'vol': 5, 'date': ' ', 'caseName': 'Resler v. Shehee'}, {'url': '/cases/federal/us/5/117/', 'vol': 5, 'date': ' ', 'caseName': 'Turner v. Fendall'}, {'url': '/cases/federal/us/5/137/', 'vol': 5, 'date': ' ', 'caseName': 'Marbury v. Madison'}, {'url': '/cases/federal/us/5/181/', 'vol': 5, 'date': ' ', 'caseName': 'Clark v. Robert Young & Co.'}, {'url': '/cases/federal/us/5/194/', 'vol': 5, 'date': ' ', 'caseName': 'Wilson v. Lenox & Maitland'}, {'url': '/cases/federal/us/5/212/', 'vol': 5, 'date': ' ', 'caseName': 'Clarke v. Bazadone'}, {'url': '/cases/federal/us/5/214/', 'vol': 5, 'date': ' ', 'caseName': 'Hooe & Co. v. Groverman'}, {'url': '/cases/federal/us/5/239/', 'vol': 5, 'date': ' ', 'caseName': 'Wood v. Owings & Smith'}, {'url': '/cases/federal/us/5/252/', 'vol': 5, 'date': ' ', 'caseName': 'United States v. Simms'}, {'url': '/cases/federal/us/5/259/', 'vol': 5, 'date': ' ', 'caseName': "Fenwick v. Sears' Administrators"}, {'url': '/cases/federal/us/5/282/', 'vol': 5, 'date': ' ', 'caseName': 'Thompson v. Jameson'}, {'url': '/cases/federal/us/5/290/', 'vol': 5, 'date': ' ', 'caseName': 'Mandeville & Jameson v. Joseph Riddle & Co.'}, {'url': '/cases/federal/us/5/299/', 'vol': 5, 'date': ' ', 'caseName': 'Stuart v. Laird'}, {'url': '/cases/federal/us/5/309/', 'vol': 5, 'date': ' ', 'caseName': 'Hamilton v. Russell'}, {'url': '/cases/federal/us/5/318/', 'vol': 5, 'date': ' ', 'caseName': 'United States v. Hooe'}, {'url': '/cases/federal/us/5/321/', 'vol': 5, 'date': ' ', 'caseName': 'Hepburn & Dundas v. Auld'}, {'url': '/cases/federal/us/5/332/', 'vol': 5, 'date': ' ', 'caseName': 'MARINE INS CO OF ALEXANDRIA v. YOUNG'}, {'url': '/cases/federal/us/5/345/', 'vol': 5, 'date': ' ', 'caseName': 'Hodgson v. Dexter'}, {'url': '/cases/federal/us/5/365/', 'vol': 5, 'date': ' ', 'caseName': 'Lloyd v. Alexander'}]
 noDisclaimer ="\n\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\tSyllabus\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\tCase\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\n\t\t\t\n\t\t\t\t\t\t\tU.S. Supreme Court HYAM'S LESSEE v. EDWARDS, 1 U.S. 1 (1759)  1 U.S. 1 (Dall.)  The Lessee of Hyam and others v. Edwards  Supreme Court of Pennsylvania  April Term, 1759  Copy of a Deed inrolled in the King's Bench in England, proved before the Lord Mayor of London to be a true one; allowed to be given in Evidence to a Jury to support a Title to Lands in this Province.* Footnotes [Footnote *] 11 mod. 2 c. 2. [ Hyam's Lessee v. Edwards Footnote 1 U.S. 1 (1759) ] \n\t\t\t\t\n\n\t\t\t\n\t\t\t\t\n\t\t\t\t\n\t\t"
 case39="\n\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\tSyllabus\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\tCase\n\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\n\t\t\t\t\t\t\t\t\t\n\t\t\t\n\t\t\t\t\t\t\tU.S. Supreme Court RESPUBLICA v. ROBERTS, 1 U.S. 39 (1778)  1 U.S. 39 (Dall.)  Respublica v. John Roberts  Court of Oyer and Terminer, at Philadelphia  September Sessions, 1778  Indictment for High Treason. A witness was called to prove, that the Defendant had attempted to prevail upon him to enlist with the British army; but that he did not succeed. This gave rise to a question on these words of the act of Assembly: 'That if any person or persons knowingly and willingly shall aid or assist any enemies at open war with this State &c. by persuading others to enlist for that purpose &c. he shall be adjudged guilty of high treason' 2 State Laws p. 18. 19.  In support of the prosectuion, it was urged, that the attempt to prevail, constituted the crime; and that it was like the case of a man's sending intelligence to the enemy, which was an act equally criminal in the sender, whether the intelligence was received, or not.  For the Defendant, it was argued, that persuading implies success; suadeo signifying to advise, and persuadeo to advise through, or successfully: And, therefore, it cannot properly be said of any person, that he was persuaded, unless he has done some act in consequence of his persuasion. [ Respublica v. Roberts 1 U.S. 39 (1778)  BY THE COURT: There is proof of an overt act, that the prisoner did enlist, and evidence is now offered to show, that he also endeavoured to persuade others to enlist, in the armies of the enemy. But we are of opinion, that the word persuading, used by the Legislature, means to succeed; and that there must be an actual enlistment of the person persuaded, in order to bring the Defendant within the intention of the clause. 2 Lord Ray. 889.  The evidence offered, however, is proper to show quo animo, the prisoner himself joined the British forces.  The counsel for the Commonwealth then offered to give in evidence, the consession of the Defendant, that he was going to the Head of Elk, in order to communicate some information to Mr. Galloway, who had at that time, gone over to the enemy.  But it was opposed by the adverse counsel, who contended, that a confession, unless in open Court, had never been evidence to convict. That, though under the 1 Edward 6. it is said a man might be convicted of treason, by the testimony of two witnesses, or his voluntary confession; 2 Hawk. 256. yet, that statute does not extend to Pennsylvania, and by the 7 W. 3. c. 3. it is expressly declared, that no man can be indicted, arraigned, or tried, in a case of treason, but by the testimony of two witnesses, or the confession of the party made, without violence, in open Court. Fost. 10. 241. 2. 3. But the act of Assembly of Pennsylvania totally excludes a conviction by confession. See Prin. Pen Law 149. A confession may, indeed, be given in evidence to corroborate a treason that has already been established by two witnesses; but not to prove the treason itself. Page 1 U.S. 39, 40 BY THE COURT: To prove the Defendant's confession by two witnesses, is certainly not sufficient, under the statute, to convict him. But a confession after the fact, is proof of the fact itself; and though not competent alone to supply the want of two witnesses, yet it is good by way of corroboration: And, therefore, if an overt act has been proved in the county of Chester by two witnesses, the evidence now offered will be proper, in confirmation of their testimony.  One of the overt acts, then, laid in the indictment, is aiding and assisting the enemy by joining their armies, and this has been legally and satisfactorily proved. Notwithstanding, therefore, the other overt act of giving intelligence to the enemy, is not supported by any evidence, but the Defendant's own confession now offered, and which is in that respect insufficient; yet, it may be produced to substantiate another species of treason; and on that ground we now admit it to be proved. See Foster 10. 244. 5 Bacon's Abr, 145. Gregg's Case. 2 Hawk. 442.  The Attorney General and Reed, for the Commonwealth-Ross and Wilson, for the Defendant.  The prisoner being convicted by the Jury, his counsel moved the Court to set aside the verdict, and grant a new trial, because he was advised, 'that the evidence given respecting his declarations, or confessions, was altogether illegal, and ought not to have been allowed.'  After argument, by the same counsel, on both sides, the motion was refused BY THE COURT, who gave judgment for the Commonwealth; and the Defendant, a short time afterwards, was, accordingly, executed.\n\t\t\t\t\n\n\t\t\t\n\t\t\t\tDisclaimer: Official Supreme Court case law is only found in the print version of the United States Reports. Justia case law is provided for general informational purposes only, and may not reflect current legal developments, verdicts or settlements. We make no warranties or guarantees about the accuracy, completeness, or adequacy of the information contained on this site or information linked to from this site. Please check official sources.\n\t\t\t\t\n\t\t"
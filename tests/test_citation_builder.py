@@ -1,5 +1,6 @@
 import unittest
-from lib.citation_builders import citations
+from lib.citation_builders import citations, CitationScanner, REPORTERS, NameIndex
+from lib import citation_builders
 import test_cases
 class TestOCMethods(unittest.TestCase):
     """Tests for OpenCourt"""
@@ -11,6 +12,79 @@ class TestOCMethods(unittest.TestCase):
         self.assertEqual(self._citation.citeToName([1,2],test_cases.nameList), "BETHEL v. LLOYD")
         self.assertEqual(self._citation.citeToName([475,8],test_cases.nameList), None)
 
+    def test_citeToNameIndex(self):
+        cb = citations(test_cases.nameList, 'outfile.txt')
+        self.assertEqual(cb.citeToName([1, 2]), "BETHEL v. LLOYD")
+        self.assertEqual(cb.citeToName([475, 8]), None)
+
+    def test_cascadeCase(self):
+        cb = citations([{'number': [2, 40], 'name': 'A'}, {'number': [2, 10], 'name': 'B'}, {'number': [700, 5], 'name': 'C'}], 'outfile.txt')
+        vols, caseDict = cb.buildVolCaseList()
+        self.assertEqual(vols, {2: [10, 40], 700: [5]})
+        self.assertEqual(cb.cascadeCase([2, 40], caseDict, vols), (1, [2, 40]))
+        self.assertEqual(cb.cascadeCase([2, 55], caseDict, vols), (0, [2, 40]))
+        self.assertEqual(cb.cascadeCase([2, 39], caseDict, vols), (0, [2, 10]))
+        self.assertEqual(cb.cascadeCase([2, 3], caseDict, vols), (0, None))
+        self.assertEqual(cb.cascadeCase([701, 3], caseDict, vols), (0, None))
+
+    def test_extractCitations(self):
+        txt = "Brown v. Board of Education, 347 U. S. 483, 495, 74 S. Ct. 686 (1954). Id., at 490. Page 347 U. S. 484 See 74 S. Ct. 700, 12 U.S. 5; Brown, supra, at 3."
+        self.assertEqual(citations.extractCitations(txt), [[347, 483], [347, 483], [12, 5], [347, 483]])
+
+    def test_scanReporters(self):
+        scanner = CitationScanner(REPORTERS + [("F.2d", r'F\.\s?2d')])
+        self.assertEqual(scanner.scan("held in 5 F. 2d 7 and 3 S. Ct. 4 but"), [(5, "F.2d", 7), (3, "S.Ct.", 4)])
+        #an alias spelling and a row with groups of its own
+        scanner = CitationScanner(REPORTERS + [("S.Ct.", r'Sup\.\s?Ct\.'), ("F.2d", r'F\.\s?(2)d')])
+        self.assertEqual(scanner.scan("see 106 Sup. Ct. 4 and 5 F. 2d 7 and 3 S.Ct. 9 and 347 U. S. 483 x"),
+                         [(106, "S.Ct.", 4), (5, "F.2d", 7), (3, "S.Ct.", 9), (347, "U.S.", 483)])
+
+    def test_matchMetrics(self):
+        cases = [{'name': "A v. B", 'url': "/a", 'number': [1, 1], 'vol': 1, 'date': "May 1, 1800", 'txt': "A v. B held in 1 U. S. 1, see 9 U. S. 4."},
+                 {'name': "C v. D", 'url': "/c", 'number': [2, 1], 'vol': 2, 'date': "May 1, 1801", 'txt': "A v. B, 1 U. S. 5, and 3 U. S. 2."},
+                 {'name': "E v. F", 'url': "/e", 'number': [3, 1], 'vol': 3, 'date': "May 1, 1802", 'txt': "No citations at all."}]
+        #summed over every case, even though the last one has no citations
+        records, metrics = citations(cases, '/tmp/opencourt_cites').processText(False, 1)
+        self.assertEqual(metrics, [4.0, 0.25, 0.25, 0.25])
+        self.assertEqual(citations(cases, '/tmp/opencourt_cites').processText(False, 2)[1], metrics)
+        self.assertEqual(citations([], '').matchMetrics(0, 0, 0, 0), [0.0, 0.0, 0.0, 0.0])
+
+    def test_citationCounts(self):
+        majority, dissent = "A v. B was right, 1 U. S. 1.", "A v. B, 1 U. S. 1; and 1 US 5."
+        cases = [{'name': "A v. B", 'url': "/a", 'number': [1, 1], 'vol': 1, 'date': "May 1, 1800", 'txt': "Opinion.", 'citations': []},
+                 {'name': "C v. D", 'url': "/c", 'number': [2, 1], 'vol': 2, 'date': "May 1, 1801", 'txt': majority + "\n" + dissent,
+                  'sections': [["majority", 0, len(majority)], ["dissent", len(majority) + 1, len(majority) + 1 + len(dissent)]],
+                  'citations': [[9, 9]], 'citationCounts': {'majority': [[9, 9, 4]]}}]
+        #each section of the text is scanned again, whatever was counted at scrape time
+        records, metrics = citations(cases, '/tmp/opencourt_cites').processText(False)
+        self.assertEqual(records[1]['citations'], [[1, 1]])
+        self.assertEqual(records[1]['citationCounts'], {'majority': [[1, 1, 1]], 'dissent': [[1, 1, 1]]})
+        self.assertEqual(records[1]['sections'], cases[1]['sections'])
+        self.assertEqual(metrics, [2.0, 1.0, 1.0, 0.0])
+        self.assertTrue('citationCounts' not in records[0])
+        #so new citation code applies without scraping again
+        scanner = citation_builders.SCANNER
+        citation_builders.SCANNER = CitationScanner([(citation_builders.US, r'U\.?\s?S\.?')])
+        try:
+            records, metrics = citations(cases, '/tmp/opencourt_cites').processText(False)
+        finally:
+            citation_builders.SCANNER = scanner
+        self.assertEqual(records[1]['citationCounts'], {'majority': [[1, 1, 1]], 'dissent': [[1, 1, 2]]})
+        self.assertEqual(metrics, [3.0, 2 / 3.0, 1.0, 0.0])
+
+    def test_processTextWorkers(self):
+        serial = citations(test_cases.nameList, '/tmp/opencourt_cites').processText(True)
+        pooled = citations(test_cases.nameList, '/tmp/opencourt_cites').processText(True, 2)
+        self.assertEqual(pooled, serial)
+
+    def test_nameIndex(self):
+        idx = NameIndex("As held in Brown v. Board of Education, 347 U. S. 483, and in United States vs. Lopez; see also Miller v. California.")
+        self.assertTrue(idx.mentions("BROWN v. BOARD OF EDUCATION OF TOPEKA"))
+        self.assertTrue(idx.mentions("UNITED STATES v. LOPEZ"))
+        self.assertTrue(idx.mentions("MILLER v. OHIO"))
+        self.assertFalse(idx.mentions("UNITED STATES v. MORRISON"))
+        self.assertFalse(idx.mentions("ROMER v. EVANS"))
+
     def test_validateName(self):
     	self.assertTrue(self._citation.validateName("Respublica v. Roberts", test_cases.case39))
         self.assertFalse(self._citation.validateName("Romer v. Evans", test_cases.case39))
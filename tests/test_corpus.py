@@ -0,0 +1,71 @@
+import unittest, os, json, tempfile, shutil, StringIO
+from lib import corpus, scrapers, citation_builders
+import test_cases, justia_stub
+
+class TestCorpus(unittest.TestCase):
+    """Tests for the JSON-lines case output and resuming"""
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "cases.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_roundTrip(self):
+        with corpus.CaseWriter(self.path) as out:
+            for case in test_cases.nameList:
+                out.write(case)
+        self.assertEqual(corpus.loadCases(self.path), test_cases.nameList)
+
+    def test_readJsonArray(self):
+        arr = os.path.join(self.dir, "cases.json")
+        with open(arr, 'w') as fp:
+            json.dump(test_cases.nameList, fp, indent=2)
+        self.assertEqual(corpus.loadCases(arr), test_cases.nameList)
+
+    def test_iterJsonArray(self):
+        data = json.dumps(test_cases.nameList, indent=2)
+        self.assertEqual(list(corpus.iterJsonArray(StringIO.StringIO(data), 64)), test_cases.nameList)
+        self.assertEqual(list(corpus.iterJsonArray(StringIO.StringIO(" [ ] "))), [])
+
+    def test_streamCitations(self):
+        with corpus.CaseWriter(self.path) as out:
+            for case in test_cases.nameList:
+                out.write(case)
+        cites = os.path.join(self.dir, "cites")
+        listed, metrics = citation_builders.citations(test_cases.nameList, cites).processText(True)
+        streamed, smetrics = citation_builders.citations(corpus.CaseFile(self.path), cites).processText(True, 1, False)
+        self.assertTrue(isinstance(streamed, corpus.CaseFile))
+        self.assertEqual(list(streamed), listed)
+        self.assertEqual(smetrics, metrics)
+        with open(cites + ".json") as fp:
+            self.assertEqual(json.load(fp), listed)
+
+    def test_truncatedLine(self):
+        with corpus.CaseWriter(self.path) as out:
+            out.write(test_cases.nameList[0])
+        with open(self.path, 'ab') as fp:
+            fp.write('{"name": "HALF WRIT')
+        self.assertEqual(corpus.loadCases(self.path), test_cases.nameList[:1])
+        with corpus.CaseWriter(self.path, True) as out:
+            out.write(test_cases.nameList[1])
+        self.assertEqual(corpus.loadCases(self.path), test_cases.nameList[:2])
+
+    def test_resume(self):
+        server = justia_stub.JustiaStub(justia_stub.buildCorpus(1, 5)).start()
+        try:
+            links = scrapers.VolScraper(1, 1, server.url).scrapeVolumes()
+            out = os.path.join(self.dir, "cases")
+            full = scrapers.CaseScraper(False, links, out, False, server.url).getCases()
+            scrapers.CaseScraper(2, links, out, False, server.url).getCases()
+            self.assertEqual(len(corpus.doneUrls(out + ".jsonl")), 2)
+            del server.requests[:]
+            cs = scrapers.CaseScraper(False, links, out, False, server.url, resume=True)
+            self.assertEqual(len(cs.getCases()), 3)
+            self.assertEqual(len(server.requests), 3 * len(cs.setUrls(1)))
+            self.assertEqual(corpus.loadCases(out + ".jsonl"), full)
+        finally:
+            server.stop()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest, os, json, gzip, tempfile, shutil
+import networkx as nx
+from networkx.readwrite import json_graph
+from lib import exporters, grapher
+from test_grapher import record
+
+class TestExporters(unittest.TestCase):
+    """Tests for the streaming graph writers and the binary format"""
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        cases = [record(1, 1, [[1, 5], [2, 9], [1, 1]]), record(1, 5, [[1, 1]], u"CAF\xc9 v. \"QUOTE\" & CO"), record(2, 1, [[1, 1], [3, 3]])]
+        self.G = grapher.GraphBuilder(cases, os.path.join(self.dir, 'g'), -1, "").drawGraph()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def test_writeGML(self):
+        nx.write_gml(self.G, self.path('nx.gml'))
+        exporters.writeGML(self.G, [self.path('g.gml'), self.path('g.gml.gz')], 7)
+        with open(self.path('nx.gml')) as fp:
+            expected = fp.read()
+        with open(self.path('g.gml')) as fp:
+            self.assertEqual(fp.read(), expected)
+        with gzip.open(self.path('g.gml.gz')) as fp:
+            self.assertEqual(fp.read(), expected)
+
+    def test_writeNodeLink(self):
+        exporters.writeNodeLink(self.G, self.path('g.json'))
+        with open(self.path('g.json')) as fp:
+            self.assertEqual(json.load(fp), json.loads(json.dumps(json_graph.node_link_data(self.G))))
+
+    def test_binary(self):
+        exporters.writeBinary(self.G, self.path('g_csr'))
+        self.assertTrue(exporters.isBinary(self.path('g_csr')))
+        bg = exporters.BinaryGraph(self.path('g_csr'))
+        self.assertEqual(len(bg), len(self.G))
+        self.assertEqual(bg.indptr.dtype.name, 'int32')
+        ids = [n['id'] for n in bg.loadNodes()]
+        first = ids.index("[1, 1]")
+        self.assertEqual(sorted(ids[j] for j in bg.cites(first)), ["[1, 1]", "[1, 5]", "[2, 9]"])
+        self.assertEqual(len(bg.cites(ids.index("[2, 9]"))), 0)
+        self.assertEqual(bg.year[first], 1801)
+        G = bg.toGraph()
+        self.assertEqual(dict(G.node), dict(self.G.node))
+        self.assertEqual(set((frozenset((u, v)), d['by']) for u, v, d in G.edges(data=True)),
+                         set((frozenset((u, v)), d['by']) for u, v, d in self.G.edges(data=True)))
+
+    def test_emptyBinary(self):
+        exporters.writeBinary(nx.Graph(), self.path('e_csr'))
+        bg = exporters.BinaryGraph(self.path('e_csr'))
+        self.assertEqual(len(bg), 0)
+        self.assertEqual(bg.toGraph().number_of_nodes(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest, time, sys, threading, traceback
+from lib import scrapers, fetcher
+import justia_stub
+
+class TestFetcher(unittest.TestCase):
+    """Tests for the concurrent fetching against a local Justia stand-in"""
+    def setUp(self):
+        self.server = justia_stub.JustiaStub(justia_stub.buildCorpus(2, 6)).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def scrape(self, workers, f=None):
+        vols = scrapers.VolScraper(1, 2, self.server.url, f).scrapeVolumes()
+        cs = scrapers.CaseScraper(False, vols, "/tmp/opencourt_test_fetcher", False, self.server.url, workers, f)
+        return cs.getCases()
+
+    def test_orderedMap(self):
+        out = list(fetcher.orderedMap(lambda x: (time.sleep(0.01 * (5 - x)), x)[1], xrange(5), 4))
+        self.assertEqual(out, range(5))
+
+    def test_concurrentMatchesSerial(self):
+        serial = self.scrape(1)
+        concurrent = self.scrape(4)
+        self.assertEqual(len(serial), 12)
+        self.assertEqual(concurrent, serial)
+        self.assertEqual(serial[1]['citations'], [[1, 2], [1, 1]])
+
+    def test_pipeline(self):
+        vs = scrapers.VolScraper(1, 2, self.server.url)
+        self.assertEqual(list(vs.streamVolumes(2, 3)), vs.scrapeVolumes())
+        cs = scrapers.CaseScraper(False, vs.streamVolumes(2, 3), "/tmp/opencourt_test_fetcher", False, self.server.url, 3)
+        self.assertEqual(cs.getCases(), self.scrape(1))
+        cs = scrapers.CaseScraper(4, vs.streamVolumes(2, 3), "/tmp/opencourt_test_fetcher", False, self.server.url, 3)
+        self.assertEqual(len(cs.getCases()), 4)
+
+    def test_streamStops(self):
+        before = threading.active_count()
+        links = scrapers.VolScraper(1, 2, self.server.url).streamVolumes(2, 1)
+        self.assertEqual(len([links.next(), links.next()]), 2)
+        #the consumer stops early, the producer must not stay blocked on the full queue
+        links.close()
+        for i in xrange(50):
+            if threading.active_count() <= before:
+                break
+            time.sleep(0.05)
+        self.assertEqual(threading.active_count(), before)
+
+    def test_streamError(self):
+        vs = scrapers.VolScraper(1, 2, self.server.url)
+        def broken(vol):
+            raise IOError("volume %d" % vol)
+        vs.scrapeVolume = broken
+        try:
+            list(vs.streamVolumes())
+            self.fail("no error raised")
+        except IOError:
+            #the traceback still goes back to where the producer failed
+            self.assertEqual(traceback.extract_tb(sys.exc_info()[2])[-1][2], "broken")
+
+    def test_keepAlive(self):
+        self.scrape(1, fetcher.Fetcher())
+        self.assertEqual(self.server.connections, 1)
+
+    def test_retry(self):
+        self.server.failFirst = 2
+        f = fetcher.Fetcher(backoff=0.01)
+        self.assertTrue('div class="result"' in f.fetch(self.server.url + "/cases/federal/us/1/"))
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_notFound(self):
+        cs = scrapers.CaseScraper(False, [], "/tmp/opencourt_test_fetcher", False, self.server.url)
+        self.assertEqual(cs.fetchCaseText('/cases/federal/us/1/1/', 'dissent'), (None, None))
+
+    def test_rateLimit(self):
+        f = fetcher.Fetcher(rate=20)
+        start = time.time()
+        list(fetcher.orderedMap(f.fetch, [self.server.url + "/cases/federal/us/1/"] * 6, 3))
+        self.assertTrue(time.time() - start >= 0.25)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,14 @@
-import unittest
-from lib import grapher
+import unittest, os, sys, imp, json, tempfile, shutil
+from lib import grapher, corpus
 import test_cases
 
+#loaded before the tests change directory, like a run from the repo root
+runner = imp.load_source('scotus_runner', 'scotus-runner.py')
+
+def record(vol, page, cites, name=None):
+    return {'name': name or "CASE %d v. %d" % (vol, page), 'url': '/cases/federal/us/%d/%d/' % (vol, page),
+            'number': [vol, page], 'vol': vol, 'date': "May 1, %d" % (1800 + vol), 'citations': cites}
+
 class TestOCMethods(unittest.TestCase):
     """Tests for OpenCourt"""
     @classmethod
@@ -13,5 +20,89 @@ class TestOCMethods(unittest.TestCase):
 
   	#def drawGraph(self):
 
+class TestUpdateGraph(unittest.TestCase):
+    """Tests for the incremental graph updates"""
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.dir = tempfile.mkdtemp()
+        os.chdir(self.dir)
+        os.mkdir('vis')
+        self.old = [record(1, 1, [[1, 5], [2, 9]]), record(1, 5, [[1, 1], [4, 4]]), record(2, 1, [[1, 1], [3, 3]])]
+        self.new = [record(1, 5, [[2, 1]], "RENAMED v. CASE"), record(3, 3, [[1, 1], [3, 3]])]
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.dir)
+
+    def graph(self, G):
+        return (dict((n, G.node[n]) for n in G), set((frozenset((s, t)), e.get('by')) for s, t, e in G.edges(data=True)))
+
+    def merged(self):
+        numbers = set(str(c['number']) for c in self.new)
+        return [c for c in self.old if str(c['number']) not in numbers] + self.new
+
+    def test_updateMatchesRebuild(self):
+        for form in (0, 1, 3):
+            grapher.GraphBuilder(self.old, 'g', form, "").drawGraph()
+            G, delta = grapher.GraphBuilder(self.new, 'g', form, "").updateGraph()
+            full = grapher.GraphBuilder(self.merged(), 'full', form, "").drawGraph()
+            self.assertEqual(self.graph(G), self.graph(full))
+        with open('vis/g.json') as fp:
+            data = json.load(fp)
+        self.assertEqual(len(data['nodes']), len(full))
+
+    def test_delta(self):
+        grapher.GraphBuilder(self.old, 'g', 0, "").drawGraph()
+        G, delta = grapher.GraphBuilder(self.new, 'g', 0, "").updateGraph()
+        with open('vis/g.delta.json') as fp:
+            self.assertEqual(json.load(fp), json.loads(json.dumps(delta)))
+        self.assertEqual(sorted(n['id'] for n in delta['nodes']['updated']), ["[1, 5]", "[3, 3]"])
+        self.assertEqual(delta['nodes']['removed'], ["[4, 4]"])
+        self.assertEqual([l['by'] for l in delta['links']['updated']], ["[1, 1]"])
+        added = set(frozenset((l['source'], l['target'])) for l in delta['links']['added'])
+        self.assertEqual(added, set([frozenset(["[1, 5]", "[2, 1]"]), frozenset(["[3, 3]", "[1, 1]"]), frozenset(["[3, 3]"])]))
+        self.assertEqual(delta['links']['removed'], [{'source': "[1, 5]", 'target': "[4, 4]"}])
+
+    def test_counts(self):
+        def counted(vol, page, counts):
+            case = record(vol, page, sorted(set((v, p) for cs in counts.values() for v, p, n in cs)))
+            case['citations'] = [list(c) for c in case['citations']]
+            case['citationCounts'] = counts
+            return case
+        old = [counted(1, 1, {'majority': [[2, 1, 3]], 'dissent': [[2, 1, 1], [3, 3, 2]]}), counted(2, 1, {'majority': [[1, 1, 1]]})]
+        new = [counted(2, 1, {'dissent': [[1, 1, 4]]})]
+        for form in (0, 1):
+            grapher.GraphBuilder(old, 'g', form, "").drawGraph()
+            G, delta = grapher.GraphBuilder(new, 'g', form, "").updateGraph()
+            #each end's citations stay apart, so replacing one case leaves the other's counts
+            e = G["[1, 1]"]["[2, 1]"]
+            self.assertEqual(e['counts'], {'lo': {'majority': 3, 'dissent': 1}, 'hi': {'dissent': 4}})
+            self.assertEqual(e['weight'], 8)
+            self.assertEqual(G["[1, 1]"]["[3, 3]"]['weight'], 2)
+            full = grapher.GraphBuilder(old[:1] + new, 'full', form, "").drawGraph()
+            self.assertEqual(full["[1, 1]"]["[2, 1]"], e)
+        self.assertTrue('counts' not in grapher.GraphBuilder(self.old, 'plain', 0, "").drawGraph()["[1, 1]"]["[1, 5]"])
+
+    def test_updateRunner(self):
+        #phase 2 with --update resolves the new case's citations to the cases in the graph
+        grapher.GraphBuilder(self.old, 'g', 0, "").drawGraph()
+        new = dict(record(5, 1, []), txt="As CASE 1 v. 1, 1 U. S. 1, held, and see 1 U. S. 6.")
+        with corpus.CaseWriter('new.jsonl') as out:
+            out.write(new)
+        argv = sys.argv
+        try:
+            sys.argv = ['scotus-runner.py', '-p', '2', '-i', 'new.jsonl', '-c', 'newcites', '-g', 'g', '--update', '-e', 'False']
+            runner.main()
+        finally:
+            sys.argv = argv
+        G = grapher.GraphBuilder([], 'g', 0, "").loadGraph()
+        self.assertEqual(sorted(G.neighbors("[5, 1]")), ["[1, 1]", "[1, 5]"])
+        self.assertEqual(G["[5, 1]"]["[1, 1]"]['by'], "[5, 1]")
+
+    def test_updateWithoutGraph(self):
+        G, delta = grapher.GraphBuilder(self.old, 'g', 0, "").updateGraph()
+        self.assertEqual(self.graph(G), self.graph(grapher.GraphBuilder(self.old, 'full', 0, "").drawGraph()))
+        self.assertEqual(len(delta['nodes']['added']), len(G))
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
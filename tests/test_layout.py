@@ -0,0 +1,96 @@
+import unittest, os, json, glob, tempfile, shutil
+import numpy as np
+import networkx as nx
+from lib import layout, exporters, grapher
+from test_grapher import record
+
+def cliques(size):
+    """Two cliques of cases joined by one citation"""
+    cases = []
+    for vol in (1, 2):
+        for page in xrange(size):
+            cases.append(record(vol, page, [[vol, p] for p in xrange(page)]))
+    cases[size]['citations'].append([1, 0])
+    return cases
+
+class TestLayout(unittest.TestCase):
+    """Tests for the force layout and the level of detail tiles"""
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.G = nx.Graph()
+        gb = grapher.GraphBuilder([], 'g', 0, "")
+        for case in cliques(30):
+            gb.addCase(self.G, case)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_forceLayout(self):
+        nodes, indptr, indices = exporters.citationArrays(self.G)
+        pos = layout.forceLayout(indptr, indices, 60)
+        self.assertEqual(pos.shape, (60, 2))
+        self.assertTrue((pos >= 0).all() and (pos <= 1).all())
+        vols = np.array([self.G.node[n]['vol'] for n in nodes])
+        centers = [pos[vols == v].mean(axis=0) for v in (1, 2)]
+        spread = max(np.sqrt(((pos[vols == v] - centers[i]) ** 2).sum(axis=1)).mean() for i, v in enumerate((1, 2)))
+        self.assertTrue(np.sqrt(((centers[0] - centers[1]) ** 2).sum()) > 2 * spread)
+        self.assertTrue(np.array_equal(pos, layout.forceLayout(indptr, indices, 60)))
+
+    def test_init(self):
+        init = np.array([[0.0, 0.0], [np.nan, np.nan], [1.0, 1.0]])
+        pos = layout.forceLayout(np.array([0, 0, 0, 0]), np.zeros(0, int), 0, init=init)
+        self.assertEqual(pos[0].tolist(), [0.0, 0.0])
+        self.assertEqual(pos[2].tolist(), [1.0, 1.0])
+        self.assertEqual(len(layout.forceLayout(np.array([0]), np.zeros(0, int))), 0)
+
+    def test_layoutGraph(self):
+        layout.layoutGraph(self.G, 20)
+        xs = [a['x'] for n, a in self.G.nodes(data=True)]
+        ys = [a['y'] for n, a in self.G.nodes(data=True)]
+        self.assertTrue(0 <= min(xs) and max(xs) <= layout.WIDTH and 0 <= min(ys) and max(ys) <= layout.HEIGHT)
+
+    def test_writeTiles(self):
+        layout.layoutGraph(self.G, 20)
+        path = os.path.join(self.dir, 'g_tiles')
+        index = layout.writeTiles(self.G, path, 3, 5)
+        self.assertEqual([l['tiles'] for l in index['levels']], [1, 2, 4])
+        self.assertEqual(index['levels'][0]['nodes'], 5)
+        self.assertEqual(index['levels'][-1]['nodes'], 60)
+        with open(os.path.join(path, '0', '0_0.json')) as fp:
+            top = json.load(fp)
+        hub = max(self.G.nodes(), key=self.G.degree)
+        self.assertTrue(hub in [n['id'] for n in top['nodes']])
+        last = []
+        for name in glob.glob(os.path.join(path, '2', '*.json')):
+            with open(name) as fp:
+                tile = json.load(fp)
+            last.extend(tile['nodes'])
+            tx, ty = map(int, os.path.basename(name)[:-5].split('_'))
+            for n in tile['nodes']:
+                self.assertEqual((min(int(n['x'] * 4 / layout.WIDTH), 3), min(int(n['y'] * 4 / layout.HEIGHT), 3)), (tx, ty))
+        self.assertEqual(len(last), 60)
+        with open(os.path.join(path, 'index.json')) as fp:
+            self.assertEqual(json.load(fp)['levels'][1]['zoom'], 1)
+
+    def test_exports(self):
+        cwd = os.getcwd()
+        try:
+            os.chdir(self.dir)
+            os.mkdir('vis')
+            cases = cliques(10)
+            grapher.GraphBuilder(cases, 'g', 4, "", False, True, 2).drawGraph()
+            with open('vis/g.json') as fp:
+                nodes = dict((n['id'], n) for n in json.load(fp)['nodes'])
+            self.assertTrue('x' in nodes["[1, 0]"] and 'y' in nodes["[1, 0]"])
+            bg = exporters.BinaryGraph('vis/g_csr')
+            self.assertEqual(len(bg.columns['x']), 20)
+            self.assertTrue(os.path.exists('vis/g_tiles/1'))
+            #a case updated with the same details keeps its position to start the next layout from
+            G, delta = grapher.GraphBuilder([record(2, 9, [[1, 0]])], 'g', 0, "", False, True, 0).updateGraph()
+            self.assertEqual(delta['nodes']['updated'], [])
+            self.assertTrue(0 <= G.node["[2, 9]"]['x'] <= layout.WIDTH)
+        finally:
+            os.chdir(cwd)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest, os, sys, imp, tempfile, shutil
+from lib import manifest
+import justia_stub
+
+#loaded before the tests change directory, like a run from the repo root
+runner = imp.load_source('scotus_runner', 'scotus-runner.py')
+
+class TestManifest(unittest.TestCase):
+    """Tests for the pipeline manifest and the -p 0 runner"""
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.dir = tempfile.mkdtemp()
+        self.code = dict(manifest.CODE)
+
+    def tearDown(self):
+        manifest.CODE.clear()
+        manifest.CODE.update(self.code)
+        os.chdir(self.cwd)
+        shutil.rmtree(self.dir)
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def test_keys(self):
+        mf = manifest.Manifest(self.path('m.json'))
+        key = mf.key('citations', {'a': 1}, ['x'])
+        self.assertEqual(key, mf.key('citations', {'a': 1}, ['x']))
+        self.assertNotEqual(key, mf.key('citations', {'a': 2}, ['x']))
+        self.assertNotEqual(key, mf.key('citations', {'a': 1}, ['y']))
+        self.assertNotEqual(key, mf.key('graph', {'a': 1}, ['x']))
+        manifest.CODE['citations'] = manifest.CODE['citations'] + ['analytics']
+        self.assertNotEqual(key, mf.key('citations', {'a': 1}, ['x']))
+        #the scraped cases embed their citations, so new citation code parses them again
+        self.assertTrue('citation_builders' in manifest.CODE['cases'])
+
+    def test_fresh(self):
+        mf = manifest.Manifest(self.path('m.json'))
+        out = self.path('out.json')
+        with open(out, 'w') as fp:
+            fp.write("[]")
+        self.assertFalse(mf.fresh('cases', 'k'))
+        mf.record('cases', 'k', [out, self.dir, self.path('missing')])
+        mf = manifest.Manifest(self.path('m.json'))
+        self.assertTrue(mf.fresh('cases', 'k'))
+        self.assertFalse(mf.fresh('cases', 'other'))
+        self.assertEqual(mf.output('cases', out), manifest.fileHash(out))
+        with open(out, 'w') as fp:
+            fp.write("[1]")
+        self.assertFalse(mf.fresh('cases', 'k'))
+        mf.record('cases', 'k', [out])
+        os.remove(out)
+        self.assertFalse(mf.fresh('cases', 'k'))
+        #none of the outputs were written
+        mf.record('cases', 'k', [out])
+        self.assertFalse(mf.fresh('cases', 'k'))
+        mf.record('analytics', 'k', [])
+        self.assertTrue(mf.fresh('analytics', 'k'))
+
+    def runner(self, server, *extra):
+        runner.baseURL = server.url
+        argv = sys.argv
+        sys.argv = ['scotus-runner.py', '-p', '0', '-s', '1', '-t', '2', '-x', 'False', '-e', 'False', '--cache', 'pages',
+                    '--suffixMap', 'suffixes.json', '-o', 'cases', '-c', 'cites', '-g', 'g'] + list(extra)
+        try:
+            runner.main()
+        finally:
+            sys.argv = argv
+
+    def stamp(self, *paths):
+        """Backdate files so a rewrite shows in the mtime"""
+        for p in paths:
+            os.utime(p, (1000000000, 1000000000))
+
+    def test_pipeline(self):
+        os.chdir(self.dir)
+        os.mkdir('vis')
+        server = justia_stub.JustiaStub(justia_stub.buildCorpus(2, 3)).start()
+        try:
+            self.runner(server)
+            self.assertTrue(server.requests)
+            self.assertTrue(os.path.exists('vis/g.json'))
+            self.stamp('cases.jsonl', 'cites.json', 'vis/g.json')
+            del server.requests[:]
+            #nothing changed
+            self.runner(server)
+            self.assertEqual(server.requests, [])
+            self.assertEqual([os.path.getmtime(p) for p in ('cases.jsonl', 'cites.json', 'vis/g.json')], [1000000000] * 3)
+            #new citation code that resolves the same citations rebuilds no graph
+            manifest.CODE['citations'] = manifest.CODE['citations'] + ['analytics']
+            self.runner(server)
+            self.assertEqual(server.requests, [])
+            self.assertNotEqual(os.path.getmtime('cites.json'), 1000000000)
+            self.assertEqual(os.path.getmtime('vis/g.json'), 1000000000)
+            #turning the analytics on adds them to the graph already there
+            self.runner(server, '-a')
+            self.assertTrue(os.path.exists('vis/g.analytics.json'))
+            self.assertNotEqual(os.path.getmtime('vis/g.json'), 1000000000)
+            self.assertEqual(os.path.getmtime('cases.jsonl'), 1000000000)
+            #new parsing code parses the cached pages again
+            manifest.CODE['cases'] = manifest.CODE['cases'] + ['analytics']
+            self.runner(server, '-a')
+            self.assertEqual(server.requests, [])
+            self.assertNotEqual(os.path.getmtime('cases.jsonl'), 1000000000)
+            self.assertEqual(len(open('cases.jsonl').readlines()), 6)
+            #new output files are written even though nothing else changed
+            self.runner(server, '-a', '-o', 'other', '-c', 'othercites')
+            self.assertEqual(server.requests, [])
+            self.assertEqual(len(open('other.jsonl').readlines()), 6)
+            self.assertTrue(os.path.exists('othercites.json'))
+            #new sub page code can ask for other pages, so they are fetched (revalidated) again
+            manifest.CODE['pages'] = manifest.CODE['pages'] + ['analytics']
+            self.runner(server, '-a')
+            self.assertTrue(server.requests)
+            del server.requests[:]
+            #the text index is built, kept up to date and built again somewhere new
+            self.runner(server, '-a', '--textIndex', 'ti')
+            self.assertTrue(os.path.exists('ti/docs.jsonl'))
+            self.stamp('ti/docs.jsonl')
+            self.runner(server, '-a', '--textIndex', 'ti')
+            self.assertEqual(os.path.getmtime('ti/docs.jsonl'), 1000000000)
+            self.runner(server, '-a', '--textIndex', 'ti2')
+            self.assertTrue(os.path.exists('ti2/docs.jsonl'))
+            shutil.rmtree('ti2')
+            self.runner(server, '-a', '--textIndex', 'ti2')
+            self.assertTrue(os.path.exists('ti2/docs.jsonl'))
+            #a different volume range is scraped again
+            self.runner(server, '-a', '-t', '1')
+            self.assertTrue(server.requests)
+            self.assertEqual(len(open('cases.jsonl').readlines()), 3)
+        finally:
+            server.stop()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest, os, json, shutil, tempfile, threading, time
+from lib import metrics, helper, scrapers, fetcher, citation_builders
+import justia_stub
+import test_cases
+
+class TestMetrics(unittest.TestCase):
+    """Tests for the run metrics and the background notifier"""
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_histogram(self):
+        h = metrics.Histogram((0.1, 1.0, float('inf')))
+        for v in (0.05, 0.5, 0.7, 3):
+            h.observe(v)
+        self.assertEqual(h.cumulative(), [1, 3, 4])
+        self.assertEqual(h.count, 4)
+        self.assertAlmostEqual(h.sum, 4.25)
+
+    def test_counters(self):
+        m = metrics.Metrics()
+        m.inc('pages', suffix="case", result="missing")
+        m.inc('pages', suffix="case", result="missing")
+        m.inc('bytes', 100)
+        self.assertEqual(m.count('pages', suffix="case", result="missing"), 2)
+        self.assertEqual(m.count('pages', result="missing", suffix="case"), 2)
+        self.assertEqual(m.count('bytes'), 100)
+        self.assertEqual(m.count('pages', suffix="opinion", result="found"), 0)
+
+    def test_progress(self):
+        m = metrics.Metrics()
+        with m.phase('scrape'):
+            m.setTotal(10)
+            m.setTotal(40)
+            m.phases['scrape'][0] -= 5
+            for i in xrange(5):
+                m.caseDone()
+            done, rate, eta = m.progress()
+            self.assertEqual(done, 5)
+            self.assertAlmostEqual(rate, 1.0, 1)
+            self.assertAlmostEqual(eta, 5.0, 0)
+        with m.phase('citations'):
+            self.assertEqual(m.progress()[0], 0)
+            self.assertEqual(m.progress()[2], None)
+        self.assertEqual(sorted(m.snapshot()['phases']), ['citations', 'scrape'])
+
+    def test_write(self):
+        path = os.path.join(self.dir, "run.json")
+        m = metrics.Metrics(path, 0.01).start()
+        m.observe('request_seconds', 0.2)
+        m.inc('responses', status="200")
+        time.sleep(0.1)
+        self.assertTrue(os.path.exists(path))
+        m.stop()
+        with open(path) as fp:
+            snap = json.load(fp)
+        self.assertEqual(snap['counters']['responses'], [{'status': "200", 'value': 1}])
+        self.assertEqual(snap['histograms']['request_seconds'][0]['buckets']['0.25'], 1)
+        with open(os.path.join(self.dir, "run.prom")) as fp:
+            prom = fp.read()
+        self.assertIn('opencourt_responses_total{status="200"} 1', prom)
+        self.assertIn('opencourt_request_seconds_bucket{le="0.1"} 0', prom)
+        self.assertIn('opencourt_request_seconds_bucket{le="+Inf"} 1', prom)
+        self.assertIn('opencourt_request_seconds_count 1', prom)
+        self.assertEqual(sorted(os.listdir(self.dir)), ["run.json", "run.prom"])
+
+    def test_notifier(self):
+        sent, gate = [], threading.Event()
+        def send(subject, text):
+            gate.wait(5)
+            if subject == "bad":
+                raise IOError("no server")
+            sent.append(subject)
+        n = helper.Notifier(send)
+        start = time.time()
+        n.notify("bad", "")
+        n.progress(10, 5, 50, "now")
+        n.notify("done", "")
+        self.assertLess(time.time() - start, 1)
+        gate.set()
+        n.close()
+        self.assertEqual(sent, ["Your Script is through 10% (5/50) cases", "done"])
+
+    def test_citations(self):
+        m = metrics.Metrics()
+        with m.phase('citations'):
+            citation_builders.citations(test_cases.nameList, os.path.join(self.dir, "cites"), m).processText(True)
+            self.assertEqual(m.progress()[0], len(test_cases.nameList))
+        self.assertEqual(m.snapshot()['histograms']['resolve_seconds'][0]['count'], len(test_cases.nameList))
+
+
+class TestScrapeMetrics(unittest.TestCase):
+    """The scrape metrics against a local Justia stand-in"""
+    def setUp(self):
+        self.server = justia_stub.JustiaStub(justia_stub.buildCorpus(1, 4), failFirst=1).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_scrape(self):
+        m = metrics.Metrics()
+        f = fetcher.Fetcher(backoff=0, metrics=m)
+        sent = []
+        with m.phase('scrape'):
+            links = scrapers.VolScraper(1, 1, self.server.url, f).streamVolumes()
+            cs = scrapers.CaseScraper(False, links, "/tmp/opencourt_test_metrics", True, self.server.url, 1, f,
+                                      notifier=helper.Notifier(lambda s, t: sent.append(s)))
+            cases = cs.getCases()
+            self.assertEqual(m.progress()[0], 4)
+            self.assertEqual(m.total, 4)
+        cs.notifier.close()
+        self.assertEqual(len(cases), 4)
+        self.assertEqual(m.count('retries'), 1)
+        self.assertEqual(m.count('responses', status="503"), 1)
+        self.assertEqual(m.count('pages', suffix="landing", result="found"), 4)
+        self.assertEqual(m.count('pages', suffix="case", result="missing"), m.count('responses', status="404"))
+        self.assertGreater(m.count('bytes'), 0)
+        self.assertEqual(m.snapshot()['histograms']['parse_seconds'][0]['count'], 4)
+        self.assertEqual(m.snapshot()['histograms']['request_seconds'][0]['count'], len(self.server.requests))
+
+if __name__ == '__main__':
+    unittest.main()
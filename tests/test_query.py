@@ -0,0 +1,95 @@
+import unittest, os, json, tempfile, shutil, threading, urllib2
+from lib import query, grapher
+from test_grapher import record
+
+class TestQuery(unittest.TestCase):
+    """Tests for the citation query index and its HTTP API"""
+    @classmethod
+    def setUpClass(cls):
+        cls.dir = tempfile.mkdtemp()
+        cls.cwd = os.getcwd()
+        os.chdir(cls.dir)
+        os.mkdir('vis')
+        cases = [record(1, 1, [[1, 5], [2, 9]]), record(1, 5, [[1, 1]]), record(2, 1, [[1, 1], [1, 5], [3, 3]]),
+                 record(3, 3, [[1, 1]]), record(3, 7, [[3, 3]]), record(4, 1, [])]
+        grapher.GraphBuilder(cases, 'g', 2, "").drawGraph()
+        grapher.GraphBuilder(cases, 'b', 3, "").drawGraph()
+        query.buildIndex('vis/g', 'vis/g_index')
+        query.buildIndex('vis/b', 'vis/b_index')
+        cls.idx = query.CitationIndex('vis/g_index')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.idx.close()
+        os.chdir(cls.cwd)
+        shutil.rmtree(cls.dir)
+
+    def ids(self, found):
+        return [self.idx.node(i)['id'] for i in found]
+
+    def case(self, vol, page):
+        return self.idx.find(vol, page)
+
+    def test_parseCite(self):
+        self.assertEqual(query.parseCite("347 U.S. 483"), (347, 483))
+        self.assertEqual(query.parseCite("[347, 483]"), (347, 483))
+        self.assertEqual(query.parseCite("347/483"), (347, 483))
+        self.assertEqual(query.parseCite("Brown"), None)
+
+    def test_find(self):
+        self.assertEqual(self.idx.node(self.case(3, 7))['name'], "CASE 3 v. 7")
+        self.assertEqual(self.case(9, 9), None)
+        self.assertEqual(len(self.idx), 7)
+
+    def test_citesAndCitedBy(self):
+        self.assertEqual(sorted(self.ids(self.idx.cites(self.case(2, 1)))), ["[1, 1]", "[1, 5]", "[3, 3]"])
+        self.assertEqual(sorted(self.ids(self.idx.citedBy(self.case(1, 1)))), ["[1, 5]", "[2, 1]", "[3, 3]"])
+        self.assertEqual(self.idx.cites(self.case(4, 1)), [])
+
+    def test_sameFromBinary(self):
+        b = query.CitationIndex('vis/b_index')
+        try:
+            cited = lambda idx: sorted(idx.node(i)['id'] for i in idx.citedBy(idx.find(1, 5)))
+            self.assertEqual(cited(b), cited(self.idx))
+        finally:
+            b.close()
+
+    def test_hops(self):
+        found = dict((self.idx.node(i)['id'], d) for i, d in self.idx.hops(self.case(3, 7), 3))
+        self.assertEqual(found, {"[3, 3]": 1, "[1, 1]": 2, "[1, 5]": 3, "[2, 9]": 3})
+        found = dict((self.idx.node(i)['id'], d) for i, d in self.idx.hops(self.case(3, 3), 1, "in"))
+        self.assertEqual(found, {"[2, 1]": 1, "[3, 7]": 1})
+        self.assertEqual(self.idx.hops(self.case(4, 1), 2, "both"), [])
+
+    def test_path(self):
+        self.assertEqual(self.ids(self.idx.path(self.case(3, 7), self.case(2, 9))), ["[3, 7]", "[3, 3]", "[1, 1]", "[2, 9]"])
+        self.assertEqual(self.idx.path(self.case(2, 9), self.case(3, 7)), None)
+        self.assertEqual(self.ids(self.idx.path(self.case(2, 9), self.case(3, 7), "in")), ["[2, 9]", "[1, 1]", "[3, 3]", "[3, 7]"])
+        self.assertEqual(self.idx.path(self.case(4, 1), self.case(4, 1)), [self.case(4, 1)])
+
+    def test_top(self):
+        self.assertEqual(self.ids(i for i, c in self.idx.top(2)), ["[1, 1]", "[1, 5]"])
+        self.assertEqual([(self.idx.node(i)['id'], c) for i, c in self.idx.top(5, 1803, 1804)], [("[3, 3]", 2), ("[3, 7]", 0), ("[4, 1]", 0)])
+
+    def test_server(self):
+        server = query.QueryServer(self.idx, ("127.0.0.1", 0))
+        t = threading.Thread(target=server.serve_forever)
+        t.daemon = True
+        t.start()
+        base = "http://127.0.0.1:%d/" % server.server_address[1]
+        try:
+            get = lambda q: json.load(urllib2.urlopen(base + q))
+            self.assertEqual(sorted(n['id'] for n in get("citedby?case=1/1")), ["[1, 5]", "[2, 1]", "[3, 3]"])
+            self.assertEqual([n['hops'] for n in get("hops?case=3/7&k=2")], [1, 2])
+            self.assertEqual([n['id'] for n in get("path?from=3/7&to=1/1")], ["[3, 7]", "[3, 3]", "[1, 1]"])
+            self.assertEqual(get("top?n=1")[0]['citedBy'], 3)
+            for q, status in (("cites?case=9/9", 404), ("cites?case=x", 400), ("nothing", 404), ("hops?case=1/1&dir=up", 400)):
+                with self.assertRaises(urllib2.HTTPError) as e:
+                    urllib2.urlopen(base + q)
+                self.assertEqual(e.exception.code, status)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+if __name__ == '__main__':
+    unittest.main()
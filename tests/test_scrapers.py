@@ -29,9 +29,49 @@ class TestOCMethods(unittest.TestCase):
      	self.assertEqual(txt, test_cases.case39)
 
     def test_Disclamer(self):
-    	self.assertEqual(self._caseScrape.deleteDisclamer(test_cases.nameList[0]['txt']), test_cases.noDisclaimer)
+    	#the page text of the first case, with the disclaimer where Justia puts it
+    	page = test_cases.noDisclaimer[:-8] + scrapers.DISCLAIMER + test_cases.noDisclaimer[-8:]
+    	self.assertEqual(self._caseScrape.deleteDisclamer(page), test_cases.noDisclaimer)
+
+    def test_opinionText(self):
+    	page = '<html><head><meta charset="utf-8"></head><body><div id="nav"><div id="opinion2">Menu</div></div><div class="x" id="opinion"><p>Brown v. Board, 347 <i>U. S.</i> 483</p>\n\n      <div>Caf\xc3\xa9 &amp; \xe2\x80\x9cco\xe2\x80\x9d</div><p>' + scrapers.DISCLAIMER + '</p></div><div id="footer">Footer</div></body></html>'
+    	self.assertEqual(scrapers.opinionText(page), 'Brown v. Board, 347 U. S. 483\nCafe & "co"')
+    	self.assertEqual(scrapers.opinionText(page, 16), scrapers.opinionText(page))
+    	self.assertEqual(scrapers.opinionText('<html><body><p>No opinion</p></body></html>'), '')
+
+    def test_dedupPages(self):
+    	one, two = "Majority one, cited at 1 U. S. 1 for the rule.", "Majority two, which the dissent also quotes."
+    	dissent = "Dissent, 2 U. S. 5; and again 2 U. S. 5 in the dissent."
+    	more = "More dissent, with 1 U. S. 1 cited a second time."
+    	spaced = "Majority one,   cited at 1 U. S. 1 for the rule."
+    	pages = [("", "\n".join(["Syllabus", one, two, dissent])),
+    	         ("opinion", "\n".join([spaced, two])),
+    	         ("dissent", "\n".join([dissent, more, more]))]
+    	text, sections, dropped = scrapers.dedupPages(pages)
+    	#the landing page's copies give way to those of the sub pages
+    	self.assertEqual(text, "\n".join(["Syllabus", spaced, two, dissent, more, more]))
+    	self.assertEqual([(s, text[a:b]) for s, a, b in sections],
+    	                 [("majority", "\n".join(["Syllabus", spaced, two])), ("dissent", "\n".join([dissent, more, more]))])
+    	self.assertEqual(dropped, len(one + two + dissent))
+    	counts, cites = citation_builders.citations.countCitations(text, sections)
+    	self.assertEqual(counts, {"majority": [[1, 1, 1]], "dissent": [[2, 5, 2], [1, 1, 2]]})
+    	self.assertEqual(cites, [[1, 1], [2, 5]])
+    	self.assertEqual(scrapers.sectionOf("concur4"), "concurrence")
+    	self.assertEqual(scrapers.dedupPages([]), ("", [], 0))
+
+    def test_dedupBoilerplate(self):
+    	majority = ["The judgment of the Court of Appeals is affirmed for these reasons.", "[Footnote 1]", "It is so ordered.",
+    	            "The statute reaches the conduct charged in the indictment here."]
+    	dissent = ["I would reverse the judgment of the Court of Appeals instead.", "[Footnote 1]", "It is so ordered."]
+    	text, sections, dropped = scrapers.dedupPages([("opinion", "\n".join(majority)), ("dissent", "\n".join(dissent))])
+    	#short lines every page can have stay on each page, in that page's section
+    	self.assertEqual(text, "\n".join(majority + dissent))
+    	self.assertEqual([(s, text[a:b]) for s, a, b in sections],
+    	                 [("majority", "\n".join(majority)), ("dissent", "\n".join(dissent))])
+    	self.assertEqual(dropped, 0)
 
     def test_getCases(self):
+    	#needs the network: scrapes the first two cases of volume 1 from Justia
     	self.assertEqual(self._caseScrape.getCases(), test_cases.nameList)
 
 
@@ -0,0 +1,101 @@
+import unittest, os, sys, imp, json, tempfile, shutil, time, multiprocessing
+from lib import shards, corpus
+import justia_stub
+
+#loaded before the tests change directory, the workers are forked with it
+runner = imp.load_source('scotus_runner', 'scotus-runner.py')
+
+def runWorker(url, argv):
+    """Run the runner as the command line would, in a worker process or this one"""
+    runner.baseURL = url
+    sys.argv = ['scotus-runner.py'] + argv
+    runner.main()
+
+class TestShards(unittest.TestCase):
+    """Tests for the lease-based shard queue and the sharded runner modes"""
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.dir)
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def test_claims(self):
+        q = shards.ShardQueue(self.path('q.sqlite'))
+        self.assertEqual(q.create(1, 25, 10, self.path('out')), 3)
+        self.assertEqual(q.create(1, 99, 10, self.path('out')), 3)
+        self.assertEqual([(s['vStart'], s['vStop']) for s in q.shards()], [(1, 10), (11, 20), (21, 25)])
+        a, b = q.claim("a"), q.claim("b")
+        self.assertEqual((a['id'], b['id']), (1, 2))
+        other = shards.ShardQueue(self.path('q.sqlite'))
+        c = other.claim("c", lease=0.05)
+        self.assertEqual(c['id'], 3)
+        self.assertEqual(q.claim("a"), None)
+        q.release(b, "b")
+        self.assertEqual(q.claim("d")['id'], 2)
+        #c's lease runs out and the shard goes to a
+        time.sleep(0.1)
+        taken = q.claim("a")
+        self.assertEqual((taken['id'], taken['attempts']), (3, 2))
+        self.assertFalse(other.renew(c, "c"))
+        self.assertFalse(other.complete(c, "c", 5))
+        self.assertTrue(q.complete(taken, "a", 5))
+        self.assertEqual(q.status(), {'pending': 0, 'leased': 2, 'done': 1})
+        other.close()
+        q.close()
+
+    def test_work(self):
+        q = shards.ShardQueue(self.path('q.sqlite'))
+        q.create(1, 4, 2, self.path('out'))
+        def scrape(shard, prefix):
+            with open(prefix + ".jsonl", 'w') as fp:
+                for v in xrange(shard['vStart'], shard['vStop'] + 1):
+                    fp.write(json.dumps({'vol': v}) + "\n")
+            return shard['vStop'] - shard['vStart'] + 1
+        self.assertRaises(ValueError, shards.merge, q, self.path('all.jsonl'))
+        def fail(shard, prefix):
+            raise IOError("down")
+        self.assertRaises(IOError, shards.work, q, fail, "w")
+        self.assertEqual(q.status()['pending'], 2)
+        self.assertEqual(shards.work(q, scrape, "w"), [1, 2])
+        self.assertEqual(sorted(os.listdir(self.path('out'))), ["cases-1-2.jsonl", "cases-3-4.jsonl"])
+        self.assertEqual(shards.merge(q, self.path('all.jsonl')), 4)
+        self.assertEqual([c['vol'] for c in corpus.readCases(self.path('all.jsonl'))], [1, 2, 3, 4])
+
+    def test_workers(self):
+        os.chdir(self.dir)
+        os.mkdir('vis')
+        server = justia_stub.JustiaStub(justia_stub.buildCorpus(6, 3)).start()
+        common = ['-s', '1', '-t', '6', '-x', 'False', '-e', 'False', '--queue', 'q.sqlite', '--shardSize', '1', '--lease', '1']
+        try:
+            runWorker(server.url, common + ['--shard', 'coordinator'])
+            #a worker that died holding the first shard
+            dead = shards.ShardQueue('q.sqlite')
+            dead.claim("dead", lease=0.5)
+            dead.close()
+            procs = [multiprocessing.Process(target=runWorker, args=(server.url, common + ['--shard', 'worker', '--worker', 'w%d' % i]))
+                     for i in xrange(3)]
+            for p in procs:
+                p.start()
+            for p in procs:
+                p.join(60)
+                self.assertEqual(p.exitcode, 0)
+            q = shards.ShardQueue('q.sqlite')
+            done = q.shards()
+            q.close()
+            self.assertEqual([s['state'] for s in done], ['done'] * 6)
+            self.assertEqual(done[0]['attempts'], 2)
+            self.assertNotEqual(done[0]['worker'], "dead")
+            runWorker(server.url, common + ['--shard', 'merge', '-o', 'cases', '-c', 'cites', '-g', 'g'])
+        finally:
+            server.stop()
+        cases = list(corpus.readCases('cases.jsonl'))
+        self.assertEqual([c['number'] for c in cases], [[v, p] for v in xrange(1, 7) for p in xrange(1, 4)])
+        self.assertTrue(os.path.exists('vis/g.json'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest, tempfile, shutil, os, pickle
+from lib import store, corpus, citation_builders
+import test_cases
+
+class TestCorpusStore(unittest.TestCase):
+    """Tests for the compact corpus store"""
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "cases.corpus")
+        store.convert(test_cases.nameList, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_roundTrip(self):
+        cs = store.CorpusStore(self.path)
+        self.assertEqual(len(cs), 2)
+        self.assertFalse('txt' in cs[0])
+        self.assertEqual(cs[0]['txt'], test_cases.nameList[0]['txt'])
+        self.assertEqual([dict(c, txt=c['txt']) for c in cs], test_cases.nameList)
+
+    def test_readCases(self):
+        self.assertEqual(corpus.loadCases(self.path)[1]['name'], "BETHEL v. LLOYD")
+
+    def test_pickle(self):
+        case = pickle.loads(pickle.dumps(store.CorpusStore(self.path)[1], 2))
+        self.assertEqual(case, test_cases.nameList[1])
+
+    def test_citations(self):
+        listed = citation_builders.citations(test_cases.nameList, os.path.join(self.dir, "a")).processText(True)
+        stored = citation_builders.citations(corpus.CaseFile(self.path), os.path.join(self.dir, "b")).processText(True)
+        self.assertEqual(stored, listed)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest, tempfile, shutil, os
+from lib import suffixes, scrapers
+import justia_stub
+
+class TestSuffixMap(unittest.TestCase):
+    """Tests for learning which suffix pages exist"""
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_learnMisses(self):
+        sm = suffixes.SuffixMap(minTrials=3, reprobe=4)
+        for i in xrange(3):
+            self.assertEqual(sm.plan(570, ["opinion3", "dissent6"]), ["opinion3", "dissent6"])
+            sm.record(570, "opinion3", True)
+            sm.record(570, "dissent6", False)
+        plans = [sm.plan(575, ["opinion3", "dissent6"]) for i in xrange(4)]
+        self.assertEqual(plans[:3], [["opinion3"]] * 3)
+        self.assertEqual(plans[3], ["opinion3", "dissent6"])
+        self.assertEqual(sm.plan(580, ["opinion3", "dissent6"]), ["opinion3", "dissent6"])
+
+    def test_linked(self):
+        sm = suffixes.SuffixMap()
+        self.assertEqual(sm.plan(550, ["opinion", "concurrence", "dissent"], set(["dissent", "opinion", "syllabus"])), ["opinion", "dissent", "syllabus"])
+
+    def test_persist(self):
+        path = os.path.join(self.dir, "suffixes.json")
+        sm = suffixes.SuffixMap(path)
+        sm.record(12, "case", True)
+        sm.save()
+        self.assertEqual(suffixes.SuffixMap(path).counts(15, "case"), [1, 0, 0])
+
+    def test_requestsPerCase(self):
+        cases = justia_stub.buildCorpus(1, 8)
+        for url, case in cases.items():
+            case['vol'] = 570
+            case['pages']['opinion3'] = "Opinion of the court."
+        cases = dict((u.replace("/us/1/", "/us/570/"), c) for u, c in cases.items())
+        #the first case links its pages from the landing page
+        first = cases["/cases/federal/us/570/1/"]
+        first['pages'][""] += ' <a href="/cases/federal/us/570/1/opinion3.html">Opinion</a>'
+        server = justia_stub.JustiaStub(cases).start()
+        try:
+            links = scrapers.VolScraper(570, 570, server.url).scrapeVolumes()
+            cs = scrapers.CaseScraper(False, links, os.path.join(self.dir, "cases"), False, server.url, suffixMap=suffixes.SuffixMap(minTrials=3))
+            found = cs.getCases()
+        finally:
+            server.stop()
+        self.assertTrue(all("Opinion of the court." in c['txt'] for c in found))
+        # 2 requests for the linked case, 6 for the next three, then 2 once the misses are learned
+        self.assertEqual(cs.stats['requests'], 2 + 3 * 6 + 4 * 2)
+        self.assertEqual(cs.stats['pages'], 16)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest, json, os
+from lib import scrapers
+from lib.citation_builders import citations
+from benchmarks import synthetic, suite
+import justia_stub
+
+class TestSynthetic(unittest.TestCase):
+    """Tests for the synthetic corpus, its Justia stand-in and the benchmark baseline check"""
+    def test_generate(self):
+        cases = list(synthetic.generateCases(50, 6, perVol=10, vStart=100, words=100))
+        self.assertEqual(cases, list(synthetic.generateCases(50, 6, perVol=10, vStart=100, words=100)))
+        self.assertEqual([c['vol'] for c in cases[::10]], [100, 101, 102, 103, 104])
+        numbers = set(tuple(c['number']) for c in cases)
+        for c in cases[1:]:
+            self.assertTrue(c['citations'])
+            #the case's own number is first, then the earlier cases it cites
+            self.assertEqual(c['citations'][0], c['number'])
+            for cite in c['citations'][1:]:
+                self.assertTrue(cite < c['number'] or tuple(cite) not in numbers)
+        self.assertEqual(set(cases[0]), set(['name', 'url', 'txt', 'number', 'citations', 'vol', 'date']))
+
+    def test_scrape(self):
+        cases = list(synthetic.generateCases(40, 4, perVol=8, vStart=537, words=60))
+        pages = justia_stub.fromCases(cases)
+        for c in pages.values():
+            self.assertTrue(set(c['pages']) - set([""]) <= set(justia_stub.layout(c['vol'])))
+        self.assertEqual(set(s for c in pages.values() for s in c['pages']), set(["", "case", "opinion", "concurrence", "dissent"]))
+        server = justia_stub.JustiaStub(pages).start()
+        try:
+            links = scrapers.VolScraper(537, 541, server.url).streamVolumes(2)
+            cs = scrapers.CaseScraper(False, links, "/tmp/opencourt_test_synthetic", False, server.url, 3)
+            scraped = cs.getCases()
+        finally:
+            server.stop()
+        #the pages of a case come back on separate lines
+        self.assertEqual([c['txt'].split() for c in scraped], [c['txt'].split() for c in cases])
+        self.assertEqual([c['number'] for c in scraped], [c['number'] for c in cases])
+        self.assertEqual(cs.stats['pages'], sum(len(c['pages']) for c in pages.values()))
+
+    def test_overlap(self):
+        cases = list(synthetic.generateCases(30, 4, perVol=10, vStart=560, words=80))
+        server = justia_stub.JustiaStub(justia_stub.fromCases(cases, overlap=True)).start()
+        try:
+            cs = scrapers.CaseScraper(False, scrapers.VolScraper(560, 562, server.url).scrapeVolumes(), "/tmp/opencourt_test_synthetic", False, server.url)
+            scraped = cs.getCases()
+        finally:
+            server.stop()
+        #the landing page repeats the sub pages but every paragraph is kept once
+        self.assertEqual([c['txt'] for c in scraped], [c['txt'] for c in cases])
+        self.assertGreater(cs.stats['duplicate'], 0)
+        for c in scraped:
+            self.assertEqual(len(c['citations']), len(set(map(tuple, c['citations']))))
+            self.assertEqual(sum(n for s in c['citationCounts'].values() for v, p, n in s), len(citations.extractCitations(c['txt'])))
+            self.assertEqual(c['sections'][0][1], 0)
+            self.assertEqual(c['sections'][-1][2], len(c['txt']))
+        self.assertEqual(set(s[0] for c in scraped for s in c['sections']), set(["majority", "concurrence", "dissent"]))
+
+    def test_compare(self):
+        baseline = {'scrape': {'value': 100, 'better': "higher"}, 'graph': {'value': 2.0, 'better': "lower"},
+                    'extract': {'value': 10, 'better': "higher"}}
+        results = {'scrape': {'value': 70}, 'graph': {'value': 2.4}, 'extract': {'value': 30}}
+        self.assertEqual(suite.compare(results, baseline, 0.25), [('scrape', 100, 70)])
+        self.assertEqual(suite.compare(results, baseline, 0.1), [('graph', 2.0, 2.4), ('scrape', 100, 70)])
+
+    def test_baseline(self):
+        with open(suite.BASELINE) as fp:
+            baseline = json.load(fp)
+        self.assertEqual(sorted(baseline['results']), ['citations_w1', 'citations_w2', 'citations_w4', 'extract', 'graph', 'scrape'])
+
+if __name__ == '__main__':
+    unittest.main()
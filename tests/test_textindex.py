@@ -0,0 +1,101 @@
+import unittest, os, sys, imp, tempfile, shutil
+from lib import textindex, corpus
+from benchmarks import synthetic
+
+def case(vol, page, name, txt, date="May 17, 1954"):
+    return {'number': [vol, page], 'vol': vol, 'name': name, 'txt': txt, 'date': date, 'url': "/cases/federal/us/%d/%d/" % (vol, page), 'citations': []}
+
+CASES = [case(347, 483, "BROWN v. BOARD OF EDUCATION", u"Separate educational facilities are inherently unequal. The equal protection of the laws."),
+         case(163, 537, "PLESSY v. FERGUSON", u"Equal but separate accommodations; the protection is equal.", "May 18, 1896"),
+         case(198, 45, "LOCHNER v. NEW YORK", u"The general right to make a contract is part of the liberty protected.", "April 17, 1905"),
+         case(410, 113, "ROE v. WADE", u"The right of privacy, the protection of the laws, equal and protection equal. Caf\xe9", "January 22, 1973")]
+
+class TestTextIndex(unittest.TestCase):
+    """Tests for the positional full text index"""
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.assertEqual(textindex.buildIndex(CASES, self.dir), 4)
+        self.idx = textindex.TextIndex(self.dir)
+
+    def tearDown(self):
+        self.idx.close()
+        shutil.rmtree(self.dir)
+
+    def numbers(self, *args, **kwargs):
+        return [self.idx.doc(i)['number'] for i in self.idx.search(*args, **kwargs)]
+
+    def test_varints(self):
+        values = [0, 1, 127, 128, 300, 16383, 16384, 2 ** 35 + 7]
+        data = bytearray()
+        textindex.writeVarints(values, data)
+        self.assertEqual(len(data), 1 + 1 + 1 + 2 + 2 + 2 + 3 + 6)
+        self.assertEqual(list(textindex.readVarints(bytes(data))), values)
+        self.assertEqual(len(textindex.readVarints("")), 0)
+
+    def test_tokenize(self):
+        self.assertEqual(textindex.tokenize("Brown v. Board, 347 U. S. 483"), [u"brown", u"v", u"board", u"347", u"u", u"s", u"483"])
+        self.assertEqual(textindex.tokenize("Caf\xc3\xa9"), [u"caf\xe9"])
+        self.assertEqual(textindex.caseYear("May 17, 1954"), 1954)
+        self.assertEqual(textindex.caseYear(""), 0)
+
+    def test_terms(self):
+        self.assertEqual(self.numbers("equal"), [[347, 483], [163, 537], [410, 113]])
+        self.assertEqual(self.numbers("EQUAL right"), [[410, 113]])
+        self.assertEqual(self.numbers("caf\xc3\xa9"), [[410, 113]])
+        self.assertEqual(self.numbers("certiorari"), [])
+        self.assertRaises(ValueError, self.idx.search, " ; ")
+
+    def test_phrases(self):
+        self.assertEqual(self.numbers('"equal protection"'), [[347, 483]])
+        self.assertEqual(self.numbers('"protection equal"'), [[410, 113]])
+        self.assertEqual(self.numbers('"protection of the laws"'), [[347, 483], [410, 113]])
+        self.assertEqual(self.numbers('"separate educational" inherently'), [[347, 483]])
+        self.assertEqual(self.numbers('"equal laws"'), [])
+
+    def test_names(self):
+        self.assertEqual(self.numbers("name:brown"), [[347, 483]])
+        self.assertEqual(self.numbers('name:"new york" liberty'), [[198, 45]])
+        self.assertEqual(self.numbers('name:"york new"'), [])
+        self.assertEqual(self.numbers("name:equal"), [])
+
+    def test_filters(self):
+        self.assertEqual(self.numbers("equal", vStart=200), [[347, 483], [410, 113]])
+        self.assertEqual(self.numbers("equal", vStop=347), [[347, 483], [163, 537]])
+        self.assertEqual(self.numbers("protection", start=1900, end=1960), [[347, 483]])
+        self.assertEqual(self.numbers("the", start=1973), [[410, 113]])
+
+    def test_synthetic(self):
+        cases = list(synthetic.generateCases(60, 5, perVol=20, words=120))
+        path = os.path.join(self.dir, "synthetic")
+        textindex.buildIndex(cases, path)
+        idx = textindex.TextIndex(path)
+        try:
+            for query, words in (('"the statute does not"', "the statute does not"), ("certiorari", "certiorari"),
+                                 ('"board of education"', "board of education")):
+                expect = [i for i, c in enumerate(cases) if (" %s " % words) in " %s " % " ".join(textindex.tokenize(c['txt']))]
+                self.assertEqual(idx.search(query), expect)
+            names = [i for i, c in enumerate(cases) if "SMITH v." in c['name']]
+            self.assertEqual(idx.search('name:"smith v"'), names)
+        finally:
+            idx.close()
+
+    def test_runner(self):
+        cwd = os.getcwd()
+        runner = imp.load_source('scotus_runner', 'scotus-runner.py')
+        os.chdir(self.dir)
+        argv = sys.argv
+        try:
+            with corpus.CaseWriter("cases.jsonl") as out:
+                for c in CASES:
+                    out.write(c)
+            sys.argv = ['scotus-runner.py', '-p', '4', '-i', 'cases.jsonl', '-e', 'False', '--textIndex', 'ti']
+            runner.main()
+            idx = textindex.TextIndex('ti')
+            self.assertEqual(idx.search('"equal protection"'), [0])
+            idx.close()
+        finally:
+            sys.argv = argv
+            os.chdir(cwd)
+
+if __name__ == '__main__':
+    unittest.main()